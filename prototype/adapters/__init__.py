@@ -1,25 +1,87 @@
-"""Tool adapters for the unified ML performance modeling prototype."""
+"""Tool adapters for the unified ML performance modeling prototype.
+
+Adapters are registered lazily: an adapter module is imported only when that
+adapter is requested through get_adapter(). Static metadata (category,
+metrics, workload types) lives in the registry itself so listing tools never
+imports or instantiates an adapter.
+"""
+import importlib
+from typing import NamedTuple
+
 from prototype.adapters.base import ToolAdapter
-from prototype.adapters.timeloop_adapter import TimeloopAdapter
-from prototype.adapters.analytical_adapter import AnalyticalAdapter
-from prototype.adapters.astrasim_adapter import AstraSimAdapter
-from prototype.adapters.neusight_adapter import NeuSightAdapter
-from prototype.adapters.vidur_adapter import VidurAdapter
-
-_ADAPTERS = {
-    "timeloop": TimeloopAdapter,
-    "analytical": AnalyticalAdapter,
-    "astra-sim": AstraSimAdapter,
-    "neusight": NeuSightAdapter,
-    "vidur": VidurAdapter,
+
+
+class AdapterInfo(NamedTuple):
+    """Static description of a registered adapter."""
+
+    name: str
+    module: str
+    class_name: str
+    category: str
+    metrics: tuple
+    workloads: tuple
+
+
+_REGISTRY = {
+    "timeloop": AdapterInfo(
+        "timeloop", "prototype.adapters.timeloop_adapter", "TimeloopAdapter",
+        "analytical",
+        ("cycles", "energy_uj", "utilization", "latency_ms"),
+        ("cnn", "transformer"),
+    ),
+    "analytical": AdapterInfo(
+        "analytical", "prototype.adapters.analytical_adapter", "AnalyticalAdapter",
+        "analytical",
+        ("latency_ms", "throughput_samples_s", "arithmetic_intensity", "memory_gb",
+         "avg_ttft_s", "avg_tpot_s", "avg_e2e_time_s", "throughput_tokens_per_s",
+         "communication_time_ms", "scaling_efficiency", "peak_memory_gb"),
+        ("cnn", "transformer", "llm"),
+    ),
+    "astra-sim": AdapterInfo(
+        "astra-sim", "prototype.adapters.astrasim_adapter", "AstraSimAdapter",
+        "simulation",
+        ("total_cycles", "communication_cycles", "compute_cycles", "gpu_count"),
+        ("cnn", "transformer", "llm"),
+    ),
+    "neusight": AdapterInfo(
+        "neusight", "prototype.adapters.neusight_adapter", "NeuSightAdapter",
+        "ml-based",
+        ("latency_ms", "predicted_latency_ms", "ape_pct"),
+        ("cnn", "transformer"),
+    ),
+    "vidur": AdapterInfo(
+        "vidur", "prototype.adapters.vidur_adapter", "VidurAdapter",
+        "simulation",
+        ("avg_e2e_time_s", "p50_e2e_time_s", "p99_e2e_time_s",
+         "avg_ttft_s", "avg_tpot_s", "throughput_tokens_per_s"),
+        ("llm",),
+    ),
 }
 
 
 def get_adapter(name: str):
-    """Get an adapter class by name."""
-    return _ADAPTERS.get(name.lower())
+    """Get an adapter class by name, importing its module on first use."""
+    info = _REGISTRY.get(name.lower())
+    if info is None:
+        return None
+    return getattr(importlib.import_module(info.module), info.class_name)
+
+
+def adapter_info(name: str):
+    """Get an adapter's static metadata without importing it."""
+    return _REGISTRY.get(name.lower())
+
+
+def adapter_names() -> list:
+    """Names of all registered adapters, in registration order."""
+    return list(_REGISTRY)
+
+
+def list_adapter_info() -> dict:
+    """Return static metadata for all registered adapters."""
+    return dict(_REGISTRY)
 
 
 def list_adapters():
-    """Return all registered adapters."""
-    return dict(_ADAPTERS)
+    """Return all registered adapters (imports every adapter module)."""
+    return {name: get_adapter(name) for name in _REGISTRY}
@@ -2,34 +2,242 @@
 
 This adapter provides quick analytical estimates without external tools.
 It serves as a baseline for comparison against more sophisticated tools.
+
+The roofline itself is an array API: ``roofline(models, devices,
+batch_sizes)`` broadcasts its arguments (model names or indices into
+``MODEL_FLOPS``; device names, aliases or rows of the hardware catalog in
+prototype.hardware) and returns one NumPy array per output column;
+``roofline_grid()`` evaluates a full model x device x batch grid. Peaks and
+bytes per weight are taken at one precision (FP16 unless ``precision`` says
+otherwise; specs set it as ``hardware.precision``).
+``AnalyticalAdapter.run`` and ``run_many`` are thin wrappers over it.
+
+Transformer specs whose ``model`` section carries architecture fields
+(layers, hidden_size, num_heads, intermediate_size, vocab_size; see
+prototype.costmodel) are not limited to ``MODEL_FLOPS``: they are costed
+operator by operator and each operator is rooflined separately. LLM specs
+with architecture fields additionally get a prefill/decode split that
+charges the growing KV cache to every decode step, reported under VIDUR's
+metric names (avg_ttft_s, avg_tpot_s, avg_e2e_time_s,
+throughput_tokens_per_s) so the two tools compare directly. There is no
+request queueing, so avg_e2e_time_s is prefill plus decode only.
+
+Specs on more than one GPU (``hardware.count``) are decomposed into data,
+tensor and pipeline parallelism with ring all-reduce collective costs over
+``hardware.interconnect`` (see prototype.parallelism). ``latency_ms`` then
+becomes the step time and the result gains ``communication_time_ms``,
+``communication_fraction`` and ``scaling_efficiency``; the roofline
+breakdown stays that of a single GPU. LLM generation metrics are split the
+same way, prefill over the prompt and each decode step over one token.
+``AnalyticalAdapter.scaling`` sweeps any range of GPU counts in one call.
+
+``task: training`` specs are estimated as a full training step: forward,
+backward (twice the forward cost), optional activation recomputation
+(``extra.recompute``) and a mixed-precision Adam update. ``latency_ms`` is
+the step time, ``throughput_samples_s`` counts samples per second, and
+``peak_memory_gb`` is weights, gradients, optimizer state and kept
+activations per GPU.
 """
+import math
+import weakref
+from pathlib import Path
+
+import prototype.parallelism
+from prototype import costmodel, hardware
 from prototype.adapters.base import ToolAdapter
+from prototype.costmodel import (
+    ADAM_STATE_BYTES, activation_memory, architecture, generation, layer_roofline,
+    output_length, sequence_length, training_step,
+)
+from prototype.parallelism import memory_per_gpu, parallelism, step_time
 from prototype.workload import WorkloadSpec
 from prototype.result import ResultSet
 
 
-# Approximate peak FLOPS (FP16) and memory bandwidth for common GPUs
-GPU_SPECS = {
-    "A100": {"peak_tflops": 312, "mem_bw_gb_s": 2039, "mem_gb": 80},
-    "H100": {"peak_tflops": 989, "mem_bw_gb_s": 3350, "mem_gb": 80},
-    "V100": {"peak_tflops": 125, "mem_bw_gb_s": 900, "mem_gb": 32},
-    "T4":   {"peak_tflops": 65,  "mem_bw_gb_s": 300, "mem_gb": 16},
-    "L4":   {"peak_tflops": 121, "mem_bw_gb_s": 300, "mem_gb": 24},
-}
-
 # Approximate FLOP counts for common models (FP16, inference, batch=1)
 MODEL_FLOPS = {
-    "ResNet-50":  {"flops": 8.2e9,   "params": 25.6e6},
+    "ResNet-50":  {"flops": 8.2e9,   "params": 25.6e6, "activations": 23e6},
     "BERT-base":  {"flops": 22.5e9,  "params": 110e6},
     "BERT-large": {"flops": 72.4e9,  "params": 340e6},
     "GPT-2":      {"flops": 35.4e9,  "params": 1.5e9},
     "GPT-3":      {"flops": 350e12,  "params": 175e9},
 }
+# "activations": values kept per sample for the backward pass; models without
+# an entry use the transformer estimate (see _table_activation_bytes)
+
+# Kept fraction of a transformer layer's activations under full recomputation
+# (its 2-byte-per-element input out of 34 bytes; Korthikanti et al., 2022)
+_RECOMPUTE_KEPT = 2 / 34
+
+
+# HardwareCatalog -> {precision: tables}; a reloaded catalog gets fresh tables
+_TABLES = weakref.WeakKeyDictionary()
+
+
+def _tables(precision: str = hardware.DEFAULT_PRECISION):
+    """MODEL_FLOPS and the active hardware catalog as NumPy arrays, built on first use."""
+    catalog = hardware.catalog()
+    per_precision = _TABLES.setdefault(catalog, {})
+    tables = per_precision.get(precision)
+    if tables is None:
+        tables = per_precision[precision] = _build_tables(catalog, precision)
+    return tables
+
+
+def _build_tables(catalog, precision: str) -> dict:
+    import numpy as np
+
+    models = list(MODEL_FLOPS)
+    devices = catalog.arrays(precision)
+    return {
+        "model_names": models,
+        "device_names": devices["names"],
+        "flops": np.array([MODEL_FLOPS[m]["flops"] for m in models], dtype=float),
+        "params": np.array([MODEL_FLOPS[m]["params"] for m in models], dtype=float),
+        "bytes_per_value": hardware.bytes_per_value(precision),
+        "peak_tflops": devices["peak_tflops"],
+        "mem_bw_gb_s": devices["mem_bw_gb_s"],
+    }
+
+
+def _indices(np, values, names):
+    """Positions of ``values`` (names or integer indices) in ``names``; -1 if unknown."""
+    arr = np.asarray(values)
+    if arr.dtype.kind in "iu":
+        return np.where((arr >= 0) & (arr < len(names)), arr, -1)
+    uniq, inverse = np.unique(arr, return_inverse=True)
+    position = {name: i for i, name in enumerate(names)}
+    codes = np.array([position.get(u, -1) for u in uniq.tolist()], dtype=np.intp)
+    return codes[inverse].reshape(arr.shape)
+
+
+def _device_indices(np, devices, names):
+    """Catalog rows of ``devices`` (names, aliases or row indices); -1 if unknown."""
+    arr = np.asarray(devices)
+    if arr.dtype.kind in "iu":
+        return _indices(np, arr, names)
+    return hardware.catalog().indices(arr)
+
+
+def roofline(models, devices, batch_sizes, precision: str = hardware.DEFAULT_PRECISION) -> dict:
+    """Vectorized roofline over broadcast arrays of models, devices and batch sizes.
+
+    Returns a dict of arrays with the broadcast shape: ``valid`` (model and
+    device known, device accelerates ``precision``), ``latency_ms``,
+    ``throughput_samples_s``,
+    ``arithmetic_intensity``, ``memory_gb``, ``compute_time_ms``,
+    ``memory_time_ms`` and ``compute_bound``. Invalid points are NaN.
+    """
+    import numpy as np
+
+    t = _tables(precision)
+    m, d, batch = np.broadcast_arrays(_indices(np, models, t["model_names"]),
+                                      _device_indices(np, devices, t["device_names"]),
+                                      np.asarray(batch_sizes))
+    return _roofline(np, t, m, d, batch)
+
+
+def roofline_grid(models=None, devices=None, batch_sizes=(1,),
+                  precision: str = hardware.DEFAULT_PRECISION) -> dict:
+    """Roofline over the full grid; arrays are shaped (models, devices, batch sizes).
+
+    ``models`` and ``devices`` default to every entry of MODEL_FLOPS and the
+    hardware catalog. The returned dict also holds the ``models``,
+    ``devices`` and ``batch_sizes`` axes.
+    """
+    import numpy as np
+
+    t = _tables(precision)
+    models = t["model_names"] if models is None else list(models)
+    devices = t["device_names"] if devices is None else list(devices)
+    batch = np.asarray(batch_sizes)
+    out = roofline(np.asarray(models)[:, None, None], np.asarray(devices)[None, :, None],
+                   batch[None, None, :], precision)
+    out.update(models=models, devices=devices, batch_sizes=batch)
+    return out
+
+
+def _roofline(np, t, m, d, batch):
+    valid = (m >= 0) & (d >= 0)
+    mi, di = np.where(valid, m, 0), np.where(valid, d, 0)
+    valid &= np.isfinite(t["peak_tflops"][di])
+    param_bytes = t["params"][mi] * t["bytes_per_value"]
+
+    flops = t["flops"][mi] * batch
+    ai = flops / param_bytes  # Arithmetic intensity (FLOP/byte)
+
+    # Roofline: min(compute bound, memory bound)
+    compute_time_ms = (flops / (t["peak_tflops"][di] * 1e12)) * 1000
+    memory_time_ms = (param_bytes / (t["mem_bw_gb_s"][di] * 1e9)) * 1000
+    latency_ms = np.maximum(compute_time_ms, memory_time_ms)
+    with np.errstate(divide="ignore"):
+        throughput = np.where(latency_ms > 0, 1000.0 / latency_ms, 0.0)
+
+    columns = {
+        "latency_ms": latency_ms,
+        "throughput_samples_s": throughput,
+        "arithmetic_intensity": ai,
+        "memory_gb": param_bytes / 1e9,
+        "compute_time_ms": compute_time_ms,
+        "memory_time_ms": memory_time_ms,
+    }
+    if not valid.all():
+        columns = {k: np.where(valid, v, np.nan) for k, v in columns.items()}
+    columns["compute_bound"] = valid & (compute_time_ms > memory_time_ms)
+    columns["valid"] = valid
+    return columns
+
+
+def _batch_devices(batch):
+    """Catalog rows of a WorkloadBatch's devices, resolving each distinct name once."""
+    return hardware.catalog().indices(batch.categories["device"])[batch.codes["device"]]
+
+
+def _shape(spec) -> tuple:
+    """(parameters, layers, hidden size) of the spec's model.
+
+    Without architecture fields the hidden size is estimated from the
+    parameter count as params ~ 12 * layers * hidden^2.
+    """
+    arch = architecture(spec)
+    if arch is not None:
+        return arch.parameters, arch.layers, arch.hidden_size
+    params = MODEL_FLOPS[spec.model["name"]]["params"]
+    layers = int(spec.model.get("layers") or 1)
+    return params, layers, math.sqrt(params / (12 * layers))
+
+
+def _tokens(spec) -> int:
+    """Tokens per sample; CNNs count one."""
+    return 1 if spec.model_type == "cnn" else sequence_length(spec)
+
+
+def _table_activation_bytes(spec) -> float:
+    """FP16 activations kept for the backward pass of a MODEL_FLOPS model."""
+    model = MODEL_FLOPS[spec.model["name"]]
+    if "activations" in model:
+        return model["activations"] * 2 * spec.batch_size
+    _, layers, hidden = _shape(spec)
+    return 34 * layers * _tokens(spec) * hidden * spec.batch_size
+
+
+def _is_parallel(spec) -> bool:
+    """Whether the spec runs on more than one GPU or sets a parallel layout."""
+    extra = spec.extra
+    return ((spec.hardware.get("count") or 1) > 1
+            or "tensor_parallel" in extra or "pipeline_parallel" in extra)
+
+
+def _parallel_throughput(metrics: dict, data_parallel, step_ms):
+    """Samples/s of ``data_parallel`` replicas, each running the single-GPU batch per step."""
+    return data_parallel * metrics["throughput_samples_s"] * metrics["latency_ms"] / step_ms
 
 
 class AnalyticalAdapter(ToolAdapter):
     """Roofline-model based analytical performance estimator."""
 
+    batched = True
+
     @property
     def name(self) -> str:
         return "analytical"
@@ -40,48 +248,378 @@ class AnalyticalAdapter(ToolAdapter):
 
     @property
     def supported_metrics(self) -> list:
-        return ["latency_ms", "throughput_samples_s", "arithmetic_intensity", "memory_gb"]
+        return [
+            "latency_ms", "throughput_samples_s", "arithmetic_intensity", "memory_gb",
+            "avg_ttft_s", "avg_tpot_s", "avg_e2e_time_s", "throughput_tokens_per_s",
+            "communication_time_ms", "scaling_efficiency", "peak_memory_gb",
+        ]
 
     @property
     def supported_workloads(self) -> list:
         return ["cnn", "transformer", "llm"]
 
+    def source_paths(self) -> list:
+        # The cost and parallelism models do the math, so edits to them invalidate results
+        return hardware.source_paths() + [Path(costmodel.__file__),
+                                          Path(prototype.parallelism.__file__)]
+
     def supports(self, spec: WorkloadSpec) -> bool:
         model_name = spec.model.get("name", "")
         device = spec.hardware.get("device", "")
-        return model_name in MODEL_FLOPS and device in GPU_SPECS
+        known = model_name in MODEL_FLOPS or architecture(spec) is not None
+        return known and hardware.lookup(device) is not None
 
     def run(self, spec: WorkloadSpec) -> ResultSet:
+        return self._finish([spec], [self._run_one(spec)])[0]
+
+    def _run_one(self, spec: WorkloadSpec) -> ResultSet:
+        """Single-GPU estimate for one spec."""
+        error = self._check(spec)
+        if error is not None:
+            return error
+
+        arch = architecture(spec)
+        if arch is not None:
+            return self._run_layered(arch, [spec])[0]
+
+        from prototype.batch import _number
+
+        cols = roofline([spec.model.get("name", "")], [spec.hardware.get("device", "")],
+                        [_number(spec.batch_size, 1, "batch_size")],
+                        hardware.spec_precision(spec))
+        return self._result(spec, *(cols[k][0].item() for k in (
+            "latency_ms", "compute_time_ms", "memory_time_ms",
+            "arithmetic_intensity", "memory_gb")))
+
+    def run_many(self, specs: list) -> list:
+        """Evaluate the roofline for a whole batch of specs with NumPy broadcasting."""
+        archs = [architecture(spec) for spec in specs]
+        if not any(archs):
+            return self._finish(specs, self._run_table(specs))
+
+        results = [None] * len(specs)
+        table = [i for i, arch in enumerate(archs) if arch is None]
+        for i, result in zip(table, self._run_table([specs[i] for i in table])):
+            results[i] = result
+        groups = {}
+        for i, arch in enumerate(archs):
+            if arch is not None:
+                groups.setdefault(arch, []).append(i)
+        for arch, rows in groups.items():
+            for i, result in zip(rows, self._run_layered(arch, [specs[i] for i in rows])):
+                results[i] = result
+        return self._finish(specs, results)
+
+    def scaling(self, spec: WorkloadSpec, gpu_counts=range(1, 1025)) -> dict:
+        """Step time, communication fraction and scaling efficiency over GPU counts.
+
+        Uses the spec's TP/PP layout and interconnect for every count; counts
+        not divisible by TP * PP are NaN. Returns the ``step_time`` columns
+        plus ``gpus`` and ``throughput_samples_s``, or raises ValueError if
+        the spec cannot be modeled.
+        """
+        import numpy as np
+
+        result = self._add_training([spec], [self._run_one(spec)])[0]
+        if result.exit_code != 0:
+            raise ValueError(result.error)
+        gpus = np.asarray(gpu_counts, dtype=float)
+        cols = self._step_time(spec, parallelism(spec), result.metrics["latency_ms"], gpus)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cols["throughput_samples_s"] = _parallel_throughput(
+                result.metrics, cols["data_parallel"], cols["step_time_ms"])
+        cols["gpus"] = gpus
+        return cols
+
+    def _finish(self, specs: list, results: list) -> list:
+        """Apply the training step and multi-GPU models to single-GPU forward results."""
+        return self._add_parallelism(specs, self._add_training(specs, results))
+
+    def _step_time(self, spec, layout, compute_ms, gpus=None, tokens=None):
+        """parallelism.step_time with the spec's model size and activations.
+
+        ``tokens`` per sample defaults to the spec's sequence (one for CNNs).
+        """
+        params, layers, hidden = _shape(spec)
+        tokens = _tokens(spec) if tokens is None else tokens
+        return step_time(
+            compute_ms, layout,
+            param_bytes=params * 2,  # FP16
+            activation_bytes=spec.batch_size * tokens * hidden * 2,
+            layers=layers,
+            training=spec.task == "training",
+            gpus=gpus,
+        )
+
+    def _add_parallelism(self, specs: list, results: list) -> list:
+        """Replace single-GPU latency with the multi-GPU step time where it applies."""
+        out = list(results)
+        for i, (spec, result) in enumerate(zip(specs, results)):
+            if result.exit_code != 0 or not _is_parallel(spec):
+                continue
+            try:
+                layout = parallelism(spec)
+                layout.check()
+            except ValueError as e:
+                out[i] = ResultSet(tool=self.name, workload=spec.name, error=str(e),
+                                   exit_code=1)
+                continue
+            cols = {k: v.item() for k, v in
+                    self._step_time(spec, layout, result.metrics["latency_ms"]).items()}
+            step = cols["step_time_ms"]
+            metrics = result.metrics
+            throughput = _parallel_throughput(metrics, layout.data, step) if step > 0 else 0
+            if "peak_memory_gb" in metrics:
+                act = metrics["activation_memory_gb"]
+                metrics["peak_memory_gb"] = round(
+                    memory_per_gpu(layout, metrics["peak_memory_gb"] - act, act), 3)
+            metrics.update({
+                "latency_ms": round(step, 4),
+                "throughput_samples_s": round(throughput, 2),
+                "step_time_ms": round(step, 4),
+                "communication_time_ms": round(cols["communication_time_ms"], 4),
+                "communication_fraction": round(cols["communication_fraction"], 4),
+                "scaling_efficiency": round(cols["scaling_efficiency"], 4),
+                "gpu_count": layout.gpus,
+                "data_parallel": layout.data,
+                "tensor_parallel": layout.tensor,
+                "pipeline_parallel": layout.pipeline,
+            })
+            if "avg_ttft_s" in metrics:
+                self._parallel_generation(spec, layout, metrics)
+        return out
+
+    def _parallel_generation(self, spec, layout, metrics: dict):
+        """Put prefill and every decode step of an LLM result on the TP/PP layout.
+
+        Prefill is split like a forward step over the prompt, each decode
+        step like a forward step over one token per sample; DP replicas
+        multiply the token throughput.
+        """
+        prompt, output = sequence_length(spec), metrics["output_tokens"]
+        single_ttft = metrics["avg_ttft_s"] * 1000
+        # Mean decode step from the e2e total, which loses less to rounding than avg_tpot_s
+        single_tpot = (metrics["avg_e2e_time_s"] * 1000 - single_ttft) / output if output else 0.0
+        ttft = self._step_time(spec, layout, single_ttft)["step_time_ms"].item()
+        tpot = self._step_time(spec, layout, single_tpot, tokens=1)["step_time_ms"].item()
+        e2e = ttft + tpot * output
+        metrics.update({
+            "avg_ttft_s": round(ttft / 1000, 6),
+            "avg_tpot_s": round(tpot / 1000, 6),
+            "avg_e2e_time_s": round(e2e / 1000, 6),
+            "throughput_tokens_per_s": (
+                round(layout.data * spec.batch_size * (prompt + output) / (e2e / 1000), 2)
+                if e2e > 0 else 0),
+        })
+
+    def _add_training(self, specs: list, results: list) -> list:
+        """Turn forward-pass results of training specs into full training steps."""
+        rows = [i for i, (spec, r) in enumerate(zip(specs, results))
+                if r.exit_code == 0 and spec.task == "training"]
+        if not rows:
+            return results
+        forward, flops, params, kept, gpus, recompute = [], [], [], [], [], []
+        for i in rows:
+            spec = specs[i]
+            gpu = hardware.lookup(spec.hardware["device"])
+            redo = bool(spec.extra.get("recompute", False))
+            arch = architecture(spec)
+            if arch is not None:
+                seq = sequence_length(spec)
+                cols = layer_roofline(arch, spec.batch_size, seq, gpu.peak(),
+                                      gpu.mem_bw_gb_s)
+                forward.append(cols["latency_ms"].item())
+                flops.append(cols["flops"].item())
+                params.append(arch.parameters)
+                kept.append(activation_memory(arch, spec.batch_size, seq, redo).item())
+            else:
+                # Whole-network roofline, charging the kept activations as writes
+                model = MODEL_FLOPS[spec.model["name"]]
+                f = model["flops"] * spec.batch_size
+                act = _table_activation_bytes(spec)
+                traffic = model["params"] * 2 + act
+                forward.append(max(f / (gpu.peak() * 1e12),
+                                   traffic / (gpu.mem_bw_gb_s * 1e9)) * 1000)
+                flops.append(f)
+                params.append(model["params"])
+                kept.append(act * _RECOMPUTE_KEPT if redo else act)
+            gpus.append(gpu)
+            recompute.append(redo)
+
+        with self.span("training", specs=len(rows)):
+            cols = training_step(forward, flops, params,
+                                 [g.peak() for g in gpus],
+                                 [g.mem_bw_gb_s for g in gpus], recompute)
+        out = list(results)
+        columns = zip(rows, cols["step_ms"].tolist(), cols["forward_ms"].tolist(),
+                      cols["backward_ms"].tolist(), cols["recompute_ms"].tolist(),
+                      cols["optimizer_ms"].tolist(), params, kept, recompute)
+        for i, step, fwd, bwd, redo_ms, opt, p, act, redo in columns:
+            batch = specs[i].batch_size
+            out[i].metrics.update({
+                "latency_ms": round(step, 4),
+                "throughput_samples_s": round(batch * 1000.0 / step, 2) if step > 0 else 0,
+                "step_time_ms": round(step, 4),
+                "forward_time_ms": round(fwd, 4),
+                "backward_time_ms": round(bwd, 4),
+                "recompute_time_ms": round(redo_ms, 4),
+                "optimizer_time_ms": round(opt, 4),
+                "peak_memory_gb": round((p * ADAM_STATE_BYTES + act) / 1e9, 3),
+                "activation_memory_gb": round(act / 1e9, 3),
+                "recompute": redo,
+            })
+        return out
+
+    def _run_layered(self, arch, specs: list) -> list:
+        """Per-operator roofline for specs sharing one transformer architecture."""
+        results = [self._check(spec) for spec in specs]
+        rows = [i for i, r in enumerate(results) if r is None]
+        if not rows:
+            return results
+        gpus = [hardware.lookup(specs[i].hardware["device"]) for i in rows]
+        with self.span("layers", specs=len(rows), layers=arch.layers):
+            cols = layer_roofline(
+                arch,
+                [specs[i].batch_size for i in rows],
+                [sequence_length(specs[i]) for i in rows],
+                [g.peak() for g in gpus],
+                [g.mem_bw_gb_s for g in gpus],
+            )
+        memory_gb = arch.parameters * 2 / 1e9  # FP16
+        columns = zip(rows, cols["latency_ms"].tolist(), cols["compute_time_ms"].tolist(),
+                      cols["memory_time_ms"].tolist(), (cols["flops"] / cols["bytes"]).tolist())
+        for i, lat, comp, mem, ai in columns:
+            results[i] = self._result(specs[i], lat, comp, mem, ai, memory_gb)
+
+        llm = [(i, g) for i, g in zip(rows, gpus) if specs[i].model_type == "llm"]
+        if llm:
+            self._add_generation(arch, [specs[i] for i, _ in llm],
+                                 [results[i] for i, _ in llm], [g for _, g in llm])
+        return results
+
+    def _add_generation(self, arch, specs, results, gpus):
+        """Add prefill/decode serving metrics to LLM results."""
+        batch = [spec.batch_size for spec in specs]
+        prompt = [sequence_length(spec) for spec in specs]
+        output = [output_length(spec) for spec in specs]
+        with self.span("decode", specs=len(specs), tokens=max(output)):
+            gen = generation(arch, batch, prompt, output,
+                             [g.peak() for g in gpus],
+                             [g.mem_bw_gb_s for g in gpus])
+        columns = zip(results, batch, prompt, output, gen["ttft_ms"].tolist(),
+                      gen["tpot_ms"].tolist(), gen["e2e_ms"].tolist(),
+                      gen["kv_cache_bytes"].tolist())
+        for result, b, p, o, ttft, tpot, e2e, kv in columns:
+            result.metrics.update({
+                "avg_ttft_s": round(ttft / 1000, 6),
+                "avg_tpot_s": round(tpot / 1000, 6),
+                "avg_e2e_time_s": round(e2e / 1000, 6),
+                "throughput_tokens_per_s": round(b * (p + o) / (e2e / 1000), 2) if e2e > 0 else 0,
+                "output_tokens": o,
+                "kv_cache_gb": round(kv / 1e9, 3),
+            })
+
+    def _run_table(self, specs: list) -> list:
+        """Whole-network roofline from the MODEL_FLOPS table, one pass per precision."""
+        precisions = [hardware.spec_precision(spec) for spec in specs]
+        if len(set(precisions)) <= 1:
+            return self._run_table_at(specs, precisions[0] if specs else None)
+        results = [None] * len(specs)
+        groups = {}
+        for i, precision in enumerate(precisions):
+            groups.setdefault(precision, []).append(i)
+        for precision, rows in groups.items():
+            for i, result in zip(rows, self._run_table_at([specs[i] for i in rows], precision)):
+                results[i] = result
+        return results
+
+    def _run_table_at(self, specs: list, precision) -> list:
+        import numpy as np
+
+        from prototype.batch import WorkloadBatch
+
+        if precision not in hardware.PRECISIONS:
+            return [self._check(spec) for spec in specs]
+        try:
+            batch = WorkloadBatch.from_specs(specs, columns=("model_name", "device", "batch_size"))
+        except ValueError:
+            # A malformed field somewhere in the batch: report those specs, run the rest
+            results = [self._check(spec) for spec in specs]
+            rows = [i for i, r in enumerate(results) if r is None]
+            for i, result in zip(rows, self._run_table_at([specs[i] for i in rows], precision)):
+                results[i] = result
+            return results
+        t = _tables(precision)
+        with self.span("roofline", specs=len(specs)):
+            cols = _roofline(np, t, batch.index("model_name", t["model_names"]),
+                             _batch_devices(batch),
+                             batch.column("batch_size"))
+
+        columns = zip(
+            specs, cols["valid"].tolist(),
+            np.round(cols["latency_ms"], 4).tolist(),
+            np.round(cols["throughput_samples_s"], 2).tolist(),
+            np.round(cols["arithmetic_intensity"], 2).tolist(),
+            np.round(cols["memory_gb"], 3).tolist(),
+            np.round(cols["compute_time_ms"], 4).tolist(),
+            np.round(cols["memory_time_ms"], 4).tolist(),
+            cols["compute_bound"].tolist(),
+        )
+        name = self.name
+        results = []
+        for spec, valid, lat, tput, intensity, mem_gb, comp, mem, bound in columns:
+            if not valid:
+                results.append(self._check(spec))
+                continue
+            results.append(ResultSet(
+                tool=name,
+                workload=spec.name,
+                metrics={
+                    "latency_ms": lat,
+                    "throughput_samples_s": tput,
+                    "arithmetic_intensity": intensity,
+                    "memory_gb": mem_gb,
+                    "compute_time_ms": comp,
+                    "memory_time_ms": mem,
+                    "bottleneck": "compute" if bound else "memory",
+                },
+            ))
+        return results
+
+    def _check(self, spec):
+        """Return an error ResultSet if the spec cannot be modeled, else None."""
         model_name = spec.model.get("name", "")
         device = spec.hardware.get("device", "")
 
-        if model_name not in MODEL_FLOPS:
+        if model_name not in MODEL_FLOPS and architecture(spec) is None:
             return ResultSet(
                 tool=self.name, workload=spec.name,
                 error=f"Unknown model: {model_name}",
                 exit_code=1,
             )
-        if device not in GPU_SPECS:
+        gpu = hardware.lookup(device)
+        if gpu is None:
             return ResultSet(
                 tool=self.name, workload=spec.name,
                 error=f"Unknown device: {device}",
                 exit_code=1,
             )
+        precision = hardware.spec_precision(spec)
+        if precision not in hardware.PRECISIONS or gpu.peak(precision) is None:
+            return ResultSet(
+                tool=self.name, workload=spec.name,
+                error=f"Unsupported precision on {gpu.name}: {precision}",
+                exit_code=1,
+            )
+        from prototype.batch import _number
 
-        model = MODEL_FLOPS[model_name]
-        gpu = GPU_SPECS[device]
-
-        flops = model["flops"] * spec.batch_size
-        param_bytes = model["params"] * 2  # FP16
-
-        # Arithmetic intensity (FLOP/byte)
-        ai = flops / param_bytes
-
-        # Roofline: min(compute bound, memory bound)
-        compute_time_ms = (flops / (gpu["peak_tflops"] * 1e12)) * 1000
-        memory_time_ms = (param_bytes / (gpu["mem_bw_gb_s"] * 1e9)) * 1000
-        latency_ms = max(compute_time_ms, memory_time_ms)
+        try:
+            _number(spec.batch_size, 1, "batch_size")
+        except ValueError as e:
+            return ResultSet(tool=self.name, workload=spec.name, error=str(e), exit_code=1)
+        return None
 
+    def _result(self, spec, latency_ms, compute_time_ms, memory_time_ms, ai, memory_gb):
         throughput = 1000.0 / latency_ms if latency_ms > 0 else 0
 
         return ResultSet(
@@ -91,7 +629,7 @@ class AnalyticalAdapter(ToolAdapter):
                 "latency_ms": round(latency_ms, 4),
                 "throughput_samples_s": round(throughput, 2),
                 "arithmetic_intensity": round(ai, 2),
-                "memory_gb": round(param_bytes / 1e9, 3),
+                "memory_gb": round(memory_gb, 3),
                 "compute_time_ms": round(compute_time_ms, 4),
                 "memory_time_ms": round(memory_time_ms, 4),
                 "bottleneck": "compute" if compute_time_ms > memory_time_ms else "memory",
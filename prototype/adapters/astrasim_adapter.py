@@ -7,10 +7,9 @@ Since ASTRA-sim requires Docker to build and run, this adapter reads
 pre-computed results from CI runs stored in data/evaluation/astra-sim-results/.
 For live runs, it delegates to the Docker-based scripts.
 """
-import json
-import subprocess
 from pathlib import Path
 
+from prototype import sources
 from prototype.adapters.base import ToolAdapter
 from prototype.workload import WorkloadSpec
 from prototype.result import ResultSet
@@ -38,6 +37,9 @@ class AstraSimAdapter(ToolAdapter):
     def supported_workloads(self) -> list:
         return ["cnn", "transformer", "llm"]
 
+    def source_paths(self) -> list:
+        return [RESULTS_DIR / "astra_sim_results.json"]
+
     def supports(self, spec: WorkloadSpec) -> bool:
         return (
             spec.task == "training"
@@ -51,26 +53,30 @@ class AstraSimAdapter(ToolAdapter):
         Tries pre-computed CI results first. Falls back to Docker execution
         if available.
         """
-        gpu_count = spec.hardware.get("count", 8)
-        model_name = spec.model.get("name", "").lower().replace("-", "")
+        return self.run_many([spec])[0]
 
-        # Try pre-computed results
-        result = self._read_precomputed(spec, model_name, gpu_count)
-        if result is not None:
-            return result
+    def run_many(self, specs: list) -> list:
+        """Load the pre-computed results once and resolve every spec against them."""
+        results_file = RESULTS_DIR / "astra_sim_results.json"
+        data = sources.load_json(results_file) if results_file.exists() else None
 
-        # Try Docker execution
-        return self._run_docker(spec, gpu_count)
+        results = []
+        for spec in specs:
+            gpu_count = spec.hardware.get("count", 8)
+            model_name = spec.model.get("name", "").lower().replace("-", "")
 
-    def _read_precomputed(self, spec, model_name, gpu_count):
-        """Read pre-computed results from CI artifacts."""
-        results_file = RESULTS_DIR / "astra_sim_results.json"
-        if not results_file.exists():
-            return None
+            # Try pre-computed results
+            result = None
+            if data is not None:
+                with self.span("match", workload=spec.name):
+                    result = self._read_precomputed(spec, model_name, gpu_count, data)
 
-        with open(results_file) as f:
-            data = json.load(f)
+            # Try Docker execution
+            results.append(result if result is not None else self._run_docker(spec, gpu_count))
+        return results
 
+    def _read_precomputed(self, spec, model_name, gpu_count, data):
+        """Match one spec against pre-computed results from CI artifacts."""
         # Find matching log file
         target_pattern = f"{model_name}_{gpu_count}"
         target_pattern_alt = f"{model_name}_hgx_h100_{gpu_count}gpu_{gpu_count}npus"
@@ -1,5 +1,7 @@
 """Base class for tool adapters."""
 from abc import ABC, abstractmethod
+
+from prototype import profiling
 from prototype.workload import WorkloadSpec
 from prototype.result import ResultSet
 
@@ -12,6 +14,14 @@ class ToolAdapter(ABC):
     tool's native input/output formats.
     """
 
+    # True when run_many() evaluates a whole batch natively (e.g. vectorized)
+    # instead of looping over run().
+    batched = False
+
+    # False when the output is the same whatever the spec says (e.g. a fixed
+    # benchmark layer); such tools are left out of cross-tool agreement.
+    workload_dependent = True
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -36,6 +46,19 @@ class ToolAdapter(ABC):
         """List of workload types this tool supports (cnn, transformer, llm, etc.)."""
         ...
 
+    @property
+    def version(self) -> str:
+        """Adapter version. Bump when the adapter's output format or logic changes."""
+        return "1"
+
+    def source_paths(self) -> list:
+        """Files or directories the adapter reads results or scripts from.
+
+        Used to fingerprint cached results: a change to any of these paths
+        invalidates every cached result for this adapter.
+        """
+        return []
+
     @abstractmethod
     def supports(self, spec: WorkloadSpec) -> bool:
         """Check if this tool can handle the given workload."""
@@ -45,3 +68,21 @@ class ToolAdapter(ABC):
     def run(self, spec: WorkloadSpec) -> ResultSet:
         """Run the tool on the given workload and return standardized results."""
         ...
+
+    def span(self, phase: str, **args):
+        """Profiling span named ``<tool>.<phase>`` (no-op unless profiling is enabled)."""
+        return profiling.span(f"{self.name}.{phase}", **args)
+
+    def run_many(self, specs: list) -> list:
+        """Run the tool on many workloads, returning one ResultSet per spec in order."""
+        return [self.run(spec) for spec in specs]
+
+    async def run_async(self, spec: WorkloadSpec) -> ResultSet:
+        """Run the tool without blocking the event loop.
+
+        The default offloads run() to a worker thread. Adapters that wait on
+        subprocesses or sockets can override this with a native coroutine.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.run, spec)
@@ -3,28 +3,20 @@
 NeuSight uses graph neural networks to predict DNN execution latency
 across different GPU architectures. Since it requires CUDA at import time,
 this adapter reads pre-computed prediction results from CI artifacts.
+
+Device names are resolved through the hardware catalog (prototype.hardware),
+whose ``neusight`` and ``neusight_short`` names give NeuSight's device
+directory and summary names.
 """
-import json
 from pathlib import Path
 
+from prototype import hardware, sources
 from prototype.adapters.base import ToolAdapter
 from prototype.workload import WorkloadSpec
 from prototype.result import ResultSet
 
 RESULTS_DIR = Path(__file__).parent.parent.parent / "data" / "evaluation" / "neusight-results"
 
-# Map WorkloadSpec device names to NeuSight device directory names
-DEVICE_MAP = {
-    "A100": "NVIDIA_A100-PCIE-40GB",
-    "A100-SXM": "NVIDIA_A100-SXM4-40GB",
-    "A100-80G": "NVIDIA_A100_80GB_PCIe",
-    "H100": "NVIDIA_H100_80GB_HBM3",
-    "V100": "Tesla_V100-PCIE-32GB",
-    "T4": "Tesla_T4",
-    "L4": "NVIDIA_L4",
-    "P100": "Tesla_P100-PCIE-16GB",
-}
-
 # Map WorkloadSpec model names to NeuSight config prefixes
 MODEL_MAP = {
     "ResNet-50": "resnet50",
@@ -55,28 +47,45 @@ class NeuSightAdapter(ToolAdapter):
     def supported_workloads(self) -> list:
         return ["cnn", "transformer"]
 
+    def source_paths(self) -> list:
+        return [RESULTS_DIR / "neusight_results.json", *hardware.source_paths()]
+
     def supports(self, spec: WorkloadSpec) -> bool:
         device = spec.hardware.get("device", "")
         model_name = spec.model.get("name", "")
-        return device in DEVICE_MAP and model_name in MODEL_MAP
+        return (hardware.catalog().tool_name(device, "neusight") is not None
+                and model_name in MODEL_MAP)
 
     def run(self, spec: WorkloadSpec) -> ResultSet:
         """Read NeuSight predictions from pre-computed CI results."""
-        device = spec.hardware.get("device", "")
-        model_name = spec.model.get("name", "")
-        mode = "train" if spec.task == "training" else "inf"
+        return self.run_many([spec])[0]
 
+    def run_many(self, specs: list) -> list:
+        """Load the results file once and resolve every spec against it."""
         results_file = RESULTS_DIR / "neusight_results.json"
         if not results_file.exists():
-            return ResultSet(
-                tool=self.name,
-                workload=spec.name,
-                error="NeuSight results not found. Run NeuSight CI workflow first.",
-                exit_code=1,
-            )
-
-        with open(results_file) as f:
-            data = json.load(f)
+            return [
+                ResultSet(
+                    tool=self.name,
+                    workload=spec.name,
+                    error="NeuSight results not found. Run NeuSight CI workflow first.",
+                    exit_code=1,
+                )
+                for spec in specs
+            ]
+
+        data = sources.load_json(results_file)
+        results = []
+        for spec in specs:
+            with self.span("match", workload=spec.name):
+                results.append(self._resolve(spec, data))
+        return results
+
+    def _resolve(self, spec, data):
+        """Find the best matching prediction for one spec."""
+        device = spec.hardware.get("device", "")
+        model_name = spec.model.get("name", "")
+        mode = "train" if spec.task == "training" else "inf"
 
         device_short = self._get_device_short(device)
         model_prefix = MODEL_MAP.get(model_name, "")
@@ -115,16 +124,7 @@ class NeuSightAdapter(ToolAdapter):
 
     def _get_device_short(self, device):
         """Convert device name to NeuSight short name."""
-        mapping = {
-            "A100": "A100_40G_PCIe",
-            "A100-SXM": "A100_SXM4",
-            "A100-80G": "A100_80G_PCIe",
-            "H100": "H100",
-            "V100": "V100",
-            "T4": "T4",
-            "L4": "L4",
-        }
-        return mapping.get(device, device)
+        return hardware.catalog().tool_name(device, "neusight_short") or device
 
     def _device_summary(self, data, device, device_short, mode, spec):
         """Return aggregate device-level accuracy."""
@@ -1,4 +1,5 @@
 """Timeloop adapter: wraps Timeloop for DNN accelerator performance modeling."""
+import asyncio
 import json
 import subprocess
 import tempfile
@@ -8,10 +9,24 @@ from prototype.adapters.base import ToolAdapter
 from prototype.workload import WorkloadSpec
 from prototype.result import ResultSet
 
+SCRIPT_PATH = (
+    Path(__file__).parent.parent.parent
+    / "scripts"
+    / "benchmarks"
+    / "timeloop"
+    / "run_resnet50_conv.py"
+)
+
+# Seconds to wait for the Timeloop script before giving up
+TIMEOUT_S = 60
+
 
 class TimeloopAdapter(ToolAdapter):
     """Adapter for Timeloop analytical DNN accelerator modeling tool."""
 
+    # The script always evaluates ResNet-50 conv1
+    workload_dependent = False
+
     @property
     def name(self) -> str:
         return "timeloop"
@@ -28,6 +43,9 @@ class TimeloopAdapter(ToolAdapter):
     def supported_workloads(self) -> list:
         return ["cnn", "transformer"]
 
+    def source_paths(self) -> list:
+        return [SCRIPT_PATH]
+
     def supports(self, spec: WorkloadSpec) -> bool:
         return spec.model_type in self.supported_workloads
 
@@ -37,52 +55,102 @@ class TimeloopAdapter(ToolAdapter):
         Currently delegates to the existing run_resnet50_conv.py script.
         Future: generate Timeloop configs dynamically from WorkloadSpec.
         """
-        script_path = (
-            Path(__file__).parent.parent.parent
-            / "scripts"
-            / "benchmarks"
-            / "timeloop"
-            / "run_resnet50_conv.py"
-        )
+        if not SCRIPT_PATH.exists():
+            return self._missing_script(spec)
 
-        if not script_path.exists():
-            return ResultSet(
-                tool=self.name,
-                workload=spec.name,
-                error=f"Timeloop script not found at {script_path}",
-                exit_code=1,
-            )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.span("subprocess", workload=spec.name):
+                result = subprocess.run(
+                    self._command(tmpdir),
+                    capture_output=True,
+                    text=True,
+                    timeout=TIMEOUT_S,
+                )
+            return self._collect(spec, tmpdir, result.returncode, result.stdout, result.stderr)
+
+    async def run_async(self, spec: WorkloadSpec) -> ResultSet:
+        """Run Timeloop as an asyncio subprocess so other tools proceed meanwhile."""
+        if not SCRIPT_PATH.exists():
+            return self._missing_script(spec)
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            result = subprocess.run(
-                ["python3", str(script_path), "--analytical-only", "--output-dir", tmpdir],
-                capture_output=True,
-                text=True,
-                timeout=60,
+            proc = await asyncio.create_subprocess_exec(
+                *self._command(tmpdir),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                with self.span("subprocess", workload=spec.name):
+                    stdout, stderr = await asyncio.wait_for(proc.communicate(), TIMEOUT_S)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                proc.kill()
+                await proc.wait()
+                raise
+            return self._collect(
+                spec, tmpdir, proc.returncode, stdout.decode(), stderr.decode()
             )
 
-            results_file = Path(tmpdir) / "resnet50_conv1_results.json"
-            if results_file.exists():
-                with open(results_file) as f:
-                    data = json.load(f)
-                analytical = data.get("analytical_estimates", {})
-                return ResultSet(
-                    tool=self.name,
-                    workload=spec.name,
-                    metrics={
-                        "cycles": analytical.get("estimated_cycles", 0),
-                        "energy_uj": analytical.get("total_energy_uj", 0),
-                        "utilization": analytical.get("estimated_utilization", 0),
-                        "latency_ms": analytical.get("estimated_latency_ms", 0),
-                    },
-                    raw_output=result.stdout,
-                    exit_code=result.returncode,
-                )
+    def run_many(self, specs: list) -> list:
+        """Run one Timeloop subprocess per spec, at most one per CPU at a time.
+
+        Called from inside a running event loop (e.g. the server), where
+        ``asyncio.run`` is not allowed, the specs run one after another.
+        """
+        from prototype.executor import resolve_jobs
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            return [self.run(spec) for spec in specs]
+
+        async def gather():
+            limit = asyncio.Semaphore(resolve_jobs(0))
+
+            async def run_one(spec):
+                async with limit:
+                    return await self.run_async(spec)
+
+            return await asyncio.gather(*(run_one(spec) for spec in specs))
 
+        return list(asyncio.run(gather()))
+
+    def _command(self, output_dir):
+        return ["python3", str(SCRIPT_PATH), "--analytical-only", "--output-dir", output_dir]
+
+    def _missing_script(self, spec):
+        return ResultSet(
+            tool=self.name,
+            workload=spec.name,
+            error=f"Timeloop script not found at {SCRIPT_PATH}",
+            exit_code=1,
+        )
+
+    def _collect(self, spec, output_dir, returncode, stdout, stderr):
+        """Build a ResultSet from the script's output directory."""
+        results_file = Path(output_dir) / "resnet50_conv1_results.json"
+        if results_file.exists():
+            with self.span("parse"), open(results_file) as f:
+                data = json.load(f)
+            analytical = data.get("analytical_estimates", {})
             return ResultSet(
                 tool=self.name,
                 workload=spec.name,
-                error="No results produced",
-                raw_output=result.stderr,
-                exit_code=result.returncode,
+                metrics={
+                    "cycles": analytical.get("estimated_cycles", 0),
+                    "energy_uj": analytical.get("total_energy_uj", 0),
+                    "utilization": analytical.get("estimated_utilization", 0),
+                    "latency_ms": analytical.get("estimated_latency_ms", 0),
+                },
+                raw_output=stdout,
+                exit_code=returncode,
             )
+
+        return ResultSet(
+            tool=self.name,
+            workload=spec.name,
+            error="No results produced",
+            raw_output=stderr,
+            exit_code=returncode,
+        )
@@ -6,11 +6,12 @@ Orca) and predicts request-level latency, throughput, and scheduling metrics.
 This adapter reads pre-computed results from the VIDUR benchmark data stored
 in scripts/benchmarks/vidur/data/results/vidur/. Each subdirectory contains
 a config.json and request_metrics.csv from a single scheduler run.
+Workload device names are translated to VIDUR's (``a100``) through the
+hardware catalog's ``vidur`` names.
 """
-import csv
-import json
 from pathlib import Path
 
+from prototype import hardware, sources
 from prototype.adapters.base import ToolAdapter
 from prototype.workload import WorkloadSpec
 from prototype.result import ResultSet
@@ -44,6 +45,9 @@ class VidurAdapter(ToolAdapter):
     def supported_workloads(self) -> list:
         return ["llm"]
 
+    def source_paths(self) -> list:
+        return [RESULTS_DIR, *hardware.source_paths()]
+
     def supports(self, spec: WorkloadSpec) -> bool:
         return (
             spec.model_type == "llm"
@@ -52,20 +56,33 @@ class VidurAdapter(ToolAdapter):
 
     def run(self, spec: WorkloadSpec) -> ResultSet:
         """Read pre-computed VIDUR results matching the workload spec."""
-        model_name = spec.model.get("name", "").lower()
-        device = spec.hardware.get("device", "").lower()
-        scheduler = spec.extra.get("scheduler", None)
+        return self.run_many([spec])[0]
 
+    def run_many(self, specs: list) -> list:
+        """Scan the run directories once and resolve every spec against them."""
         if not RESULTS_DIR.exists():
-            return ResultSet(
-                tool=self.name,
-                workload=spec.name,
-                error="VIDUR results directory not found.",
-                exit_code=1,
-            )
-
-        # Scan all result directories for matching configs
-        matches = []
+            return [
+                ResultSet(
+                    tool=self.name,
+                    workload=spec.name,
+                    error="VIDUR results directory not found.",
+                    exit_code=1,
+                )
+                for spec in specs
+            ]
+
+        with self.span("scan"):
+            runs = self._load_runs()
+        summaries = {}  # csv_path -> parsed metrics, shared across specs
+        results = []
+        for spec in specs:
+            with self.span("match", workload=spec.name):
+                results.append(self._resolve(spec, runs, summaries))
+        return results
+
+    def _load_runs(self):
+        """Return (model, device, scheduler, csv_path) for every complete run directory."""
+        runs = []
         for run_dir in sorted(RESULTS_DIR.iterdir()):
             if not run_dir.is_dir():
                 continue
@@ -74,8 +91,7 @@ class VidurAdapter(ToolAdapter):
             if not config_path.exists() or not csv_path.exists():
                 continue
 
-            with open(config_path) as f:
-                config = json.load(f)
+            config = sources.load_json(config_path)
 
             cfg_model = config.get("cluster_config", {}).get(
                 "replica_config", {}
@@ -86,7 +102,18 @@ class VidurAdapter(ToolAdapter):
             cfg_scheduler = config.get("cluster_config", {}).get(
                 "replica_scheduler_config", {}
             ).get("name", "")
+            runs.append((cfg_model, cfg_device, cfg_scheduler, csv_path))
+        return runs
 
+    def _resolve(self, spec, runs, summaries):
+        """Pick the VIDUR run(s) matching one spec."""
+        model_name = spec.model.get("name", "").lower()
+        device = spec.hardware.get("device", "")
+        device = (hardware.catalog().tool_name(device, "vidur") or device).lower()
+        scheduler = spec.extra.get("scheduler", None)
+
+        matches = []
+        for cfg_model, cfg_device, cfg_scheduler, csv_path in runs:
             # Match model (fuzzy: check if workload model name appears in config model)
             if not self._model_matches(model_name, cfg_model):
                 continue
@@ -97,9 +124,12 @@ class VidurAdapter(ToolAdapter):
             if scheduler and scheduler.lower() != cfg_scheduler.lower():
                 continue
 
-            metrics = self._parse_csv(csv_path, cfg_scheduler)
+            if csv_path not in summaries:
+                with self.span("metrics", path=csv_path):
+                    summaries[csv_path] = self._parse_csv(csv_path, cfg_scheduler)
+            metrics = summaries[csv_path]
             if metrics is not None:
-                matches.append((cfg_scheduler, metrics))
+                matches.append((cfg_scheduler, dict(metrics)))
 
         if not matches:
             return ResultSet(
@@ -147,9 +177,7 @@ class VidurAdapter(ToolAdapter):
 
     def _parse_csv(self, csv_path, scheduler_name):
         """Parse VIDUR request_metrics.csv into summary metrics."""
-        with open(csv_path) as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        rows = sources.load_csv(csv_path)
 
         if not rows:
             return None
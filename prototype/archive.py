@@ -0,0 +1,236 @@
+"""Memory-mapped binary result archives (``.mlpa``).
+
+JSON validation reports have to be parsed completely to read a single row.
+An archive stores the same rows as a ``ResultStore``, laid out so a reader
+can ``mmap`` the file and touch only what it needs:
+
+    header   64 bytes: magic, version, row count, index offset and length
+    blocks   64-byte aligned column blocks
+    index    JSON describing every block (name, dtype, offset, length)
+
+Numeric metric columns are raw little-endian arrays with a uint8 validity
+block beside them; ``metric()`` returns NumPy views straight into the mapping
+without copying. String columns (keys, errors, JSON-encoded object metrics)
+are an int64 offset block plus a UTF-8 data block, decoded per row on
+demand. Two sorted 64-bit hash blocks, over (fingerprint, tool) and
+(workload, tool), let ``find()`` binary-search for one row.
+"""
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from prototype.result import ResultSet
+from prototype.store import KEY_COLUMNS, ResultStore
+
+MAGIC = b"MLPMARC\x00"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQ")  # magic, version, reserved, rows, index offset, index length
+_HEADER_SIZE = 64
+_ALIGN = 64
+
+
+def _key_hash(a: str, b: str) -> int:
+    digest = hashlib.blake2b(f"{a}\0{b}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class _Writer:
+    def __init__(self, f):
+        self.f = f
+        self.blocks = {}
+        f.write(b"\0" * _HEADER_SIZE)
+
+    def block(self, name: str, array: np.ndarray):
+        pad = -self.f.tell() % _ALIGN
+        self.f.write(b"\0" * pad)
+        array = np.ascontiguousarray(array)
+        if array.dtype.byteorder == ">":
+            array = array.astype(array.dtype.newbyteorder("<"))
+        self.blocks[name] = {"offset": self.f.tell(), "dtype": array.dtype.str,
+                             "count": int(array.size)}
+        self.f.write(array.tobytes())
+
+    def strings(self, name: str, values):
+        """Offset + UTF-8 data blocks for a sequence of str (None -> empty)."""
+        encoded = [b"" if v is None else v.encode() for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        self.block(f"{name}.offsets", offsets)
+        self.block(f"{name}.data", np.frombuffer(b"".join(encoded), dtype=np.uint8))
+
+
+def write_archive(path, store: ResultStore):
+    """Write ``store`` as a memory-mappable archive at ``path``."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    n = len(store)
+    columns = {"keys": list(KEY_COLUMNS), "metrics": {}}
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        w = _Writer(f)
+        keys = {k: store.column(k).tolist() for k in KEY_COLUMNS}
+        for k in KEY_COLUMNS:
+            w.strings(f"key.{k}", keys[k])
+        w.block("exit_code", store.column("exit_code").astype("<i8"))
+        errors = store.column("error").tolist()
+        w.strings("error", errors)
+        w.block("error.valid", np.array([e is not None for e in errors], dtype=np.uint8))
+
+        for i, name in enumerate(store.metric_names()):
+            values, valid = store.metric(name)
+            block = f"metric.{i}"
+            if values.dtype.kind in "if":
+                w.block(block, values.astype(f"<{values.dtype.kind}8"))
+                kind = "numeric"
+            else:
+                w.strings(block, [json.dumps(v) if ok else None
+                                  for v, ok in zip(values.tolist(), valid)])
+                kind = "json"
+            w.block(f"{block}.valid", valid.astype(np.uint8))
+            columns["metrics"][name] = {"block": block, "kind": kind}
+
+        # Sorted hash indexes for point lookups
+        for index, first in (("fingerprint", keys["fingerprint"]), ("workload", keys["workload"])):
+            hashes = np.array([_key_hash(a, b) for a, b in zip(first, keys["tool"])],
+                              dtype="<u8")
+            order = np.argsort(hashes, kind="stable")
+            w.block(f"index.{index}.hash", hashes[order])
+            w.block(f"index.{index}.row", order.astype("<i8"))
+
+        pad = -f.tell() % _ALIGN
+        f.write(b"\0" * pad)
+        index_offset = f.tell()
+        index = json.dumps({"rows": n, "columns": columns, "blocks": w.blocks}).encode()
+        f.write(index)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, n, index_offset, len(index)))
+    tmp.replace(path)
+
+
+class ResultArchive:
+    """Read-only, memory-mapped view of an archive written by ``write_archive``."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{self.path} is empty, not a result archive") from None
+        magic, version, _, rows, index_offset, index_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a result archive")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported archive version {version} in {self.path}")
+        meta = json.loads(self._mm[index_offset:index_offset + index_len])
+        self.rows = rows
+        self._blocks = meta["blocks"]
+        self._metrics = meta["columns"]["metrics"]
+
+    def close(self):
+        """Close the file; the mapping stays alive while metric() views exist."""
+        try:
+            self._mm.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self.rows
+
+    def _array(self, name: str) -> np.ndarray:
+        """Zero-copy NumPy view of one block."""
+        b = self._blocks[name]
+        return np.frombuffer(self._mm, dtype=np.dtype(b["dtype"]), count=b["count"],
+                             offset=b["offset"])
+
+    def _string(self, name: str, row: int) -> str:
+        start, end = self._array(f"{name}.offsets")[row:row + 2].tolist()
+        data = self._blocks[f"{name}.data"]["offset"]
+        return self._mm[data + start:data + end].decode()
+
+    # -- columns -------------------------------------------------------
+
+    def metric_names(self) -> list:
+        return list(self._metrics)
+
+    def metric(self, name: str) -> tuple:
+        """(values, valid) of a metric; zero-copy views for numeric metrics."""
+        col = self._metrics[name]
+        valid = self._array(f"{col['block']}.valid").view(bool)
+        if col["kind"] == "numeric":
+            return self._array(col["block"]), valid
+        values = np.empty(self.rows, dtype=object)
+        for row in np.flatnonzero(valid).tolist():
+            values[row] = json.loads(self._string(col["block"], row))
+        return values, valid
+
+    def exit_codes(self) -> np.ndarray:
+        return self._array("exit_code")
+
+    def key(self, column: str, row: int) -> str:
+        """One key column value (``fingerprint``, ``workload`` or ``tool``)."""
+        return self._string(f"key.{column}", row)
+
+    def keys(self, column: str) -> list:
+        """Every value of a key column, decoded."""
+        return [self._string(f"key.{column}", i) for i in range(self.rows)]
+
+    # -- rows ----------------------------------------------------------
+
+    def find(self, tool: str, fingerprint=None, workload=None):
+        """Row of ``tool`` on a workload fingerprint (or name), or None."""
+        column, value = (("fingerprint", fingerprint) if fingerprint is not None
+                         else ("workload", workload))
+        if value is None:
+            raise ValueError("find() needs a fingerprint or a workload name")
+        hashes = self._array(f"index.{column}.hash")
+        rows = self._array(f"index.{column}.row")
+        h = np.uint64(_key_hash(value, tool))
+        i = int(np.searchsorted(hashes, h))
+        while i < len(hashes) and hashes[i] == h:
+            row = int(rows[i])
+            if self.key(column, row) == value and self.key("tool", row) == tool:
+                return row
+            i += 1
+        return None
+
+    def row(self, row: int) -> ResultSet:
+        """Decode one row as a ResultSet."""
+        metrics = {}
+        for name, col in self._metrics.items():
+            if not self._array(f"{col['block']}.valid")[row]:
+                continue
+            if col["kind"] == "numeric":
+                metrics[name] = self._array(col["block"])[row].item()
+            else:
+                metrics[name] = json.loads(self._string(col["block"], row))
+        error = self._string("error", row) if self._array("error.valid")[row] else None
+        return ResultSet(
+            tool=self.key("tool", row),
+            workload=self.key("workload", row),
+            metrics=metrics,
+            exit_code=int(self.exit_codes()[row]),
+            error=error,
+        )
+
+    def __iter__(self):
+        for row in range(self.rows):
+            yield self.row(row)
+
+    def to_store(self) -> ResultStore:
+        """Load the whole archive into a ResultStore."""
+        return ResultStore.from_results(self, self.keys("fingerprint"))
@@ -0,0 +1,149 @@
+"""Struct-of-arrays view over many WorkloadSpecs.
+
+Vectorized adapters want one NumPy array per field instead of a list of
+dict-backed specs. ``WorkloadBatch.from_specs`` builds
+
+- numeric columns (batch size, GPU count, parameter count, sequence length)
+  as contiguous arrays, with a default for missing values (NaN for floats),
+  raising ValueError for values that are present but not numbers, and
+- string columns (name, model type, task, model name, device) dictionary
+  encoded as an int32 code array plus a list of distinct values.
+
+Per-device or per-model tables are joined onto a batch with ``lookup()``,
+which touches each distinct value once and then gathers by code, so the
+Python overhead depends on the number of distinct values, not rows. Indexing
+a batch with an int still returns the original ``WorkloadSpec``.
+"""
+import operator
+
+import numpy as np
+
+from prototype.workload import _NUMERIC_RE
+
+# column -> (dotted spec path, dtype, default)
+NUMERIC_FIELDS = {
+    "batch_size": ("batch_size", np.int64, 1),
+    "gpu_count": ("hardware.count", np.int64, 1),
+    "parameters": ("model.parameters", np.float64, np.nan),
+    "sequence_length": ("dataset.sequence_length", np.float64, np.nan),
+}
+
+# column -> dotted spec path
+STRING_FIELDS = {
+    "name": "name",
+    "model_type": "model_type",
+    "task": "task",
+    "model_name": "model.name",
+    "device": "hardware.device",
+}
+
+
+def _getter(path: str):
+    """Accessor for a one- or two-level spec path (attribute[.key])."""
+    attr, _, key = path.partition(".")
+    if not key:
+        return operator.attrgetter(attr)
+    return lambda spec: getattr(spec, attr).get(key)
+
+
+def _number(value, default, path: str):
+    """Numeric value of a spec field (YAML may leave e.g. "7e9" as a string).
+
+    Missing fields give ``default``; anything else non-numeric raises ValueError.
+    """
+    if value is None:
+        return default
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and _NUMERIC_RE.match(value.strip()):
+        return float(value)
+    raise ValueError(f"{path} is not a number: {value!r}")
+
+
+class WorkloadBatch:
+    """Columnar container built from a sequence of WorkloadSpecs."""
+
+    def __init__(self, specs, numeric: dict, codes: dict, categories: dict):
+        self.specs = specs
+        self.numeric = numeric        # column -> ndarray
+        self.codes = codes            # column -> int32 ndarray
+        self.categories = categories  # column -> list of distinct values
+
+    @classmethod
+    def from_specs(cls, specs, columns=None) -> "WorkloadBatch":
+        """Encode ``specs`` column by column.
+
+        ``columns`` restricts encoding to the named columns (default: all of
+        NUMERIC_FIELDS and STRING_FIELDS); row views are unaffected.
+        """
+        specs = list(specs)
+        wanted = set(columns) if columns is not None else None
+        unknown = (wanted or set()) - NUMERIC_FIELDS.keys() - STRING_FIELDS.keys()
+        if unknown:
+            raise KeyError(f"Unknown WorkloadBatch column(s): {', '.join(sorted(unknown))}")
+
+        numeric = {}
+        for column, (path, dtype, default) in NUMERIC_FIELDS.items():
+            if wanted is not None and column not in wanted:
+                continue
+            get = _getter(path)
+            numeric[column] = np.fromiter(
+                (_number(get(spec), default, path) for spec in specs),
+                dtype=dtype, count=len(specs))
+
+        codes, categories = {}, {}
+        for column, path in STRING_FIELDS.items():
+            if wanted is not None and column not in wanted:
+                continue
+            get = _getter(path)
+            index = {}
+            codes[column] = np.fromiter(
+                (index.setdefault(get(spec) or "", len(index)) for spec in specs),
+                dtype=np.int32, count=len(specs))
+            categories[column] = [str(value) for value in index]
+        return cls(specs, numeric, codes, categories)
+
+    def __len__(self):
+        return len(self.specs)
+
+    def __getitem__(self, row: int):
+        """Row view: the WorkloadSpec at ``row``."""
+        return self.specs[row]
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def column(self, name: str) -> np.ndarray:
+        """Numeric column, or a decoded object array for a string column."""
+        if name in self.numeric:
+            return self.numeric[name]
+        return np.array(self.categories[name], dtype=object)[self.codes[name]]
+
+    def isin(self, name: str, keys) -> np.ndarray:
+        """Boolean mask of rows whose string column ``name`` is one of ``keys``."""
+        hit = np.array([value in keys for value in self.categories[name]], dtype=bool)
+        return hit[self.codes[name]]
+
+    def index(self, name: str, keys) -> np.ndarray:
+        """Position of each row's string column value in the sequence ``keys`` (-1 if absent)."""
+        position = {key: i for i, key in enumerate(keys)}
+        codes = np.array([position.get(v, -1) for v in self.categories[name]], dtype=np.intp)
+        return codes[self.codes[name]]
+
+    def lookup(self, name: str, table: dict, field: str, default=np.nan) -> np.ndarray:
+        """Join ``table[value][field]`` onto string column ``name`` as a float array."""
+        values = np.array(
+            [table[v][field] if v in table else default for v in self.categories[name]],
+            dtype=np.float64,
+        )
+        return values[self.codes[name]]
+
+    def take(self, rows) -> "WorkloadBatch":
+        """Sub-batch of the given row indices (categories are shared)."""
+        rows = np.asarray(rows, dtype=np.intp)
+        return WorkloadBatch(
+            [self.specs[i] for i in rows.tolist()],
+            {k: v[rows] for k, v in self.numeric.items()},
+            {k: v[rows] for k, v in self.codes.items()},
+            self.categories,
+        )
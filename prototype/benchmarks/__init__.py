@@ -0,0 +1 @@
+"""Performance budgets for the mlperf-model prototype (run as modules)."""
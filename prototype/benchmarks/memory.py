@@ -0,0 +1,103 @@
+"""Memory footprint of ResultSets, per million results.
+
+Builds ``--results`` Timeloop-like results (four metrics plus a raw stdout of
+``--raw-bytes``) twice, once with the previous dict-backed dataclass layout
+that kept raw output in memory and once with the slotted ``ResultSet`` whose
+raw output spills to blob files, and reports traced allocation scaled to one
+million results. Blobs are written to a temporary directory that is removed
+afterwards. Exits 1 if the current layout does not use less memory, or uses
+more than ``--budget-mb`` per million results when a budget is given.
+
+Usage:
+    python -m prototype.benchmarks.memory
+    python -m prototype.benchmarks.memory --results 50000 --raw-bytes 8192 --budget-mb 600
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class LegacyResultSet:
+    """The pre-slots ResultSet layout, kept here as the comparison baseline."""
+
+    tool: str
+    workload: str
+    metrics: dict = field(default_factory=dict)
+    raw_output: Optional[str] = None
+    exit_code: int = 0
+    error: Optional[str] = None
+    metadata: dict = field(default_factory=dict)
+
+
+def _raw_output(i: int, size: int) -> str:
+    line = f"cycles: {1170773 + i} energy: {649.08 + i * 1e-3:.3f} uJ utilization: 0.60\n"
+    return (line * (size // len(line) + 1))[:size]
+
+
+def measure(cls, n: int, raw_bytes: int) -> int:
+    """Traced bytes still allocated after building ``n`` results of ``cls``."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    results = [
+        cls(
+            tool="timeloop",
+            workload=f"sweep[batch_size={i}]",
+            metrics={"cycles": 1170773 + i, "energy_uj": 649.08 + i,
+                     "utilization": 0.6, "latency_ms": 5.854 + i},
+            raw_output=_raw_output(i, raw_bytes),
+        )
+        for i in range(n)
+    ]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del results
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=20000,
+                        help="Results to build per layout (default: 20000)")
+    parser.add_argument("--raw-bytes", type=int, default=8192,
+                        help="Raw output size per result (default: 8192)")
+    parser.add_argument("--budget-mb", type=float,
+                        help="Maximum MB per million results for the current layout")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="mlperf-model-blobs-") as blobs:
+        os.environ["MLPERF_MODEL_BLOB_DIR"] = blobs
+        from prototype.result import SPILL_CHARS, ResultSet
+
+        legacy = measure(LegacyResultSet, args.results, args.raw_bytes)
+        current = measure(ResultSet, args.results, args.raw_bytes)
+
+    scale = 1e6 / args.results / 1e6  # bytes for n results -> MB per million
+    print(f"{args.results} results, {args.raw_bytes} B raw output each "
+          f"(spill threshold {SPILL_CHARS} chars)")
+    print(f"legacy dataclass:  {legacy * scale:10.1f} MB per million results")
+    print(f"slotted + spilled: {current * scale:10.1f} MB per million results")
+    print(f"reduction:         {(legacy - current) * scale:10.1f} MB "
+          f"({(1 - current / legacy) * 100:.1f}%)")
+
+    failed = False
+    if current >= legacy:
+        print("FAIL: current ResultSet layout does not reduce memory")
+        failed = True
+    if args.budget_mb is not None and current * scale > args.budget_mb:
+        print(f"FAIL: {current * scale:.1f} MB per million results exceeds "
+              f"budget {args.budget_mb:.0f} MB")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
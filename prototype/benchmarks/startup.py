@@ -0,0 +1,92 @@
+"""Cold-start benchmark for ``mlperf-model list``.
+
+Runs ``python -m prototype.cli list`` in fresh interpreters and fails (exit
+code 1) if the median wall time exceeds the budget, or if listing tools pulled
+in any module that should stay deferred (adapter modules, PyYAML, NumPy,
+asyncio, process pools).
+
+Usage:
+    python -m prototype.benchmarks.startup
+    python -m prototype.benchmarks.startup --budget-ms 150 --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+# Modules that `list` must not import
+DEFERRED_MODULES = [
+    "yaml",
+    "numpy",
+    "asyncio",
+    "concurrent.futures",
+    "prototype.adapters.timeloop_adapter",
+    "prototype.adapters.analytical_adapter",
+    "prototype.adapters.astrasim_adapter",
+    "prototype.adapters.neusight_adapter",
+    "prototype.adapters.vidur_adapter",
+]
+
+_PROBE = """
+import contextlib, io, sys
+from prototype import cli
+sys.argv = ["mlperf-model", "list"]
+with contextlib.redirect_stdout(io.StringIO()):
+    cli.main()
+print("\\n".join(m for m in {modules!r} if m in sys.modules))
+"""
+
+
+def time_command(cmd, runs: int) -> list:
+    """Wall time in milliseconds of ``runs`` fresh executions of ``cmd``."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def loaded_deferred_modules() -> list:
+    """Deferred modules that a `list` invocation actually imported."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(modules=DEFERRED_MODULES)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return out.stdout.split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="Maximum median wall time of `list` (default: 150)")
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs (default: 10)")
+    args = parser.parse_args()
+
+    baseline = time_command([sys.executable, "-c", "pass"], args.runs)
+    times = time_command([sys.executable, "-m", "prototype.cli", "list"], args.runs)
+    median = statistics.median(times)
+
+    print(f"interpreter baseline: {statistics.median(baseline):8.1f} ms (median)")
+    print(f"mlperf-model list:    {median:8.1f} ms (median), "
+          f"{min(times):.1f} ms (min), budget {args.budget_ms:.0f} ms")
+
+    failed = False
+    leaked = loaded_deferred_modules()
+    if leaked:
+        print(f"FAIL: `list` imported deferred modules: {', '.join(leaked)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: median start-up {median:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
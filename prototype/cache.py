@@ -0,0 +1,228 @@
+"""Persistent content-addressed cache for adapter results.
+
+A cached ResultSet is keyed by a SHA-256 over:
+
+- the WorkloadSpec fingerprint (canonical form without the name, so
+  identical specs under different names share entries),
+- the adapter name and version,
+- fingerprints (mtime + size) of the adapter's module file and of every
+  path returned by ``ToolAdapter.source_paths()``.
+
+Editing a VIDUR run directory, a results JSON or the Timeloop script therefore
+invalidates exactly the entries that depend on it. Entries live as small JSON
+files under the cache directory; each hit refreshes the file's mtime and the
+oldest entries are evicted once the directory exceeds its size budget. Hits
+within one process are served from memory.
+"""
+import copy
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from prototype import profiling
+from prototype.result import ResultSet
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Cache location: $MLPERF_MODEL_CACHE_DIR, else $XDG_CACHE_HOME/mlperf-model."""
+    env = os.environ.get("MLPERF_MODEL_CACHE_DIR")
+    if env:
+        return Path(env)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "mlperf-model"
+
+
+def fingerprint_path(path) -> list:
+    """Return a JSON-able (path, mtime_ns, size) fingerprint of a file or directory tree."""
+    path = Path(path)
+    if not path.exists():
+        return [str(path), "missing"]
+    if path.is_file():
+        st = path.stat()
+        return [str(path), st.st_mtime_ns, st.st_size]
+    entries = []
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for fname in sorted(files):
+            st = os.stat(os.path.join(root, fname))
+            entries.append([os.path.relpath(os.path.join(root, fname), path),
+                            st.st_mtime_ns, st.st_size])
+    return [str(path), entries]
+
+
+def source_fingerprint(adapter) -> list:
+    """Fingerprint the adapter's own module plus every source path it reads."""
+    import inspect
+
+    paths = [inspect.getfile(type(adapter))] + list(adapter.source_paths())
+    return [fingerprint_path(p) for p in paths]
+
+
+def _sha256(text: str) -> str:
+    import hashlib
+
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def spec_hash(spec) -> str:
+    """SHA-256 of the canonical form of a WorkloadSpec (see WorkloadSpec.fingerprint)."""
+    return spec.fingerprint()
+
+
+def adapter_hash(adapter) -> str:
+    """SHA-256 over an adapter's name, version and source fingerprint."""
+    return _sha256(json.dumps(
+        [adapter.name, adapter.version, source_fingerprint(adapter)],
+        separators=(",", ":"),
+    ))
+
+
+class ResultCache:
+    """Size-bounded LRU cache of ResultSets on disk."""
+
+    def __init__(self, root=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root) if root else default_cache_dir()
+        self.max_bytes = max_bytes
+        self._memory = {}
+        self._sources = {}  # adapter name -> adapter_hash(), computed once per process
+        self._size = None
+
+    def key(self, adapter, spec) -> str:
+        """Content address for running ``adapter`` on ``spec``."""
+        if adapter.name not in self._sources:
+            self._sources[adapter.name] = adapter_hash(adapter)
+        return _sha256(self._sources[adapter.name] + spec.fingerprint())
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str, workload: Optional[str] = None) -> Optional[ResultSet]:
+        """Return the cached result for ``key``, or None on a miss.
+
+        Keys ignore spec names, so pass ``workload`` to attribute the hit to
+        the spec being looked up.
+        """
+        data = self._memory.get(key)
+        if data is None:
+            path = self._path(key)
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                os.utime(path)  # mark as recently used
+            except (OSError, ValueError):
+                return None
+            self._memory[key] = data
+        # Callers may mutate the result; keep the in-memory entry pristine
+        result = ResultSet.from_dict(copy.deepcopy(data))
+        if workload is not None:
+            result.workload = workload
+        return result
+
+    def put(self, key: str, result: ResultSet):
+        """Store a successful result. Failed runs are never cached."""
+        if result.exit_code != 0 or result.error:
+            return
+        data = copy.deepcopy(result.to_dict())
+        data.pop("metadata", None)  # run bookkeeping describes that run, not the result
+        data["raw_output"] = result.raw_output
+        self._memory[key] = data
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += path.stat().st_size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def entries(self) -> list:
+        """Paths of every cache entry on disk."""
+        if not self.root.exists():
+            return []
+        return list(self.root.glob("*/*.json"))
+
+    def size(self) -> int:
+        """Total bytes used by cache entries on disk."""
+        return sum(p.stat().st_size for p in self.entries())
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is under 90% of budget."""
+        entries = []
+        for p in self.entries():
+            st = p.stat()
+            entries.append((st.st_mtime_ns, st.st_size, p))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for _, size, p in entries:
+            if total <= target:
+                break
+            p.unlink(missing_ok=True)
+            self._memory.pop(p.stem, None)
+            total -= size
+        self._size = total
+
+    def clear(self) -> int:
+        """Delete every cache entry. Returns the number of entries removed."""
+        entries = self.entries()
+        for p in entries:
+            p.unlink(missing_ok=True)
+        self._memory.clear()
+        self._size = 0
+        return len(entries)
+
+
+def run_cached(adapter, spec, cache: Optional[ResultCache] = None) -> ResultSet:
+    """Run ``adapter`` on ``spec``, going through ``cache`` when one is given."""
+    if cache is not None:
+        key = cache.key(adapter, spec)
+        result = cache.get(key, spec.name)
+        if result is not None:
+            return result
+    with profiling.span(f"{adapter.name}.run", workload=spec.name):
+        result = _run_profiled(adapter, spec)
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+
+def _run_profiled(adapter, spec) -> ResultSet:
+    with profiling.adapter_profile(adapter.name):
+        return adapter.run(spec)
+
+
+async def run_cached_async(adapter, spec, cache: Optional[ResultCache] = None) -> ResultSet:
+    """Async counterpart of run_cached() built on ToolAdapter.run_async().
+
+    cProfile only sees the thread it was enabled on, so adapters that keep
+    the default thread-offloading run_async() are profiled inside their
+    worker thread; native coroutines are profiled on the event loop thread.
+    """
+    import asyncio
+
+    from prototype.adapters.base import ToolAdapter
+
+    if cache is not None:
+        key = cache.key(adapter, spec)
+        result = cache.get(key, spec.name)
+        if result is not None:
+            return result
+    with profiling.span(f"{adapter.name}.run", workload=spec.name):
+        if type(adapter).run_async is ToolAdapter.run_async:
+            result = await asyncio.to_thread(_run_profiled, adapter, spec)
+        else:
+            with profiling.adapter_profile(adapter.name):
+                result = await adapter.run_async(spec)
+    if cache is not None:
+        cache.put(key, result)
+    return result
@@ -0,0 +1,79 @@
+"""Compiled workload catalogs.
+
+A catalog is a directory of ``*.yaml`` files, each holding one or more
+WorkloadSpec documents separated by ``---``. Parsing thousands of specs with
+PyYAML is slow, so ``load_catalog`` compiles the parsed specs into a pickle
+sidecar (``.catalog.pickle`` in the catalog directory). The sidecar records the
+name, mtime and size of every source file; if any file is added, removed or
+modified it is rebuilt, otherwise the whole catalog loads in one read.
+"""
+import os
+import pickle
+from pathlib import Path
+
+from prototype import profiling
+from prototype.workload import WorkloadSpec
+
+SIDECAR_NAME = ".catalog.pickle"
+SIDECAR_VERSION = 1
+
+
+def catalog_files(configs_dir) -> list:
+    """YAML source files of a catalog directory, in load order."""
+    return sorted(Path(configs_dir).glob("*.yaml"))
+
+
+def _source_stamps(files) -> dict:
+    stamps = {}
+    for path in files:
+        st = path.stat()
+        stamps[path.name] = (st.st_mtime_ns, st.st_size)
+    return stamps
+
+
+def _read_sidecar(path, stamps):
+    """Spec dicts from a sidecar that still matches ``stamps``, else None."""
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if data.get("version") != SIDECAR_VERSION or data.get("sources") != stamps:
+        return None
+    return data["specs"]
+
+
+def _write_sidecar(path, stamps, specs):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                {"version": SIDECAR_VERSION, "sources": stamps,
+                 "specs": [s.to_dict() for s in specs]},
+                f, protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, path)
+    except OSError:
+        # A read-only catalog still loads, just without the compiled sidecar
+        tmp.unlink(missing_ok=True)
+
+
+def load_catalog(configs_dir, use_sidecar: bool = True) -> list:
+    """Load every WorkloadSpec in a catalog directory, via the sidecar when fresh."""
+    configs_dir = Path(configs_dir)
+    files = catalog_files(configs_dir)
+    stamps = _source_stamps(files)
+    sidecar = configs_dir / SIDECAR_NAME
+
+    if use_sidecar:
+        with profiling.span("catalog.sidecar_load", path=sidecar):
+            cached = _read_sidecar(sidecar, stamps)
+        if cached is not None:
+            return [WorkloadSpec.from_dict(d) for d in cached]
+
+    specs = []
+    for path in files:
+        specs.extend(WorkloadSpec.from_yaml_all(str(path)))
+    if use_sidecar:
+        _write_sidecar(sidecar, stamps, specs)
+    return specs
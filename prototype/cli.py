@@ -9,6 +9,9 @@ Usage:
     python -m prototype.cli list
     python -m prototype.cli run --workload configs/resnet50.yaml --tool vidur
     python -m prototype.cli compare --workload configs/resnet50.yaml --tools vidur,astra-sim
+    python -m prototype.cli validate --jobs 0 --backend process
+    python -m prototype.cli sweep --workload configs/resnet50.yaml --axis batch_size=1..256:*2
+    python -m prototype.cli archive get results.mlpa -w llama2-7b-serving-a100 -t vidur
 """
 import argparse
 import json
@@ -16,21 +19,53 @@ import sys
 from pathlib import Path
 
 from prototype.workload import WorkloadSpec
-from prototype.result import ResultSet
-from prototype.adapters import get_adapter, list_adapters
+from prototype.result import ResultSet, blob_dir, remove_blobs
+from prototype.adapters import adapter_names, get_adapter, list_adapter_info, list_adapters
+from prototype.cache import ResultCache, adapter_hash, run_cached, run_cached_async, spec_hash
+from prototype.executor import (
+    BACKENDS, resolve_jobs, run_many_unique, run_pairs, supported_pairs,
+)
+from prototype.manifest import ReportManifest, manifest_path
+
+
+def _cache(args):
+    """Return the result cache for this invocation, or None with --no-cache."""
+    if getattr(args, "no_cache", False):
+        return None
+    return ResultCache(args.cache_dir)
+
+
+def _load_configs(args) -> list:
+    """Load the workload catalog named by --configs (default: prototype/configs)."""
+    from prototype.catalog import catalog_files, load_catalog
+
+    configs_dir = Path(args.configs) if args.configs else Path(__file__).parent / "configs"
+    if not configs_dir.exists():
+        print(f"Error: configs directory '{configs_dir}' not found.")
+        sys.exit(1)
+
+    templates = load_catalog(configs_dir) if catalog_files(configs_dir) else []
+    try:
+        specs = [spec for t in templates for spec in t.expand()]
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if not specs:
+        print(f"No workload configs found in {configs_dir}")
+        sys.exit(1)
+    return specs
 
 
 def cmd_list(args):
     """List available tools and their capabilities."""
-    adapters = list_adapters()
+    adapters = list_adapter_info()
     print(f"Available tools ({len(adapters)}):")
     print()
-    for name, adapter_cls in adapters.items():
-        a = adapter_cls()
+    for name, info in adapters.items():
         print(f"  {name}")
-        print(f"    Category:   {a.category}")
-        print(f"    Metrics:    {', '.join(a.supported_metrics)}")
-        print(f"    Workloads:  {', '.join(a.supported_workloads)}")
+        print(f"    Category:   {info.category}")
+        print(f"    Metrics:    {', '.join(info.metrics)}")
+        print(f"    Workloads:  {', '.join(info.workloads)}")
         print()
 
 
@@ -55,7 +90,7 @@ def cmd_run(args):
 
     # Run
     print(f"Running {args.tool}...")
-    result = adapter.run(spec)
+    result = run_cached(adapter, spec, _cache(args))
 
     # Output
     if args.output:
@@ -70,7 +105,7 @@ def cmd_run(args):
 
 
 def cmd_compare(args):
-    """Run a workload across multiple tools and compare results."""
+    """Run a workload across multiple tools concurrently and compare results."""
     spec = WorkloadSpec.from_yaml(args.workload)
     tool_names = [t.strip() for t in args.tools.split(",")]
 
@@ -78,7 +113,7 @@ def cmd_compare(args):
     print(f"Tools:    {', '.join(tool_names)}")
     print()
 
-    results = []
+    runnable = []
     for tool_name in tool_names:
         adapter_cls = get_adapter(tool_name)
         if adapter_cls is None:
@@ -89,47 +124,127 @@ def cmd_compare(args):
             print(f"  SKIP {tool_name}: does not support this workload")
             continue
         print(f"  Running {tool_name}...")
-        result = adapter.run(spec)
-        results.append(result)
+        runnable.append((tool_name, adapter))
 
-    if not results:
+    if not runnable:
         print("No tools produced results.")
         sys.exit(1)
 
+    import asyncio
+
+    from prototype.compare import Comparison, print_agreement
+    from prototype.store import ResultStore
+
+    results = asyncio.run(_gather_tools(runnable, spec, _cache(args), args.timeout))
+    for result in results:
+        if result.error:
+            print(f"  FAIL {result.tool}: {result.error}")
+
     # Print comparison table
     print()
-    ResultSet.print_comparison(results)
+    store = ResultStore.from_results(results, [spec_hash(spec)] * len(results))
+    ResultSet.print_comparison(store)
+
+    try:
+        comparison = Comparison(store, reference=args.reference, clock_ghz=args.clock_ghz,
+                                fixed=[name for name, adapter in runnable
+                                       if not adapter.workload_dependent])
+    except ValueError as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
+    if comparison.summary():
+        print(f"\nCross-tool agreement (cycles at {args.clock_ghz:g} GHz):")
+        print_agreement(comparison)
+
+
+async def _gather_tools(runnable, spec, cache, timeout):
+    """Run every (name, adapter) on spec concurrently, each bounded by timeout seconds."""
+    import asyncio
+
+    def timed_out(tool_name, error):
+        return ResultSet(tool=tool_name, workload=spec.name, error=error, exit_code=1)
+
+    async def run_tool(tool_name, adapter):
+        # Only the tool's own time limit (e.g. Timeloop's TIMEOUT_S) lands
+        # here; when the wait_for below expires this coroutine is cancelled.
+        try:
+            return await run_cached_async(adapter, spec, cache)
+        except asyncio.TimeoutError:
+            return timed_out(tool_name, "Timed out (tool's own time limit)")
+
+    async def run_one(tool_name, adapter):
+        try:
+            return await asyncio.wait_for(run_tool(tool_name, adapter), timeout)
+        except asyncio.TimeoutError:
+            return timed_out(tool_name, f"Timed out after {timeout:g}s")
+
+    return await asyncio.gather(*(run_one(name, adapter) for name, adapter in runnable))
 
 
 def cmd_validate(args):
     """Run all compatible tools on each workload config and report results."""
-    configs_dir = Path(args.configs) if args.configs else Path(__file__).parent / "configs"
-    if not configs_dir.exists():
-        print(f"Error: configs directory '{configs_dir}' not found.")
-        sys.exit(1)
-
-    yaml_files = sorted(configs_dir.glob("*.yaml"))
-    if not yaml_files:
-        print(f"No workload configs found in {configs_dir}")
-        sys.exit(1)
+    specs = _load_configs(args)
 
     adapters = list_adapters()
-    all_results = []
     errors = []
 
-    print(f"Validating {len(yaml_files)} workload(s) against {len(adapters)} tool(s)")
-    print("=" * 70)
+    # .jsonl outputs stream each result to disk as it is produced; .npz,
+    # .parquet and .mlpa outputs collect a columnar ResultStore; .json outputs keep
+    # results in memory and write one document at the end.
+    output_path = Path(args.output) if args.output else None
+    sink = None
+    store = None
+    all_results = []
+    if output_path is not None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if output_path.suffix == ".jsonl":
+            from prototype.sink import JsonlResultSink
 
-    for yaml_file in yaml_files:
-        spec = WorkloadSpec.from_yaml(str(yaml_file))
-        print(f"\n--- {spec.name} ({spec.model_type}, {spec.task}) ---")
+            sink = JsonlResultSink(output_path, flush_interval=args.flush_interval)
+        elif output_path.suffix in (".npz", ".parquet", ".mlpa"):
+            from prototype.store import ResultStore, check_format
 
-        for name, adapter_cls in adapters.items():
-            adapter = adapter_cls()
-            if not adapter.supports(spec):
-                continue
-            result = adapter.run(spec)
-            all_results.append(result)
+            try:
+                check_format(output_path)
+            except RuntimeError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            store = ResultStore()
+
+    print(f"Validating {len(specs)} workload(s) against {len(adapters)} tool(s)")
+    print("=" * 70)
+
+    pairs = supported_pairs(specs, adapters)
+    jobs = resolve_jobs(args.jobs)
+
+    memory = None
+    if args.memory:
+        from prototype.memprobe import MemorySummary
+
+        memory = MemorySummary()
+
+    current = None
+    ok_count = fail_count = 0
+    try:
+        # Memory accounting measures real runs, so it bypasses the result cache
+        cache = None if args.memory else _cache(args)
+        for name, spec, result in run_pairs(pairs, jobs=jobs, backend=args.backend,
+                                            cache=cache, memory=args.memory):
+            if spec is not current:
+                current = spec
+                print(f"\n--- {spec.name} ({spec.model_type}, {spec.task}) ---")
+            if sink is not None:
+                sink.write(result)
+            elif store is not None:
+                store.append(result, spec_hash(spec))
+            elif output_path is not None:
+                all_results.append(result)
+            if memory is not None:
+                memory.add(result)
+            if result.exit_code == 0:
+                ok_count += 1
+            else:
+                fail_count += 1
             status = "OK" if result.exit_code == 0 else "FAIL"
             if result.error:
                 errors.append(f"{spec.name}/{name}: {result.error}")
@@ -140,30 +255,41 @@ def cmd_validate(args):
                     for k, v in list(result.metrics.items())[:3]
                 )
                 print(f"  {name:<15} {status}  {metric_summary}")
+    except BaseException:
+        if sink is not None:
+            sink.close()  # keep what was streamed; no summary trailer
+        raise
 
     # Summary
-    ok_count = sum(1 for r in all_results if r.exit_code == 0)
-    fail_count = sum(1 for r in all_results if r.exit_code != 0)
+    total = ok_count + fail_count
     print(f"\n{'=' * 70}")
     print(f"Total: {ok_count} passed, {fail_count} failed, "
-          f"{len(all_results)} total runs across {len(yaml_files)} workloads")
+          f"{total} total runs across {len(specs)} workloads")
 
     if errors:
         print(f"\nErrors ({len(errors)}):")
         for e in errors:
             print(f"  - {e}")
 
-    if args.output:
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        report = {
-            "workloads": len(yaml_files),
-            "tools": len(adapters),
-            "total_runs": len(all_results),
-            "passed": ok_count,
-            "failed": fail_count,
-            "results": [r.to_dict() for r in all_results],
-        }
+    summary = {
+        "workloads": len(specs),
+        "tools": len(adapters),
+        "total_runs": total,
+        "passed": ok_count,
+        "failed": fail_count,
+    }
+    if memory is not None:
+        print("\nMemory per tool (max over runs; batch-level measurements):")
+        memory.print_table()
+        summary["memory"] = memory.as_dict()
+    if sink is not None:
+        sink.close(summary)
+        print(f"\nFull report streamed to {output_path}")
+    elif store is not None:
+        store.save(output_path)
+        print(f"\nResult store ({len(store)} rows) saved to {output_path}")
+    elif output_path is not None:
+        report = dict(summary, results=[r.to_dict() for r in all_results])
         with open(output_path, "w") as f:
             json.dump(report, f, indent=2)
         print(f"\nFull report saved to {output_path}")
@@ -173,30 +299,54 @@ def cmd_report(args):
     """Generate a markdown report with coverage matrix and metric comparisons."""
     from datetime import date
 
-    configs_dir = Path(args.configs) if args.configs else Path(__file__).parent / "configs"
-    if not configs_dir.exists():
-        print(f"Error: configs directory '{configs_dir}' not found.")
-        sys.exit(1)
+    from prototype.compare import Comparison
+    from prototype.store import ResultStore
 
-    yaml_files = sorted(configs_dir.glob("*.yaml"))
-    if not yaml_files:
-        print(f"No workload configs found in {configs_dir}")
-        sys.exit(1)
+    specs = _load_configs(args)
 
     adapters = list_adapters()
     tool_names = list(adapters.keys())
 
-    # Run all tool-workload combinations
-    workloads = []
-    results_map = {}  # (workload_name, tool_name) -> ResultSet
-    for yaml_file in yaml_files:
-        spec = WorkloadSpec.from_yaml(str(yaml_file))
-        workloads.append(spec)
-        for name, adapter_cls in adapters.items():
-            adapter = adapter_cls()
-            if adapter.supports(spec):
-                result = adapter.run(spec)
-                results_map[(spec.name, name)] = result
+    output_path = Path(args.output) if args.output else Path("data/evaluation/prototype-report.md")
+
+    # Run all tool-workload combinations, reusing clean pairs from the last run
+    workloads = specs
+    pairs = supported_pairs(workloads, adapters)
+    previous = (ReportManifest(manifest_path(output_path)) if args.full
+                else ReportManifest.load(manifest_path(output_path)))
+    manifest = ReportManifest(previous.path)
+    source_hashes = {name: adapter_hash(adapter_cls()) for name, adapter_cls in adapters.items()}
+
+    store = ResultStore()  # keyed by (spec fingerprint, tool)
+    fingerprints = {id(spec): spec_hash(spec) for spec in workloads}
+    dirty = []
+    for name, spec in pairs:
+        s_hash = fingerprints[id(spec)]
+        result = previous.lookup(spec.name, name, s_hash, source_hashes[name])
+        if result is None:
+            dirty.append((name, spec))
+        else:
+            store.append(result, s_hash)
+            manifest.record(spec.name, name, s_hash, source_hashes[name], result)
+    for name, spec, result in run_pairs(dirty, jobs=resolve_jobs(args.jobs),
+                                        backend=args.backend, cache=_cache(args)):
+        store.append(result, fingerprints[id(spec)])
+        manifest.record(spec.name, name, fingerprints[id(spec)], source_hashes[name], result)
+
+    # Row of every (workload, tool) pair; equivalent specs share a row
+    pair_rows = {(spec.name, name): store.index(fingerprints[id(spec)], name)
+                 for name, spec in pairs}
+    passed = store.column("exit_code")[list(pair_rows.values())] == 0
+    workload_fps = list(dict.fromkeys(fingerprints[id(spec)] for spec in workloads))
+    try:
+        comparison = Comparison(store, reference=args.reference, clock_ghz=args.clock_ghz,
+                                workloads=workload_fps, tools=tool_names,
+                                fixed=[name for name, adapter_cls in adapters.items()
+                                       if not adapter_cls.workload_dependent])
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    present_metrics = dict(zip(workload_fps, comparison.present_metrics()))
 
     # Build report
     lines = []
@@ -204,18 +354,17 @@ def cmd_report(args):
     lines.append(f"\n**Generated:** {date.today().isoformat()}")
     lines.append(f"**Tools:** {len(adapters)}")
     lines.append(f"**Workloads:** {len(workloads)}")
-    lines.append(f"**Total runs:** {len(results_map)}")
-    ok = sum(1 for r in results_map.values() if r.exit_code == 0)
-    fail = sum(1 for r in results_map.values() if r.exit_code != 0)
+    lines.append(f"**Total runs:** {len(pair_rows)}")
+    ok = int(passed.sum())
+    fail = len(pair_rows) - ok
     lines.append(f"**Pass/Fail:** {ok}/{fail}")
 
     # Tool overview table
     lines.append("\n## Tool Overview\n")
     lines.append("| Tool | Category | Metrics |")
     lines.append("|------|----------|---------|")
-    for name, adapter_cls in adapters.items():
-        a = adapter_cls()
-        lines.append(f"| {name} | {a.category} | {', '.join(a.supported_metrics)} |")
+    for name, info in list_adapter_info().items():
+        lines.append(f"| {name} | {info.category} | {', '.join(info.metrics)} |")
 
     # Coverage matrix
     lines.append("\n## Coverage Matrix\n")
@@ -223,13 +372,13 @@ def cmd_report(args):
     sep = "|----------|" + "|".join(["---"] * len(tool_names)) + "|"
     lines.append(header)
     lines.append(sep)
+    exit_code = store.column("exit_code")
     for spec in workloads:
         row = f"| {spec.name} |"
         for t in tool_names:
             key = (spec.name, t)
-            if key in results_map:
-                r = results_map[key]
-                row += " PASS |" if r.exit_code == 0 else " FAIL |"
+            if key in pair_rows:
+                row += " PASS |" if exit_code[pair_rows[key]] == 0 else " FAIL |"
             else:
                 row += " — |"
         lines.append(row)
@@ -243,28 +392,25 @@ def cmd_report(args):
                       f"**Hardware:** {spec.hardware.get('device', 'N/A')}"
                       f"{' x' + str(spec.hardware.get('count', 1)) if spec.hardware.get('count', 1) > 1 else ''}\n")
 
-        wk_results = [(t, results_map[(spec.name, t)])
-                       for t in tool_names if (spec.name, t) in results_map]
-        if not wk_results:
+        wk_rows = [(t, pair_rows[(spec.name, t)])
+                   for t in tool_names if (spec.name, t) in pair_rows]
+        if not wk_rows:
             lines.append("No tools support this workload.\n")
             continue
 
-        # Collect all metrics across tools for this workload
-        all_metrics = set()
-        for _, r in wk_results:
-            if r.exit_code == 0:
-                all_metrics.update(r.metrics.keys())
-        all_metrics = sorted(all_metrics)
+        # Metrics reported by any successful tool for this workload
+        rows = [r for _, r in wk_rows]
+        all_metrics = present_metrics[fingerprints[id(spec)]]
 
         if all_metrics:
-            header = "| Metric | " + " | ".join(t for t, _ in wk_results) + " |"
-            sep = "|--------|" + "|".join(["---"] * len(wk_results)) + "|"
+            header = "| Metric | " + " | ".join(t for t, _ in wk_rows) + " |"
+            sep = "|--------|" + "|".join(["---"] * len(wk_rows)) + "|"
             lines.append(header)
             lines.append(sep)
             for m in all_metrics:
                 row = f"| {m} |"
-                for _, r in wk_results:
-                    val = r.metrics.get(m)
+                for r in rows:
+                    val = store.value(r, m)
                     if val is None:
                         row += " — |"
                     elif isinstance(val, float):
@@ -276,12 +422,28 @@ def cmd_report(args):
                 lines.append(row)
         lines.append("")
 
+    # Cross-tool agreement on canonical (unit-normalized) metrics
+    agreement = comparison.summary()
+    if agreement:
+        lines.append("## Cross-Tool Agreement\n")
+        basis = (f"against **{args.reference}**" if args.reference
+                 else "between every pair of tools")
+        lines.append(f"Errors on unit-normalized metrics {basis}; cycles are converted "
+                     f"at {args.clock_ghz:g} GHz. Ratio is the geometric mean of "
+                     f"tool / reference.\n")
+        lines.append("| Metric | Tool | Reference | Workloads | MAPE % | Geomean error % | Ratio |")
+        lines.append("|--------|------|-----------|-----------|--------|-----------------|-------|")
+        for a in agreement:
+            lines.append(f"| {a['metric']} | {a['tool']} | {a['reference']} | {a['workloads']} "
+                         f"| {a['mape_pct']:,.2f} | {a['geomean_error_pct']:,.2f} "
+                         f"| {a['mean_ratio']:.3f} |")
+        lines.append("")
+
     # Category analysis
     lines.append("## Category Analysis\n")
     categories = {}
-    for name, adapter_cls in adapters.items():
-        a = adapter_cls()
-        cat = a.category
+    for name, info in list_adapter_info().items():
+        cat = info.category
         if cat not in categories:
             categories[cat] = []
         categories[cat].append(name)
@@ -290,12 +452,227 @@ def cmd_report(args):
 
     report_text = "\n".join(lines) + "\n"
 
-    output_path = Path(args.output) if args.output else Path("data/evaluation/prototype-report.md")
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w") as f:
         f.write(report_text)
+    manifest.save()
     print(f"Report written to {output_path}")
-    print(f"({ok} passed, {fail} failed, {len(results_map)} total runs)")
+    print(f"({ok} passed, {fail} failed, {len(pair_rows)} total runs; "
+          f"{len(dirty)} recomputed, {len(pairs) - len(dirty)} reused)")
+
+
+def cmd_sweep(args):
+    """Evaluate tools across the cartesian product of one or more spec axes."""
+    from prototype import sweep
+    from prototype.workload import axis_values, named_filter
+
+    base = WorkloadSpec.from_yaml(args.workload)
+    try:
+        axes = [sweep.parse_axis(a) for a in args.axis or []]
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    template = sweep.template(base, axes)
+    if not template.axes:
+        print("Error: No sweep axes given and the workload declares none.")
+        sys.exit(1)
+
+    try:
+        filters = [named_filter(name) for name in args.filter or []]
+        expanded = template.expand(filters=filters, with_points=True)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    tool_names = ([t.strip() for t in args.tools.split(",")] if args.tools
+                  else adapter_names())
+    adapters = {}
+    for tool_name in tool_names:
+        adapter_cls = get_adapter(tool_name)
+        if adapter_cls is None:
+            print(f"Error: Unknown tool '{tool_name}'. Use 'list' to see available tools.")
+            sys.exit(1)
+        adapters[tool_name] = adapter_cls()
+
+    if args.metrics:
+        metrics = [m.strip() for m in args.metrics.split(",")]
+    else:
+        metrics = []
+        for adapter in adapters.values():
+            metrics += [m for m in adapter.supported_metrics if m not in metrics]
+
+    axis_names = list(template.axes)
+    columns = axis_names + ["tool", "status"] + metrics
+    points = 1
+    for decl in template.axes.values():
+        points *= len(axis_values(decl))
+    pruned = " before filtering" if filters or template.filters else ""
+    print(f"Sweep: {base.name} over {points} point(s){pruned} x {len(adapters)} tool(s)",
+          file=sys.stderr)
+
+    out = open(args.output, "w", newline="") if args.output else None
+    if out:
+        import csv
+        writer = csv.writer(out)
+        writer.writerow(columns)
+    else:
+        print("".join(f"{c:<22}" for c in columns))
+        print("-" * 22 * len(columns))
+
+    jobs = resolve_jobs(args.jobs)
+    cache = _cache(args)
+    rows = 0
+    for chunk in sweep.chunked(expanded, args.chunk_size):
+        for tool_name, adapter in adapters.items():
+            supported = [(spec, point) for spec, point in chunk if adapter.supports(spec)]
+            if not supported:
+                continue
+            if adapter.batched:
+                results = run_many_unique(adapter, [spec for spec, _ in supported])
+            else:
+                pairs = [(tool_name, spec) for spec, _ in supported]
+                results = [r for _, _, r in run_pairs(pairs, jobs=jobs,
+                                                      backend=args.backend, cache=cache)]
+            for (_, point), result in zip(supported, results):
+                status = "OK" if result.exit_code == 0 else "FAIL"
+                values = list(point) + [tool_name, status] + [
+                    result.metrics.get(m, "") for m in metrics
+                ]
+                rows += 1
+                if out:
+                    writer.writerow(values)
+                else:
+                    print("".join(
+                        f"{v:<22.4f}" if isinstance(v, float) else f"{str(v):<22}"
+                        for v in values
+                    ))
+
+    if out:
+        out.close()
+        print(f"{rows} row(s) written to {args.output}")
+
+
+def cmd_serve(args):
+    """Run the long-lived prediction daemon."""
+    from prototype.server import serve
+
+    serve(host=args.host, port=args.port, socket_path=args.socket,
+          workers=args.workers, watch_interval=args.watch_interval, quiet=args.quiet)
+
+
+def cmd_cache(args):
+    """Inspect or clear the persistent result cache."""
+    cache = ResultCache(args.cache_dir)
+    if args.action == "clear":
+        removed = cache.clear()
+        print(f"Removed {removed} cached result(s) from {cache.root}")
+        print(f"Removed {remove_blobs()} raw-output blob(s) from {blob_dir()}")
+    else:
+        entries = len(cache.entries())
+        print(f"Cache directory: {cache.root}")
+        print(f"Entries:         {entries}")
+        print(f"Size:            {cache.size() / 1e6:.2f} MB (limit {cache.max_bytes / 1e6:.0f} MB)")
+
+
+def _load_results(path):
+    """Read a results file (.json, .jsonl, .npz, .parquet or .mlpa) as a ResultStore."""
+    from prototype.store import ResultStore
+
+    path = Path(path)
+    if not path.exists():
+        print(f"Error: '{path}' not found.")
+        sys.exit(1)
+    if path.suffix in (".npz", ".parquet", ".mlpa"):
+        return ResultStore.load(path)
+    if path.suffix == ".jsonl":
+        from prototype.sink import iter_results
+
+        return ResultStore.from_results(iter_results(path))
+    with open(path) as f:
+        data = json.load(f)
+    records = data.get("results", [data]) if isinstance(data, dict) else data
+    return ResultStore.from_results(ResultSet.from_dict(r) for r in records)
+
+
+def cmd_archive(args):
+    """Convert result files to memory-mapped archives and query them."""
+    from prototype.archive import ResultArchive
+
+    required = {"convert": ["dest"], "get": ["workload", "tool"], "column": ["metric"]}
+    missing = [name for name in required.get(args.action, []) if not getattr(args, name)]
+    if missing:
+        print(f"Error: 'archive {args.action}' needs {', '.join(missing)}.")
+        sys.exit(1)
+
+    if args.action == "convert":
+        store = _load_results(args.path)
+        store.save(args.dest)
+        print(f"{len(store)} row(s) written to {args.dest}")
+        return
+
+    try:
+        archive = ResultArchive(args.path)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    with archive:
+        if args.action == "info":
+            passed = int((archive.exit_codes() == 0).sum())
+            print(f"Archive: {archive.path}")
+            print(f"Rows:    {len(archive)} ({passed} passed, {len(archive) - passed} failed)")
+            print(f"Metrics: {', '.join(archive.metric_names())}")
+        elif args.action == "get":
+            row = archive.find(args.tool, workload=args.workload)
+            if row is None:
+                print(f"Error: No result for workload '{args.workload}' and tool '{args.tool}'.")
+                sys.exit(1)
+            archive.row(row).print_summary()
+        elif args.action == "column":
+            if args.metric not in archive.metric_names():
+                print(f"Error: Unknown metric '{args.metric}'.")
+                sys.exit(1)
+            values, valid = archive.metric(args.metric)
+            if values.dtype.kind not in "if":
+                print(f"Error: Metric '{args.metric}' is not numeric.")
+                sys.exit(1)
+            present = values[valid]
+            print(f"{args.metric}: {present.size} of {len(archive)} row(s)")
+            if present.size:
+                print(f"  min  {present.min():.4f}\n  mean {present.mean():.4f}\n"
+                      f"  max  {present.max():.4f}")
+            del values, valid, present
+
+
+def _add_cache_args(parser):
+    """Add --no-cache/--cache-dir options shared by commands that run adapters."""
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always run adapters; do not read or write the result cache")
+    parser.add_argument("--cache-dir", help="Result cache directory "
+                        "(default: $MLPERF_MODEL_CACHE_DIR or ~/.cache/mlperf-model)")
+
+
+def _add_profile_args(parser):
+    """Add --profile/--pstats options to commands that run adapters."""
+    parser.add_argument("--profile", metavar="TRACE_JSON",
+                        help="Record timing spans and write a Chrome trace-event JSON file")
+    parser.add_argument("--pstats", metavar="DIR",
+                        help="Also dump a cProfile <tool>.pstats file per adapter into DIR")
+
+
+def _add_comparison_args(parser):
+    parser.add_argument("--reference", "-r",
+                        help="Tool treated as ground truth for error metrics "
+                             "(default: compare every pair of tools)")
+    parser.add_argument("--clock-ghz", type=float, default=1.0,
+                        help="Clock rate for converting cycles to ms (default: 1.0)")
+
+
+def _add_parallel_args(parser):
+    """Add --jobs/--backend options shared by the matrix commands."""
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Parallel (workload, tool) runs (0 = one per CPU, default: 1)")
+    parser.add_argument("--backend", choices=BACKENDS, default="thread",
+                        help="Worker pool backend for --jobs > 1 (default: thread)")
 
 
 def main():
@@ -313,24 +690,117 @@ def main():
     run_parser.add_argument("--workload", "-w", required=True, help="Path to workload YAML")
     run_parser.add_argument("--tool", "-t", required=True, help="Tool name")
     run_parser.add_argument("--output", "-o", help="Output JSON file path")
+    _add_cache_args(run_parser)
+    _add_profile_args(run_parser)
 
     # compare
     cmp_parser = subparsers.add_parser("compare", help="Compare tools on a workload")
     cmp_parser.add_argument("--workload", "-w", required=True, help="Path to workload YAML")
     cmp_parser.add_argument("--tools", "-t", required=True, help="Comma-separated tool names")
+    cmp_parser.add_argument("--timeout", type=float, default=None,
+                            help="Per-tool timeout in seconds (default: none). Tools that "
+                                 "run in a worker thread keep running after it expires, so "
+                                 "it does not bound total wall time")
+    _add_comparison_args(cmp_parser)
+    _add_cache_args(cmp_parser)
+    _add_profile_args(cmp_parser)
 
     # validate
     val_parser = subparsers.add_parser("validate", help="Run all tools on all workloads")
     val_parser.add_argument("--configs", "-c", help="Configs directory (default: prototype/configs)")
-    val_parser.add_argument("--output", "-o", help="Output JSON report path")
+    val_parser.add_argument("--output", "-o",
+                            help="Output report path (.jsonl streams one line per result; "
+                                 ".npz, .parquet or .mlpa write a columnar result store)")
+    val_parser.add_argument("--memory", action="store_true",
+                            help="Record peak traced allocation and RSS per adapter batch "
+                                 "(bypasses the result cache; with the thread backend, "
+                                 "probed batches run one at a time)")
+    val_parser.add_argument("--flush-interval", type=float, default=1.0,
+                            help="Seconds between flushes of a .jsonl output (default: 1.0)")
+    _add_parallel_args(val_parser)
+    _add_cache_args(val_parser)
+    _add_profile_args(val_parser)
 
     # report
     rep_parser = subparsers.add_parser("report", help="Generate markdown evaluation report")
     rep_parser.add_argument("--configs", "-c", help="Configs directory (default: prototype/configs)")
     rep_parser.add_argument("--output", "-o", help="Output markdown file path")
+    rep_parser.add_argument("--full", action="store_true",
+                            help="Ignore the report manifest and recompute every pair")
+    _add_comparison_args(rep_parser)
+    _add_parallel_args(rep_parser)
+    _add_cache_args(rep_parser)
+    _add_profile_args(rep_parser)
+
+    # sweep
+    sweep_parser = subparsers.add_parser("sweep", help="Sweep tools over spec axes")
+    sweep_parser.add_argument("--workload", "-w", required=True, help="Path to base workload YAML")
+    sweep_parser.add_argument("--axis", "-a", action="append",
+                              help="Axis as path=values, e.g. batch_size=1..256:*2 "
+                                   "or hardware.device=A100,H100 (repeatable; merged "
+                                   "over the workload's own axes)")
+    sweep_parser.add_argument("--filter", "-f", action="append",
+                              help="Prune sweep points with a named filter, e.g. "
+                                   "fits_in_memory (repeatable)")
+    sweep_parser.add_argument("--tools", "-t", help="Comma-separated tool names (default: all)")
+    sweep_parser.add_argument("--metrics", "-m",
+                              help="Comma-separated metric columns (default: tools' metrics)")
+    sweep_parser.add_argument("--chunk-size", type=int, default=4096,
+                              help="Sweep points handed to each adapter per batch")
+    sweep_parser.add_argument("--output", "-o", help="Output CSV file path")
+    _add_parallel_args(sweep_parser)
+    _add_cache_args(sweep_parser)
+    _add_profile_args(sweep_parser)
+
+    # serve
+    serve_parser = subparsers.add_parser("serve", help="Run the prediction daemon")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", "-p", type=int, default=8765, help="TCP port (default: 8765)")
+    serve_parser.add_argument("--socket", help="Listen on this Unix socket path instead of TCP")
+    serve_parser.add_argument("--workers", type=int, default=4, help="Request worker threads")
+    serve_parser.add_argument("--watch-interval", type=float, default=2.0,
+                              help="Seconds between source-data change checks (0 disables)")
+    serve_parser.add_argument("--quiet", "-q", action="store_true", help="Do not log requests")
+
+    # archive
+    archive_parser = subparsers.add_parser(
+        "archive", help="Convert results to memory-mapped archives and query them")
+    archive_parser.add_argument("action", choices=["convert", "info", "get", "column"])
+    archive_parser.add_argument("path", help="Archive (.mlpa), or the source file for convert")
+    archive_parser.add_argument("dest", nargs="?",
+                                help="convert: output path (.mlpa, .npz or .parquet)")
+    archive_parser.add_argument("--workload", "-w", help="get: workload name")
+    archive_parser.add_argument("--tool", "-t", help="get: tool name")
+    archive_parser.add_argument("--metric", "-m", help="column: metric name")
+
+    cache_parser = subparsers.add_parser("cache", help="Inspect or clear the result cache")
+    cache_parser.add_argument("action", choices=["info", "clear"])
+    cache_parser.add_argument("--cache-dir", help="Result cache directory")
 
     args = parser.parse_args()
 
+    tracer = None
+    if getattr(args, "profile", None) or getattr(args, "pstats", None):
+        from prototype import profiling
+
+        tracer = profiling.enable(args.pstats)
+        if getattr(args, "backend", None) == "process":
+            print("Note: profiling uses the thread backend so spans are recorded in-process",
+                  file=sys.stderr)
+            args.backend = "thread"
+
+    try:
+        _dispatch(args)
+    finally:
+        if tracer is not None:
+            profiling.disable()
+            trace_path = args.profile or str(Path(args.pstats) / "trace.json")
+            tracer.save(trace_path)
+            print(f"Profile trace written to {trace_path}", file=sys.stderr)
+
+
+def _dispatch(args):
+    """Run the selected subcommand."""
     if args.command == "list":
         cmd_list(args)
     elif args.command == "run":
@@ -341,6 +811,14 @@ def main():
         cmd_validate(args)
     elif args.command == "report":
         cmd_report(args)
+    elif args.command == "sweep":
+        cmd_sweep(args)
+    elif args.command == "serve":
+        cmd_serve(args)
+    elif args.command == "archive":
+        cmd_archive(args)
+    elif args.command == "cache":
+        cmd_cache(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,216 @@
+"""Vectorized cross-tool comparison and error metrics.
+
+Tools report overlapping quantities under different names and units
+(``latency_ms``, ``avg_e2e_time_s``, ``total_cycles``). ``Comparison``
+aligns the successful rows of a ``ResultStore`` into a workload x tool grid
+per canonical metric, converting units on the way:
+
+- seconds become milliseconds,
+- cycles become milliseconds through a clock rate (default 1 GHz, i.e. one
+  cycle per nanosecond as in scripts/cross_tool_accuracy_analysis.py;
+  override globally or per tool).
+
+On that grid it computes pairwise ratios, absolute percentage error (APE)
+against a reference tool, and per-tool MAPE and geometric-mean error, all as
+whole-array NumPy operations over every workload at once. Without a
+reference every tool is compared with every other. Tools passed as
+``fixed`` (whose output does not depend on the workload) keep their grid
+columns but are left out of ``summary()``.
+"""
+import numpy as np
+
+DEFAULT_CLOCK_GHZ = 1.0
+
+# canonical metric -> (source metric, unit) in order of preference; the first
+# source a result reports is used
+CANONICAL_METRICS = {
+    "latency_ms": (("latency_ms", "ms"), ("predicted_latency_ms", "ms"),
+                   ("cycles", "cycles"), ("total_cycles", "cycles")),
+    "compute_time_ms": (("compute_time_ms", "ms"), ("compute_cycles", "cycles")),
+    "communication_time_ms": (("communication_time_ms", "ms"),
+                              ("communication_cycles", "cycles")),
+    "e2e_time_ms": (("avg_e2e_time_s", "s"),),
+    "ttft_ms": (("avg_ttft_s", "s"),),
+    "tpot_ms": (("avg_tpot_s", "s"),),
+    "throughput_samples_s": (("throughput_samples_s", "1"),),
+    "throughput_tokens_per_s": (("throughput_tokens_per_s", "1"),),
+    "energy_uj": (("energy_uj", "1"),),
+    "memory_gb": (("memory_gb", "1"),),
+}
+
+# unit -> factor to the canonical unit (cycles are handled via the clock)
+UNIT_SCALE = {"ms": 1.0, "s": 1e3, "us": 1e-3, "1": 1.0}
+
+# Floor for APE values in the geometric mean so exact matches stay finite
+_GEOMEAN_FLOOR_PCT = 1e-9
+
+
+def _codes(column, order):
+    """Position of each row's value in ``order`` (-1 if absent)."""
+    uniq, inverse = np.unique(column.astype(str), return_inverse=True)
+    position = {v: i for i, v in enumerate(order)}
+    return np.array([position.get(v, -1) for v in uniq.tolist()], dtype=np.intp)[inverse]
+
+
+def _first_seen(column) -> list:
+    uniq, first = np.unique(column.astype(str), return_index=True)
+    return uniq[np.argsort(first)].tolist()
+
+
+class Comparison:
+    """Canonical metric grids (workload x tool) built from a ResultStore."""
+
+    def __init__(self, store, reference=None, clock_ghz: float = DEFAULT_CLOCK_GHZ,
+                 clocks=None, workloads=None, tools=None, fixed=()):
+        """``workloads`` (fingerprints) and ``tools`` fix the grid axes and order."""
+        fingerprints = store.column("fingerprint")
+        tool_col = store.column("tool")
+        self.workloads = list(workloads) if workloads is not None else _first_seen(fingerprints)
+        self.tools = list(tools) if tools is not None else _first_seen(tool_col)
+        if reference is not None and reference not in self.tools:
+            raise ValueError(f"Reference tool '{reference}' has no results")
+        self.fixed = set(fixed)
+        if reference in self.fixed:
+            raise ValueError(f"Reference tool '{reference}' ignores the workload")
+        self.reference = reference
+
+        # rows[w, t] = store row of (workload, tool), or -1
+        w, t = _codes(fingerprints, self.workloads), _codes(tool_col, self.tools)
+        keep = (w >= 0) & (t >= 0) & (store.column("exit_code") == 0)
+        self.rows = np.full((len(self.workloads), len(self.tools)), -1, dtype=np.intp)
+        self.rows[w[keep], t[keep]] = np.flatnonzero(keep)
+
+        clock = np.full(len(self.tools), float(clock_ghz))
+        for i, tool in enumerate(self.tools):
+            clock[i] = (clocks or {}).get(tool, clock_ghz)
+        ms_per_cycle = 1e3 / (clock * 1e9)
+
+        self.store = store
+        available = set(store.metric_names())
+        present = self.rows >= 0
+        safe_rows = np.where(present, self.rows, 0)
+        self.metrics = {}  # canonical name -> (W, T) float array, NaN = missing
+        for name, sources in CANONICAL_METRICS.items():
+            grid = np.full(self.rows.shape, np.nan)
+            for source, unit in sources:
+                if source not in available:
+                    continue
+                values, valid = store.metric(source)
+                if values.dtype.kind not in "if":
+                    continue
+                scale = ms_per_cycle if unit == "cycles" else UNIT_SCALE[unit]
+                take = present & valid[safe_rows] & np.isnan(grid)
+                grid = np.where(take, values[safe_rows] * scale, grid)
+            if not np.isnan(grid).all():
+                self.metrics[name] = grid
+
+    def present_metrics(self) -> list:
+        """Per workload, the sorted raw metric names any successful tool reported."""
+        names = sorted(self.store.metric_names())
+        present = self.rows >= 0
+        safe_rows = np.where(present, self.rows, 0)
+        if not names:
+            return [[] for _ in self.workloads]
+        # (metrics, workloads): metric valid for at least one tool
+        hit = np.stack([(self.store.metric(m)[1][safe_rows] & present).any(axis=1)
+                        for m in names])
+        names = np.array(names, dtype=object)
+        return [names[hit[:, w]].tolist() for w in range(len(self.workloads))]
+
+    def grid(self, metric: str) -> np.ndarray:
+        """(workloads, tools) values of a canonical metric; NaN where missing."""
+        return self.metrics[metric]
+
+    def ratios(self, metric: str) -> np.ndarray:
+        """(W, T, T) array: value of tool i divided by value of tool j."""
+        g = self.metrics[metric]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return g[:, :, None] / g[:, None, :]
+
+    def ape(self, metric: str) -> np.ndarray:
+        """Absolute percentage error, in percent.
+
+        (W, T) against the reference tool if one is set, otherwise (W, T, T)
+        with entry [w, i, j] the error of tool i taking tool j as truth.
+        """
+        g = self.metrics[metric]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.reference is not None:
+                ref = g[:, self.tools.index(self.reference)][:, None]
+                return np.abs(g - ref) / np.abs(ref) * 100
+            return np.abs(g[:, :, None] - g[:, None, :]) / np.abs(g[:, None, :]) * 100
+
+    def mape(self, metric: str) -> np.ndarray:
+        """Mean APE over workloads: shape (T,) with a reference, else (T, T)."""
+        ape = self.ape(metric)
+        return _nanmean(np.where(np.isfinite(ape), ape, np.nan), axis=0)
+
+    def geomean_error(self, metric: str) -> np.ndarray:
+        """Geometric-mean APE over workloads (same shape as ``mape``)."""
+        ape = self.ape(metric)
+        logs = np.where(np.isfinite(ape), np.log(np.maximum(ape, _GEOMEAN_FLOOR_PCT)), np.nan)
+        return np.exp(_nanmean(logs, axis=0))
+
+    def counts(self, metric: str) -> np.ndarray:
+        """Workloads with finite APE per tool (or tool pair)."""
+        return np.isfinite(self.ape(metric)).sum(axis=0)
+
+    def summary(self) -> list:
+        """One dict per (metric, tool, reference) pair sharing at least one workload.
+
+        Pairs involving a ``fixed`` tool are skipped.
+
+        Keys: metric, tool, reference, workloads, mape_pct, geomean_error_pct,
+        mean_ratio (geometric mean of tool / reference).
+        """
+        rows = []
+        for metric in self.metrics:
+            n, mape, geo = self.counts(metric), self.mape(metric), self.geomean_error(metric)
+            ratio = self.ratios(metric)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_ratio = np.where(np.isfinite(ratio) & (ratio > 0), np.log(ratio), np.nan)
+            mean_ratio = np.exp(_nanmean(log_ratio, axis=0))
+            if self.reference is not None:
+                # Per-tool stats against the reference: index them as [i, j]
+                n, mape, geo = (np.repeat(a[:, None], len(self.tools), axis=1)
+                                for a in (n, mape, geo))
+                j = self.tools.index(self.reference)
+                pairs = [(i, j) for i in range(len(self.tools)) if i != j and n[i, j]]
+            else:
+                pairs = [(i, j) for i in range(len(self.tools))
+                         for j in range(len(self.tools)) if i != j and n[i, j]]
+            for i, j in pairs:
+                if self.tools[i] in self.fixed or self.tools[j] in self.fixed:
+                    continue
+                rows.append({
+                    "metric": metric,
+                    "tool": self.tools[i],
+                    "reference": self.tools[j],
+                    "workloads": int(n[i, j]),
+                    "mape_pct": float(mape[i, j]),
+                    "geomean_error_pct": float(geo[i, j]),
+                    "mean_ratio": float(mean_ratio[i, j]),
+                })
+        return rows
+
+
+def _nanmean(a, axis):
+    """NaN-ignoring mean that yields NaN (without a warning) for all-NaN slices."""
+    finite = ~np.isnan(a)
+    total = np.where(finite, a, 0.0).sum(axis=axis)
+    count = finite.sum(axis=axis)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+
+def print_agreement(comparison: Comparison):
+    """Print the summary() rows as a plain-text table."""
+    rows = comparison.summary()
+    if not rows:
+        return
+    print(f"{'Metric':<24}{'Tool':<14}{'vs':<14}{'N':>5}{'MAPE %':>12}"
+          f"{'Geomean %':>12}{'Ratio':>10}")
+    print("-" * 91)
+    for r in rows:
+        print(f"{r['metric']:<24}{r['tool']:<14}{r['reference']:<14}{r['workloads']:>5}"
+              f"{r['mape_pct']:>12.2f}{r['geomean_error_pct']:>12.2f}{r['mean_ratio']:>10.3f}")
@@ -0,0 +1,295 @@
+"""Layer-level transformer cost model.
+
+Builds per-operator FLOP and byte counts from the architecture fields of a
+spec's ``model`` section:
+
+    model:
+      name: Llama-2-7b
+      layers: 32
+      hidden_size: 4096
+      num_heads: 32
+      num_kv_heads: 32        # optional, < num_heads for grouped-query attention
+      intermediate_size: 11008
+      vocab_size: 32000
+      gated_mlp: true         # optional, SwiGLU-style up/gate/down MLP
+      lm_head: true           # optional, defaults to true for model_type llm
+
+Every operator's cost is linear in a few terms of the batch size B, the
+number of query tokens S per sequence and the attended context length C
+(T = B * S tokens; C = S for a full forward pass)::
+
+    flops = f_tok * T + f_attn * B * S * C
+    bytes = b_weight + b_tok * T + b_ctx * B * C + b_attn * B * S * C
+
+so the coefficients are computed once per architecture (``op_costs`` is
+memoized) and any batch/sequence length resolves with a handful of NumPy
+operations. ``layer_roofline`` rooflines every operator separately and sums
+the times. Tensors are FP16 (2 bytes), like the rest of the analytical model.
+
+For LLMs, ``generation`` splits a request into a prefill pass over the
+prompt and one decode step per output token. A decode step has S = 1 and
+C = prompt + tokens generated so far, so its ``b_ctx`` term is the KV-cache
+read that grows with every token; all decode steps are evaluated as one
+array.
+
+For training, ``training_step`` adds the backward pass (every operator
+does twice its forward FLOPs and bytes: weight and activation gradients),
+an optional recomputation of the forward pass, and a mixed-precision Adam
+update that streams the gradients, FP32 master weights and both moments.
+``activation_memory`` gives the activations kept for the backward pass.
+"""
+import functools
+from typing import NamedTuple, Optional
+
+BYTES_PER_VALUE = 2  # FP16
+
+# Sequence length used when a spec gives none
+DEFAULT_SEQUENCE_LENGTH = 512
+
+# Generated tokens per request used when a spec gives none
+DEFAULT_OUTPUT_LENGTH = 128
+
+# Mixed-precision Adam, per parameter: FP16 weight + gradient and FP32
+# master weight + two moments held; gradient read, master and moments read
+# and written, FP16 weight written every step
+ADAM_STATE_BYTES = 16
+ADAM_TRAFFIC_BYTES = 28
+ADAM_FLOPS = 12
+
+# Backward pass cost relative to the forward pass
+BACKWARD_FACTOR = 2
+
+# FLOPs per element of the elementwise operators
+_SOFTMAX_FLOPS = 5
+_NORM_FLOPS = 5
+_ACT_FLOPS = 8
+
+
+class Architecture(NamedTuple):
+    """Transformer shape parameters, hashable so costs can be memoized."""
+
+    layers: int
+    hidden_size: int
+    num_heads: int
+    num_kv_heads: int
+    intermediate_size: int
+    vocab_size: int
+    gated_mlp: bool
+    lm_head: bool
+
+    @property
+    def kv_dim(self) -> int:
+        return self.hidden_size * self.num_kv_heads // self.num_heads
+
+    @property
+    def parameters(self) -> int:
+        """Parameter count implied by the architecture."""
+        h, kv, i = self.hidden_size, self.kv_dim, self.intermediate_size
+        per_layer = h * (h + 2 * kv) + h * h + (3 if self.gated_mlp else 2) * h * i + 2 * h
+        embed = self.vocab_size * h * (2 if self.lm_head else 1)
+        return self.layers * per_layer + embed + h
+
+
+_REQUIRED = ("layers", "hidden_size", "num_heads", "intermediate_size", "vocab_size")
+
+
+def architecture(spec) -> Optional[Architecture]:
+    """The spec's Architecture, or None if its model section lacks the fields."""
+    model = spec.model
+    if not all(isinstance(model.get(k), int) for k in _REQUIRED):
+        return None
+    return Architecture(
+        layers=model["layers"],
+        hidden_size=model["hidden_size"],
+        num_heads=model["num_heads"],
+        num_kv_heads=model.get("num_kv_heads", model["num_heads"]),
+        intermediate_size=model["intermediate_size"],
+        vocab_size=model["vocab_size"],
+        gated_mlp=bool(model.get("gated_mlp", False)),
+        lm_head=bool(model.get("lm_head", spec.model_type == "llm")),
+    )
+
+
+def sequence_length(spec) -> int:
+    """Tokens per sample: dataset.sequence_length, else input_shape[0], else the default."""
+    dataset = spec.dataset
+    seq = dataset.get("sequence_length")
+    if seq is None and dataset.get("input_shape"):
+        seq = dataset["input_shape"][0]
+    return int(seq) if seq else DEFAULT_SEQUENCE_LENGTH
+
+
+def output_length(spec) -> int:
+    """Generated tokens per request: dataset.output_length, else the default."""
+    return int(spec.dataset.get("output_length") or DEFAULT_OUTPUT_LENGTH)
+
+
+def kv_cache_bytes(arch: Architecture, batch, context):
+    """KV-cache size for ``batch`` sequences of ``context`` tokens."""
+    return 2 * arch.kv_dim * BYTES_PER_VALUE * arch.layers * batch * context
+
+
+@functools.lru_cache(maxsize=256)
+def op_costs(arch: Architecture) -> dict:
+    """Per-operator cost coefficients for one forward pass of ``arch``.
+
+    Returns {"ops": names, "count": times each op runs per pass, and the
+    arrays f_tok, f_attn, b_weight, b_tok, b_ctx, b_attn} (see module
+    docstring).
+    """
+    import numpy as np
+
+    h, kv, i, v = arch.hidden_size, arch.kv_dim, arch.intermediate_size, arch.vocab_size
+    heads, n = arch.num_heads, BYTES_PER_VALUE
+    up = 2 if arch.gated_mlp else 1  # up (+ gate) projections
+
+    # name: (count, f_tok, f_attn, b_weight, b_tok, b_ctx, b_attn)
+    # K and V are read once per attended position (b_ctx), Q and outputs
+    # once per query token (b_tok).
+    ops = {
+        "embedding":    (1, 0, 0, 0, 2 * h * n, 0, 0),
+        "norm":         (2 * arch.layers, _NORM_FLOPS * h, 0, h * n, 2 * h * n, 0, 0),
+        "qkv_proj":     (arch.layers, 2 * h * (h + 2 * kv), 0, h * (h + 2 * kv) * n,
+                         (h + h + 2 * kv) * n, 0, 0),
+        "attn_score":   (arch.layers, 0, 2 * h, 0, h * n, kv * n, heads * n),
+        "softmax":      (arch.layers, 0, _SOFTMAX_FLOPS * heads, 0, 0, 0, 2 * heads * n),
+        "attn_context": (arch.layers, 0, 2 * h, 0, h * n, kv * n, heads * n),
+        "o_proj":       (arch.layers, 2 * h * h, 0, h * h * n, 2 * h * n, 0, 0),
+        "mlp_up":       (arch.layers, 2 * h * i * up, 0, h * i * up * n,
+                         (h + up * i) * n, 0, 0),
+        "mlp_act":      (arch.layers, _ACT_FLOPS * i, 0, 0, (up + 1) * i * n, 0, 0),
+        "mlp_down":     (arch.layers, 2 * i * h, 0, i * h * n, (i + h) * n, 0, 0),
+        "final_norm":   (1, _NORM_FLOPS * h, 0, h * n, 2 * h * n, 0, 0),
+    }
+    if arch.lm_head:
+        ops["lm_head"] = (1, 2 * h * v, 0, h * v * n, (h + v) * n, 0, 0)
+
+    table = np.array(list(ops.values()), dtype=float)
+    count = table[:, 0]
+    return {
+        "ops": list(ops),
+        "count": count,
+        "f_tok": table[:, 1],
+        "f_attn": table[:, 2],
+        "b_weight": table[:, 3],
+        "b_tok": table[:, 4],
+        "b_ctx": table[:, 5],
+        "b_attn": table[:, 6],
+    }
+
+
+def layer_roofline(arch: Architecture, batch, seq, peak_tflops, mem_bw_gb_s,
+                   context=None) -> dict:
+    """Sum of per-operator rooflines; arguments broadcast against each other.
+
+    ``seq`` is the number of query tokens per sequence and ``context`` the
+    attended length (defaults to ``seq``, i.e. a full forward pass).
+
+    Returns arrays ``latency_ms``, ``compute_time_ms``, ``memory_time_ms``,
+    ``flops`` and ``bytes`` with the broadcast shape of the inputs.
+    """
+    import numpy as np
+
+    c = op_costs(arch)
+    if context is None:
+        context = seq
+    batch, seq, context, peak, bw = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float)
+          for x in (batch, seq, context, peak_tflops, mem_bw_gb_s)))
+    tokens = (batch * seq)[..., None]
+    ctx = (batch * context)[..., None]
+    attn = (batch * seq * context)[..., None]
+
+    flops = c["count"] * (c["f_tok"] * tokens + c["f_attn"] * attn)
+    nbytes = c["count"] * (c["b_weight"] + c["b_tok"] * tokens + c["b_ctx"] * ctx
+                           + c["b_attn"] * attn)
+    compute_ms = flops / (peak[..., None] * 1e12) * 1000
+    memory_ms = nbytes / (bw[..., None] * 1e9) * 1000
+    return {
+        "latency_ms": np.maximum(compute_ms, memory_ms).sum(axis=-1),
+        "compute_time_ms": compute_ms.sum(axis=-1),
+        "memory_time_ms": memory_ms.sum(axis=-1),
+        "flops": flops.sum(axis=-1),
+        "bytes": nbytes.sum(axis=-1),
+    }
+
+
+def generation(arch: Architecture, batch, prompt, output, peak_tflops, mem_bw_gb_s) -> dict:
+    """Prefill + token-by-token decode of ``output`` tokens after ``prompt``.
+
+    All arguments are 1-D (or scalar) and broadcast to N requests. Decode
+    steps for every output position are evaluated as one (N, max output)
+    array. Returns per-request arrays ``ttft_ms`` (prefill latency),
+    ``tpot_ms`` (mean decode step), ``decode_ms`` (all decode steps),
+    ``e2e_ms`` and ``kv_cache_bytes`` (KV cache after the last token).
+    """
+    import numpy as np
+
+    batch, prompt, output, peak, bw = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(x, dtype=float))
+          for x in (batch, prompt, output, peak_tflops, mem_bw_gb_s)))
+    prefill = layer_roofline(arch, batch, prompt, peak, bw)["latency_ms"]
+
+    # Step j attends to the prompt plus the j tokens generated before it
+    steps = np.arange(int(output.max(initial=0)))
+    live = steps < output[:, None]
+    decode = layer_roofline(arch, batch[:, None], 1, peak[:, None], bw[:, None],
+                            context=prompt[:, None] + steps)["latency_ms"]
+    decode_ms = np.where(live, decode, 0.0).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tpot = np.where(output > 0, decode_ms / output, 0.0)
+    return {
+        "ttft_ms": prefill,
+        "tpot_ms": tpot,
+        "decode_ms": decode_ms,
+        "e2e_ms": prefill + decode_ms,
+        "kv_cache_bytes": kv_cache_bytes(arch, batch, prompt + output),
+    }
+
+
+def activation_memory(arch: Architecture, batch, seq, recompute=False):
+    """Bytes of activations kept for the backward pass.
+
+    Per layer s * b * h * (34 + 5 * heads * s / h) bytes in FP16 (Korthikanti
+    et al., 2022); with full recomputation only each layer's input (2 * s * b
+    * h bytes) is kept plus one layer being recomputed. LM-head logits are
+    added for models with one.
+    """
+    import numpy as np
+
+    b, s = np.asarray(batch, dtype=float), np.asarray(seq, dtype=float)
+    h = arch.hidden_size
+    per_layer = s * b * h * (34 + 5 * arch.num_heads * s / h)
+    kept = np.where(recompute, arch.layers * 2 * s * b * h + per_layer,
+                    arch.layers * per_layer)
+    if arch.lm_head:
+        kept = kept + b * s * arch.vocab_size * BYTES_PER_VALUE
+    return kept
+
+
+def training_step(forward_ms, forward_flops, params, peak_tflops, mem_bw_gb_s,
+                  recompute=False) -> dict:
+    """Forward + backward (+ recompute) + Adam step; arguments broadcast.
+
+    ``forward_ms`` and ``forward_flops`` are one forward pass of the batch.
+    Returns arrays ``forward_ms``, ``backward_ms``, ``recompute_ms``,
+    ``optimizer_ms``, ``step_ms`` and ``flops``.
+    """
+    import numpy as np
+
+    forward_ms, forward_flops, params, peak, bw, recompute = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float)
+          for x in (forward_ms, forward_flops, params, peak_tflops, mem_bw_gb_s, recompute)))
+    backward_ms = BACKWARD_FACTOR * forward_ms
+    recompute_ms = recompute * forward_ms
+    optimizer_ms = np.maximum(params * ADAM_FLOPS / (peak * 1e12),
+                              params * ADAM_TRAFFIC_BYTES / (bw * 1e9)) * 1000
+    passes = 1 + BACKWARD_FACTOR + recompute
+    return {
+        "forward_ms": forward_ms,
+        "backward_ms": backward_ms,
+        "recompute_ms": recompute_ms,
+        "optimizer_ms": optimizer_ms,
+        "step_ms": forward_ms + backward_ms + recompute_ms + optimizer_ms,
+        "flops": forward_flops * passes + params * ADAM_FLOPS,
+    }
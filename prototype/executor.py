@@ -0,0 +1,148 @@
+"""Parallel execution engine for (workload, tool) pairs.
+
+``validate``, ``report`` and ``sweep`` fan out every supported
+(WorkloadSpec, adapter) pair through ``run_pairs``. Pairs are batched per
+adapter, submitted to a process or thread pool and yielded back in submission
+order, so the output is the same no matter which adapter finishes first. Wall
+time becomes roughly that of the slowest adapter instead of the sum of all
+pairs.
+"""
+import os
+
+from prototype import profiling
+from prototype.adapters import get_adapter
+
+BACKENDS = ("process", "thread")
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Map a --jobs value to a worker count (0 means one per CPU)."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def supported_pairs(specs, adapters: dict) -> list:
+    """Return (tool_name, spec) for every adapter that supports each spec.
+
+    Pairs are ordered workload-major, then in adapter registration order.
+    """
+    instances = {name: cls() for name, cls in adapters.items()}
+    pairs = []
+    for spec in specs:
+        for name, adapter in instances.items():
+            if adapter.supports(spec):
+                pairs.append((name, spec))
+    return pairs
+
+
+def run_many_unique(adapter, specs: list) -> list:
+    """adapter.run_many(specs), running specs that differ only by name once."""
+    unique = {}  # FrozenWorkloadSpec -> position in the deduplicated batch
+    batch = []
+    positions = []
+    for spec in specs:
+        frozen = spec.freeze()
+        if frozen not in unique:
+            unique[frozen] = len(batch)
+            batch.append(spec)
+        positions.append(unique[frozen])
+    results = adapter.run_many(batch)
+    return [
+        results[pos] if batch[pos] is spec else results[pos].with_workload(spec.name)
+        for spec, pos in zip(specs, positions)
+    ]
+
+
+def run_batch(tool_name: str, specs: list, memory: bool = False) -> list:
+    """Run one adapter on a batch of workloads. Module-level so process pools can pickle it.
+
+    With ``memory=True`` the batch is wrapped in a MemoryProbe and the
+    measurement is attached to every result's metadata.
+    """
+    adapter = get_adapter(tool_name)()
+    with profiling.span(f"{tool_name}.run_many", specs=len(specs)), \
+            profiling.adapter_profile(tool_name):
+        if not memory:
+            return adapter.run_many(specs)
+        from prototype.memprobe import MemoryProbe
+
+        with MemoryProbe(scope="batch", specs=len(specs)) as probe:
+            results = adapter.run_many(specs)
+        return probe.attach(results)
+
+
+def run_pairs(pairs, jobs: int = 1, backend: str = "thread", cache=None, memory=False):
+    """Run (tool_name, spec) pairs and yield (tool_name, spec, result).
+
+    Pairs are grouped per tool and each group goes through a single
+    ``ToolAdapter.run_many`` call, so an adapter loads its data source once no
+    matter how many workloads it sees. Results are yielded in the order of
+    ``pairs``. With ``jobs <= 1`` each tool's batch runs inline the first time
+    one of its pairs is reached; otherwise every batch is submitted to the pool
+    up front. When a ResultCache is given, hits are resolved in the calling
+    process and only misses are dispatched. Pairs whose specs are identical
+    apart from their name (same ``WorkloadSpec.fingerprint``) run once per
+    tool. ``memory`` enables per-batch memory accounting (see
+    prototype.memprobe).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+
+    pairs = list(pairs)
+    keys = [None] * len(pairs)
+    results = {}
+    if cache is not None:
+        adapters = {}
+        for i, (name, spec) in enumerate(pairs):
+            if name not in adapters:
+                adapters[name] = get_adapter(name)()
+            keys[i] = cache.key(adapters[name], spec)
+            result = cache.get(keys[i], spec.name)
+            if result is not None:
+                results[i] = result
+
+    batches = {}  # tool_name -> indices into pairs still to run
+    duplicate_of = {}  # pair index -> index of the identical pair that actually runs
+    first = {}  # (tool_name, FrozenWorkloadSpec) -> pair index
+    for i, (name, spec) in enumerate(pairs):
+        if i in results:
+            continue
+        frozen = (name, spec.freeze())
+        if frozen in first:
+            duplicate_of[i] = first[frozen]
+            continue
+        first[frozen] = i
+        batches.setdefault(name, []).append(i)
+
+    def finish(name, batch_results):
+        for i, result in zip(batches[name], batch_results):
+            if cache is not None:
+                cache.put(keys[i], result)
+            results[i] = result
+
+    def specs_for(name):
+        return [pairs[i][1] for i in batches[name]]
+
+    def resolve(i, name, spec, run):
+        if i in duplicate_of:
+            results[i] = results[duplicate_of[i]].with_workload(spec.name)
+        elif i not in results:
+            finish(name, run())
+        return results[i]
+
+    if jobs <= 1 or len(batches) <= 1:
+        for i, (name, spec) in enumerate(pairs):
+            yield name, spec, resolve(
+                i, name, spec, lambda: run_batch(name, specs_for(name), memory)
+            )
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    pool_cls = ProcessPoolExecutor if backend == "process" else ThreadPoolExecutor
+    with pool_cls(max_workers=min(jobs, len(batches))) as pool:
+        futures = {name: pool.submit(run_batch, name, specs_for(name), memory)
+                   for name in batches}
+        for i, (name, spec) in enumerate(pairs):
+            yield name, spec, resolve(i, name, spec, futures[name].result)
@@ -0,0 +1,241 @@
+"""Hardware catalog: per-SKU device specifications with an alias index.
+
+The catalog is a YAML or JSON file (``hardware.yaml`` next to this module,
+or ``$MLPERF_MODEL_HARDWARE``) with one entry per SKU: per-precision peak
+throughput, memory capacity and bandwidth, cache sizes, interconnect
+bandwidths, and the device names tools with pre-computed results use.
+
+Every SKU name and alias is indexed case-insensitively, ignoring spaces,
+``-`` and ``_``, so ``A100``, ``a100-sxm`` and ``NVIDIA_A100-PCIE-40GB`` all
+resolve with one dict lookup. The file is parsed once per process through
+``prototype.sources``, so ``sources.invalidate`` (the daemon's reload path)
+picks up edits. ``arrays()`` exposes the numeric fields as NumPy columns for
+the vectorized roofline, with ``indices()`` mapping device names onto rows.
+A spec may set ``hardware.precision`` (default FP16); ``bytes_per_value``
+gives the storage size of one value at each precision.
+"""
+import json
+import os
+import re
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from prototype import sources
+
+CATALOG_PATH = Path(__file__).with_name("hardware.yaml")
+
+PRECISIONS = ("fp32", "tf32", "bf16", "fp16", "fp8", "int8", "int4")
+DEFAULT_PRECISION = "fp16"
+
+# Storage size of one value; TF32 math reads and writes FP32 values
+BYTES_PER_VALUE = {"fp32": 4, "tf32": 4, "bf16": 2, "fp16": 2, "fp8": 1, "int8": 1, "int4": 0.5}
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+
+def catalog_path() -> Path:
+    """Catalog location: $MLPERF_MODEL_HARDWARE, else the bundled hardware.yaml."""
+    env = os.environ.get("MLPERF_MODEL_HARDWARE")
+    return Path(env) if env else CATALOG_PATH
+
+
+def source_paths() -> list:
+    """Files that define device data, for adapters' cache fingerprints."""
+    return [Path(__file__), catalog_path()]
+
+
+def bytes_per_value(precision: str = DEFAULT_PRECISION) -> float:
+    """Bytes one weight or activation takes at ``precision``."""
+    if precision not in BYTES_PER_VALUE:
+        raise ValueError(f"Unknown precision: {precision} (expected one of {PRECISIONS})")
+    return BYTES_PER_VALUE[precision]
+
+
+def spec_precision(spec) -> str:
+    """The precision a spec runs at: ``hardware.precision``, default FP16."""
+    return spec.hardware.get("precision") or DEFAULT_PRECISION
+
+
+def _key(name: str) -> str:
+    return _SEPARATORS.sub("", str(name)).lower()
+
+
+class Device(NamedTuple):
+    """One catalog entry."""
+
+    name: str
+    family: str
+    aliases: tuple
+    peak_tflops: dict
+    mem_gb: float
+    mem_bw_gb_s: float
+    l2_cache_mb: Optional[float]
+    l1_cache_kb_per_sm: Optional[float]
+    sms: Optional[int]
+    interconnect_gb_s: dict
+    names: dict
+    alias_names: dict
+
+    def peak(self, precision: str = DEFAULT_PRECISION) -> Optional[float]:
+        """Dense peak TFLOPS (TOPS for integer types), or None if not accelerated."""
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision} (expected one of {PRECISIONS})")
+        return self.peak_tflops.get(precision)
+
+
+class HardwareCatalog:
+    """Devices of one catalog file, indexed by name and alias."""
+
+    def __init__(self, devices: list):
+        self.devices = {d.name: d for d in devices}
+        self._rows = {name: i for i, name in enumerate(self.devices)}
+        self._index = {}
+        for device in devices:
+            for alias in (device.name, *device.aliases):
+                key = _key(alias)
+                other = self._index.get(key)
+                if other is not None and other is not device:
+                    raise ValueError(
+                        f"Hardware alias '{alias}' names both {other.name} and {device.name}")
+                self._index[key] = device
+        # Names exactly as written resolve without normalizing
+        self._exact = {alias: device for device in devices
+                       for alias in (device.name, *device.aliases)}
+        self._alias_names = {}
+        for device in devices:
+            for alias, names in device.alias_names.items():
+                if self._index.get(_key(alias)) is not device:
+                    raise ValueError(f"{device.name}: alias_names entry '{alias}' "
+                                     f"is not one of its aliases")
+                self._alias_names[_key(alias)] = names
+        self._arrays = {}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HardwareCatalog":
+        devices = []
+        for name, entry in (data.get("devices") or {}).items():
+            peaks = entry.get("peak_tflops") or {}
+            unknown = set(peaks) - set(PRECISIONS)
+            if unknown:
+                raise ValueError(f"{name}: unknown precisions {sorted(unknown)}")
+            devices.append(Device(
+                name=name,
+                family=entry.get("family", name),
+                aliases=tuple(entry.get("aliases") or ()),
+                peak_tflops={k: float(v) for k, v in peaks.items()},
+                mem_gb=float(entry["mem_gb"]),
+                mem_bw_gb_s=float(entry["mem_bw_gb_s"]),
+                l2_cache_mb=entry.get("l2_cache_mb"),
+                l1_cache_kb_per_sm=entry.get("l1_cache_kb_per_sm"),
+                sms=entry.get("sms"),
+                interconnect_gb_s=dict(entry.get("interconnect_gb_s") or {}),
+                names=dict(entry.get("names") or {}),
+                alias_names={alias: dict(names or {}) for alias, names
+                             in (entry.get("alias_names") or {}).items()},
+            ))
+        return cls(devices)
+
+    def __len__(self):
+        return len(self.devices)
+
+    def __iter__(self):
+        return iter(self.devices.values())
+
+    def __contains__(self, name) -> bool:
+        return self.resolve(name) is not None
+
+    def names(self) -> list:
+        """SKU names in catalog order."""
+        return list(self.devices)
+
+    def resolve(self, name) -> Optional[Device]:
+        """The device a SKU name or alias refers to, or None."""
+        if not name:
+            return None
+        device = self._exact.get(name)
+        return device if device is not None else self._index.get(_key(name))
+
+    def tool_name(self, name, tool: str) -> Optional[str]:
+        """The name ``tool`` uses for a device, or None.
+
+        ``alias_names`` entries apply only when ``name`` is that alias, so a
+        bare family name can keep a tool's stand-in data without the SKU it
+        resolves to claiming it.
+        """
+        device = self.resolve(name)
+        if device is None:
+            return None
+        names = self._alias_names.get(_key(name))
+        if names is not None and tool in names:
+            return names[tool]
+        return device.names.get(tool)
+
+    def indices(self, names):
+        """Row of each device name or alias in ``arrays()`` (-1 if unknown)."""
+        import numpy as np
+
+        arr = np.asarray(names)
+        uniq, inverse = np.unique(arr, return_inverse=True)
+        codes = []
+        for value in uniq.tolist():
+            device = self.resolve(value)
+            codes.append(self._rows[device.name] if device is not None else -1)
+        return np.array(codes, dtype=np.intp)[inverse].reshape(arr.shape)
+
+    def arrays(self, precision: str = DEFAULT_PRECISION) -> dict:
+        """Numeric fields as NumPy columns in catalog order (NaN where missing).
+
+        Keys: ``names``, ``peak_tflops`` (at ``precision``), ``mem_gb``,
+        ``mem_bw_gb_s``, ``l2_cache_mb`` and ``sms``. Cached per precision.
+        """
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision} (expected one of {PRECISIONS})")
+        cached = self._arrays.get(precision)
+        if cached is not None:
+            return cached
+        import numpy as np
+
+        def column(values):
+            return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+        devices = list(self.devices.values())
+        cached = {
+            "names": [d.name for d in devices],
+            "peak_tflops": column([d.peak(precision) for d in devices]),
+            "mem_gb": column([d.mem_gb for d in devices]),
+            "mem_bw_gb_s": column([d.mem_bw_gb_s for d in devices]),
+            "l2_cache_mb": column([d.l2_cache_mb for d in devices]),
+            "sms": column([d.sms for d in devices]),
+        }
+        self._arrays[precision] = cached
+        return cached
+
+
+def load_catalog(path=None) -> HardwareCatalog:
+    """Parse a catalog file (.yaml/.yml or .json) once per process until invalidated."""
+    path = Path(path) if path is not None else catalog_path()
+    return sources.load("hardware", path, _parse_catalog)
+
+
+def _parse_catalog(path) -> HardwareCatalog:
+    path = Path(path)
+    with open(path) as f:
+        if path.suffix == ".json":
+            data = json.load(f)
+        else:
+            import yaml
+
+            from prototype.workload import yaml_loader
+
+            data = yaml.load(f, Loader=yaml_loader())
+    return HardwareCatalog.from_dict(data or {})
+
+
+def catalog() -> HardwareCatalog:
+    """The active hardware catalog."""
+    return load_catalog(catalog_path())
+
+
+def lookup(name) -> Optional[Device]:
+    """The device a name or alias refers to in the active catalog, or None."""
+    return catalog().resolve(name)
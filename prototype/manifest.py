@@ -0,0 +1,79 @@
+"""Dependency manifest for incremental reports.
+
+``report`` records, for every (workload, tool) pair it ran, the hash of the
+WorkloadSpec, the hash of the adapter's version and source data (see
+``prototype.cache.adapter_hash``) and the resulting ResultSet. On the next
+run a pair whose hashes are unchanged is clean and its stored result is
+reused; only dirty pairs are recomputed. Like ``ResultCache``, failed results
+are never stored, so a failing pair reruns every time. The manifest is a
+JSON file written next to the report.
+"""
+import json
+from pathlib import Path
+from typing import Optional
+
+from prototype.result import ResultSet
+
+VERSION = 1
+
+
+def manifest_path(report_path) -> Path:
+    """Manifest location for a report: ``<report stem>.manifest.json`` beside it."""
+    report_path = Path(report_path)
+    return report_path.with_name(report_path.stem + ".manifest.json")
+
+
+class ReportManifest:
+    """Per-pair spec/source hashes and results from the previous report run."""
+
+    def __init__(self, path, entries: Optional[dict] = None):
+        self.path = Path(path)
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path) -> "ReportManifest":
+        """Load a manifest, or return an empty one if missing or unreadable."""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path)
+        if data.get("version") != VERSION:
+            return cls(path)
+        return cls(path, data.get("pairs", {}))
+
+    @staticmethod
+    def _key(workload: str, tool: str) -> str:
+        return f"{workload}|{tool}"
+
+    def lookup(self, workload: str, tool: str, spec_hash: str, source_hash: str):
+        """Return the stored ResultSet if the pair is clean and succeeded, else None."""
+        entry = self.entries.get(self._key(workload, tool))
+        if entry is None:
+            return None
+        if entry["spec"] != spec_hash or entry["sources"] != source_hash:
+            return None
+        result = ResultSet.from_dict(entry["result"])
+        if result.exit_code != 0 or result.error:
+            return None
+        return result
+
+    def record(self, workload: str, tool: str, spec_hash: str, source_hash: str,
+               result: ResultSet):
+        """Store the hashes and result for one pair; failed results are dropped."""
+        key = self._key(workload, tool)
+        if result.exit_code != 0 or result.error:
+            self.entries.pop(key, None)
+            return
+        self.entries[key] = {
+            "spec": spec_hash,
+            "sources": source_hash,
+            "result": result.to_dict(),
+        }
+
+    def save(self):
+        """Write the manifest to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"version": VERSION, "pairs": self.entries}, f,
+                      indent=1, sort_keys=True)
@@ -0,0 +1,136 @@
+"""Opt-in memory accounting for adapter runs.
+
+``MemoryProbe`` wraps an adapter call and records
+
+- ``peak_traced_bytes``: peak Python allocation above the starting point,
+  measured with tracemalloc,
+- ``rss_delta_bytes``: change in resident set size across the call,
+- ``rss_bytes``: resident set size at the end of the call.
+
+The numbers go into ``ResultSet.metadata["memory"]``, separate from the
+tool's predicted metrics. tracemalloc slows allocation-heavy code
+considerably, so probing is only enabled on request (``validate --memory``).
+tracemalloc and RSS are process-wide, so probes in one process are
+serialized: a probe holds a module lock from entry to exit, and with the
+thread backend probed batches run one at a time. Use the process backend to
+keep ``--jobs`` parallelism while probing.
+"""
+import os
+import threading
+import tracemalloc
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+# Held by the active probe; overlapping probes would reset each other's peak
+_LOCK = threading.Lock()
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        import resource
+        import sys
+
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+
+class MemoryProbe:
+    """Context manager measuring peak traced allocation and RSS change."""
+
+    def __init__(self, scope: str = "run", specs: int = 1):
+        self.scope = scope
+        self.specs = specs
+        self.peak_traced_bytes = 0
+        self.rss_delta_bytes = 0
+        self.rss_bytes = 0
+
+    def __enter__(self):
+        _LOCK.acquire()
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._traced_start = tracemalloc.get_traced_memory()[0]
+        self._rss_start = current_rss()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            _, peak = tracemalloc.get_traced_memory()
+            self.rss_bytes = current_rss()
+            self.peak_traced_bytes = max(0, peak - self._traced_start)
+            self.rss_delta_bytes = self.rss_bytes - self._rss_start
+            if self._started:
+                tracemalloc.stop()
+        finally:
+            _LOCK.release()
+        return False
+
+    def as_metadata(self) -> dict:
+        """Memory section for ResultSet.metadata.
+
+        ``scope`` is "run" for a single spec, or "batch" when the numbers
+        cover one run_many() call over ``specs`` workloads.
+        """
+        return {
+            "scope": self.scope,
+            "specs": self.specs,
+            "peak_traced_bytes": self.peak_traced_bytes,
+            "rss_delta_bytes": self.rss_delta_bytes,
+            "rss_bytes": self.rss_bytes,
+        }
+
+    def attach(self, results):
+        """Store the measurement on every ResultSet in ``results``."""
+        memory = self.as_metadata()
+        for result in results:
+            result.metadata["memory"] = dict(memory)
+        return results
+
+
+class MemorySummary:
+    """Incremental per-tool aggregate of memory metadata.
+
+    ``as_dict()`` returns {tool: {"runs", "max_peak_traced_bytes",
+    "max_rss_delta_bytes", "max_rss_bytes"}}.
+    """
+
+    def __init__(self):
+        self.tools = {}
+
+    def add(self, result):
+        """Fold in one ResultSet; results without memory metadata are ignored."""
+        memory = result.metadata.get("memory")
+        if memory is None:
+            return
+        entry = self.tools.setdefault(result.tool, {
+            "runs": 0,
+            "max_peak_traced_bytes": 0,
+            "max_rss_delta_bytes": 0,
+            "max_rss_bytes": 0,
+        })
+        entry["runs"] += 1
+        entry["max_peak_traced_bytes"] = max(entry["max_peak_traced_bytes"],
+                                             memory["peak_traced_bytes"])
+        entry["max_rss_delta_bytes"] = max(entry["max_rss_delta_bytes"],
+                                           memory["rss_delta_bytes"])
+        entry["max_rss_bytes"] = max(entry["max_rss_bytes"], memory["rss_bytes"])
+
+    def as_dict(self) -> dict:
+        return {tool: dict(entry) for tool, entry in self.tools.items()}
+
+    def print_table(self):
+        """Print the per-tool summary, largest peak allocation first."""
+        print(f"{'Tool':<15} {'Runs':>6} {'Peak traced MB':>15} "
+              f"{'RSS delta MB':>13} {'RSS MB':>9}")
+        ordered = sorted(self.tools.items(), key=lambda kv: -kv[1]["max_peak_traced_bytes"])
+        for tool, e in ordered:
+            print(f"{tool:<15} {e['runs']:>6} {e['max_peak_traced_bytes'] / 1e6:>15.2f} "
+                  f"{e['max_rss_delta_bytes'] / 1e6:>13.2f} {e['max_rss_bytes'] / 1e6:>9.1f}")
@@ -0,0 +1,195 @@
+"""Multi-GPU parallelism model: data, tensor and pipeline parallel step time.
+
+A spec's ``hardware.count`` GPUs are split into tensor-parallel groups of
+TP GPUs, PP pipeline stages and DP = count / (TP * PP) data-parallel
+replicas, each processing ``batch_size`` samples per step. The degrees and
+knobs come from the spec's ``extra`` section:
+
+    extra:
+      tensor_parallel: 2       # TP, default 1
+      pipeline_parallel: 2     # PP, default 1
+      microbatches: 8          # pipeline microbatches, default 4 * PP
+      overlap: 0.5             # fraction of communication hidden behind compute
+
+Collectives use the ring all-reduce cost of
+scripts/cross_tool_accuracy_analysis.py::analytical_ring_allreduce::
+
+    t = 2 (n - 1) / n * msg / bw + 2 (n - 1) * latency
+
+Per step, on top of the single-GPU compute split over TP * PP GPUs:
+
+- TP: two all-reduces of a layer's activations per layer (Megatron-style),
+  four when training, over the TP group.
+- PP: a (m + PP - 1) / m bubble for m microbatches, plus m + PP - 2
+  activation sends between stages on the critical path (twice when
+  training).
+- DP (training only): one all-reduce of each replica shard's FP16 gradients
+  over the DP group.
+
+Model and optimizer state is sharded over TP * PP GPUs; activations over
+TP, and with pipelining a stage keeps its layers' activations for up to PP
+microbatches in flight (``memory_per_gpu``).
+
+Groups that fit in one node (``hardware.gpus_per_node``, default 8) use
+``hardware.interconnect``; larger ones are limited by the inter-node
+network. Every argument of ``step_time`` broadcasts, so a 1..1024 GPU sweep
+is a single call.
+"""
+from typing import NamedTuple
+
+DEFAULT_INTERCONNECT = "NVLink"
+INTER_NODE = "InfiniBand"
+DEFAULT_GPUS_PER_NODE = 8
+DEFAULT_MICROBATCHES_PER_STAGE = 4
+
+
+class Link(NamedTuple):
+    """Per-GPU bus bandwidth and per-hop latency of an interconnect."""
+
+    bw_gb_s: float
+    latency_us: float
+
+
+# NVSwitch matches the HGX-H100 ASTRA-sim microbenchmark calibration
+INTERCONNECTS = {
+    "NVSwitch":   Link(400.0, 0.93625),
+    "NVLink":     Link(300.0, 1.0),
+    "PCIe":       Link(32.0, 2.0),
+    "InfiniBand": Link(50.0, 5.0),
+    "Ethernet":   Link(12.5, 10.0),
+}
+
+
+class Parallelism(NamedTuple):
+    """How a spec's GPUs are split, as read from the spec."""
+
+    gpus: int
+    tensor: int
+    pipeline: int
+    microbatches: int
+    overlap: float
+    link: Link
+    network: Link
+    gpus_per_node: int
+
+    @property
+    def data(self) -> int:
+        return self.gpus // (self.tensor * self.pipeline)
+
+    def check(self):
+        """Raise ValueError unless ``gpus`` splits evenly into TP x PP groups."""
+        if self.gpus % (self.tensor * self.pipeline):
+            raise ValueError(
+                f"hardware.count {self.gpus} is not a multiple of "
+                f"tensor_parallel {self.tensor} x pipeline_parallel {self.pipeline}")
+
+
+def parallelism(spec) -> Parallelism:
+    """The spec's parallel layout; raises ValueError for unknown or invalid settings.
+
+    ``hardware.count`` is not checked against TP x PP here (see ``check``),
+    so a layout can be swept over other GPU counts.
+    """
+    hw, extra = spec.hardware, spec.extra
+    gpus = int(hw.get("count", 1) or 1)
+    tensor = int(extra.get("tensor_parallel", 1))
+    pipeline = int(extra.get("pipeline_parallel", 1))
+    overlap = float(extra.get("overlap", 0.0))
+    name = hw.get("interconnect") or DEFAULT_INTERCONNECT
+    if name not in INTERCONNECTS:
+        raise ValueError(f"Unknown interconnect: {name}")
+    if tensor < 1 or pipeline < 1:
+        raise ValueError(f"Parallel degrees must be >= 1, got tensor_parallel {tensor} "
+                         f"and pipeline_parallel {pipeline}")
+    if not 0.0 <= overlap <= 1.0:
+        raise ValueError(f"overlap must be between 0 and 1, got {overlap}")
+    return Parallelism(
+        gpus=gpus,
+        tensor=tensor,
+        pipeline=pipeline,
+        microbatches=int(extra.get("microbatches", DEFAULT_MICROBATCHES_PER_STAGE * pipeline)),
+        overlap=overlap,
+        link=INTERCONNECTS[name],
+        network=INTERCONNECTS[INTER_NODE],
+        gpus_per_node=int(hw.get("gpus_per_node", DEFAULT_GPUS_PER_NODE)),
+    )
+
+
+def ring_allreduce_ms(msg_bytes, n, bw_gb_s, latency_us):
+    """Ring all-reduce time over ``n`` GPUs, in milliseconds (0 for n <= 1)."""
+    import numpy as np
+
+    n = np.maximum(np.asarray(n, dtype=float), 1.0)
+    transfer_s = 2.0 * (n - 1) / n * msg_bytes / (np.asarray(bw_gb_s) * 1e9)
+    latency_s = 2.0 * (n - 1) * np.asarray(latency_us) * 1e-6
+    return (transfer_s + latency_s) * 1e3
+
+
+def _group_link(np, span, layout: Parallelism):
+    """(bandwidth, latency) of a group whose ranks span ``span`` consecutive GPUs."""
+    inside = span <= layout.gpus_per_node
+    bw = np.where(inside, layout.link.bw_gb_s,
+                  min(layout.link.bw_gb_s, layout.network.bw_gb_s))
+    latency = np.where(inside, layout.link.latency_us,
+                       max(layout.link.latency_us, layout.network.latency_us))
+    return bw, latency
+
+
+def step_time(compute_ms, layout: Parallelism, param_bytes, activation_bytes, layers,
+              training: bool, gpus=None) -> dict:
+    """Per-step time of one DP replica's batch on ``gpus`` GPUs.
+
+    ``compute_ms`` is the single-GPU time of the replica batch and
+    ``activation_bytes`` the size of one layer's activations for it.
+    ``gpus`` defaults to ``layout.gpus`` and may be an array (e.g. 1..1024);
+    counts not divisible by TP * PP give NaN. Returns arrays
+    ``step_time_ms``, ``compute_time_ms``, ``communication_time_ms`` (all
+    collectives, before overlap), ``communication_fraction`` (exposed
+    communication / step), ``scaling_efficiency`` (throughput relative to
+    ``gpus`` x one GPU) and ``data_parallel``.
+    """
+    import numpy as np
+
+    n = np.asarray(layout.gpus if gpus is None else gpus, dtype=float)
+    t, p, m = layout.tensor, layout.pipeline, layout.microbatches
+    d = n / (t * p)
+    d = np.where(d == np.floor(d), d, np.nan)
+    passes = 2 if training else 1
+
+    compute = compute_ms / (t * p) * (m + p - 1) / m
+
+    bw, latency = _group_link(np, t, layout)
+    tp_comm = layers / p * 2 * passes * ring_allreduce_ms(activation_bytes, t, bw, latency)
+
+    bw, latency = _group_link(np, t * p, layout)
+    sends = (m + p - 2) if p > 1 else 0
+    pp_comm = sends * passes * (activation_bytes / m / (bw * 1e9) + latency * 1e-6) * 1e3
+
+    bw, latency = _group_link(np, n, layout)
+    dp_comm = (ring_allreduce_ms(param_bytes / (t * p), d, bw, latency) if training
+               else np.zeros_like(d))
+
+    comm = tp_comm + pp_comm + dp_comm
+    exposed = comm - layout.overlap * np.minimum(comm, compute)
+    step = compute + exposed
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(step > 0, exposed / step, 0.0)
+        efficiency = compute_ms / (t * p * step)
+    columns = {
+        "step_time_ms": step,
+        "compute_time_ms": compute,
+        "communication_time_ms": comm,
+        "communication_fraction": fraction,
+        "scaling_efficiency": efficiency,
+    }
+    invalid = np.isnan(d)
+    columns = {k: np.where(invalid, np.nan, v) for k, v in columns.items()}
+    columns["data_parallel"] = d
+    return columns
+
+
+def memory_per_gpu(layout: Parallelism, state_bytes, activation_bytes):
+    """Peak bytes per GPU for a replica's weight/optimizer state and activations."""
+    t, p, m = layout.tensor, layout.pipeline, layout.microbatches
+    in_flight = min(p, m) / m if p > 1 else 1.0
+    return state_bytes / (t * p) + activation_bytes / (t * p) * in_flight
@@ -0,0 +1,147 @@
+"""Hot-path profiling for adapter runs.
+
+Code marks phases with ``span()``:
+
+    with profiling.span("vidur.scan", runs=12):
+        ...
+
+When profiling is disabled (the default) ``span()`` returns a shared no-op
+context manager after a single global check, so the instrumentation can stay
+in production code paths. ``enable()`` installs a Tracer that records every
+span as a Chrome trace-event ("X" complete event) with its thread id; nested
+spans show up nested in chrome://tracing or Perfetto. Optionally a cProfile
+profiler per adapter can be accumulated with ``adapter_profile()`` and dumped
+as ``<tool>.pstats`` files.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+_tracer = None
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        self.tracer.add(self.name, self.start, end, self.args)
+        return False
+
+
+class Tracer:
+    """Collects timing spans and per-adapter cProfile data."""
+
+    def __init__(self, pstats_dir=None):
+        self.events = []
+        self.pstats_dir = Path(pstats_dir) if pstats_dir else None
+        self.profiles = {}  # tool name -> cProfile.Profile
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def add(self, name, start_ns, end_ns, args):
+        """Record one completed span."""
+        event = {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (start_ns - self._origin) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = {k: str(v) if isinstance(v, Path) else v for k, v in args.items()}
+        with self._lock:
+            self.events.append(event)
+
+    def to_chrome(self) -> dict:
+        """Return the trace in Chrome trace-event JSON format."""
+        return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def save(self, path):
+        """Write the Chrome trace to ``path`` and dump any cProfile data."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome(), f)
+        if self.pstats_dir is not None:
+            self.pstats_dir.mkdir(parents=True, exist_ok=True)
+            for tool, profile in self.profiles.items():
+                profile.dump_stats(str(self.pstats_dir / f"{tool}.pstats"))
+
+
+def span(name: str, **args):
+    """Context manager timing one phase; a no-op unless profiling is enabled."""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, args)
+
+
+class _AdapterProfile:
+    __slots__ = ("profile",)
+
+    def __init__(self, profile):
+        self.profile = profile
+
+    def __enter__(self):
+        self.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profile.disable()
+        return False
+
+
+def adapter_profile(tool: str):
+    """Accumulate a cProfile profile for ``tool`` if pstats output is enabled."""
+    if _tracer is None or _tracer.pstats_dir is None:
+        return _NULL_SPAN
+    import cProfile
+
+    with _tracer._lock:
+        profile = _tracer.profiles.setdefault(tool, cProfile.Profile())
+    return _AdapterProfile(profile)
+
+
+def enable(pstats_dir=None) -> Tracer:
+    """Start recording spans (and cProfile data if ``pstats_dir`` is given)."""
+    global _tracer
+    _tracer = Tracer(pstats_dir)
+    return _tracer
+
+
+def disable():
+    """Stop recording and return the Tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def active() -> bool:
+    """True while profiling is enabled."""
+    return _tracer is not None
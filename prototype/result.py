@@ -1,33 +1,188 @@
 """ResultSet: Standardized output format for performance predictions.
 
 All tool adapters return results in this format, enabling cross-tool comparison.
+
+ResultSet is a slotted class because sweeps keep hundreds of thousands of
+them alive. A tool's raw output (e.g. Timeloop stdout) is held by a
+``RawOutput`` handle when it is longer than ``SPILL_CHARS`` characters: the
+text is written once to a content-addressed blob file and read back only when
+``raw_output`` is accessed. Blobs live under ``$MLPERF_MODEL_BLOB_DIR``
+(default: ``blobs/`` in the result cache directory, so they are private to
+the user and ``$MLPERF_MODEL_CACHE_DIR``) until ``remove_blobs()``
+(``cache clear``) deletes them. An existing blob is reused only when its size
+matches; otherwise it is rewritten atomically.
 """
-from dataclasses import dataclass, field
+import os
+from pathlib import Path
 from typing import Optional
 
+# Raw outputs longer than this many characters are spilled to a blob file
+SPILL_CHARS = 4096
+
+
+def blob_dir() -> Path:
+    """Directory of spilled raw-output blobs."""
+    env = os.environ.get("MLPERF_MODEL_BLOB_DIR")
+    if env:
+        return Path(env)
+    from prototype.cache import default_cache_dir
+
+    return default_cache_dir() / "blobs"
+
+
+def remove_blobs() -> int:
+    """Delete every spilled raw-output blob. Returns the number removed.
+
+    Results still holding a handle to a removed blob read back None.
+    """
+    root = blob_dir()
+    if not root.exists():
+        return 0
+    removed = 0
+    for path in root.glob("*/*"):
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+class RawOutput:
+    """Handle to a tool's raw output that was spilled to a blob file."""
+
+    __slots__ = ("path",)
+
+    def __init__(self, text: str):
+        import hashlib
+
+        data = text.encode()
+        digest = hashlib.sha256(data).hexdigest()
+        path = blob_dir() / digest[:2] / digest
+        try:
+            intact = path.stat().st_size == len(data)
+        except OSError:
+            intact = False
+        if not intact:
+            import tempfile
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        self.path = str(path)
+
+    def read(self) -> Optional[str]:
+        """The raw output text; None (with a warning) if its blob has been deleted."""
+        try:
+            with open(self.path) as f:
+                return f.read()
+        except OSError as e:
+            import logging
+
+            logging.getLogger(__name__).warning("Raw output blob unavailable: %s", e)
+            return None
+
+    def __eq__(self, other):
+        if not isinstance(other, RawOutput):
+            return NotImplemented
+        return self.path == other.path
+
+    def __repr__(self):
+        return f"RawOutput(blob={os.path.basename(self.path)[:12]})"
+
+
+def spill(text, spill_chars: int = SPILL_CHARS):
+    """``text`` itself if short (or None), else a RawOutput handle to its blob."""
+    if text is None or isinstance(text, RawOutput) or len(text) <= spill_chars:
+        return text
+    return RawOutput(text)
+
 
-@dataclass
 class ResultSet:
-    """Standardized result from a performance prediction/simulation."""
+    """Standardized result from a performance prediction/simulation.
+
+    ``metrics`` can include: latency_ms, throughput_samples_s, energy_uj,
+    cycles, utilization, memory_gb, flops, communication_time_ms.
+    ``metadata`` holds run bookkeeping that is not a tool prediction, e.g.
+    "memory" from prototype.memprobe.
+    """
+
+    __slots__ = ("tool", "workload", "metrics", "_raw", "exit_code", "error", "metadata")
+
+    def __init__(self, tool: str, workload: str, metrics: Optional[dict] = None,
+                 raw_output=None, exit_code: int = 0, error: Optional[str] = None,
+                 metadata: Optional[dict] = None):
+        self.tool = tool
+        self.workload = workload
+        self.metrics = {} if metrics is None else metrics
+        self.raw_output = raw_output
+        self.exit_code = exit_code
+        self.error = error
+        self.metadata = {} if metadata is None else metadata
+
+    @property
+    def raw_output(self) -> Optional[str]:
+        """Raw tool output, loaded from its blob on access if it was spilled."""
+        raw = self._raw
+        return raw.read() if isinstance(raw, RawOutput) else raw
 
-    tool: str
-    workload: str
-    metrics: dict = field(default_factory=dict)
-    # metrics can include: latency_ms, throughput_samples_s, energy_uj,
-    # cycles, utilization, memory_gb, flops, communication_time_ms
+    @raw_output.setter
+    def raw_output(self, value):
+        self._raw = spill(value)
 
-    raw_output: Optional[str] = None
-    exit_code: int = 0
-    error: Optional[str] = None
+    @property
+    def raw_output_ref(self):
+        """The stored raw output (text, RawOutput handle or None) without reading a blob."""
+        return self._raw
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"ResultSet(tool={self.tool!r}, workload={self.workload!r}, "
+                f"metrics={self.metrics!r}, raw_output={self._raw!r}, "
+                f"exit_code={self.exit_code!r}, error={self.error!r}, "
+                f"metadata={self.metadata!r})")
 
     def to_dict(self) -> dict:
-        return {
+        data = {
             "tool": self.tool,
             "workload": self.workload,
             "metrics": self.metrics,
             "exit_code": self.exit_code,
             "error": self.error,
         }
+        if self.metadata:
+            data["metadata"] = self.metadata
+        return data
+
+    def with_workload(self, workload: str) -> "ResultSet":
+        """Copy of this result attributed to another, equivalent workload."""
+        return ResultSet(
+            tool=self.tool,
+            workload=workload,
+            metrics=dict(self.metrics),
+            raw_output=self._raw,
+            exit_code=self.exit_code,
+            error=self.error,
+            metadata=dict(self.metadata),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResultSet":
+        """Create from a dictionary produced by to_dict()."""
+        return cls(
+            tool=data["tool"],
+            workload=data["workload"],
+            metrics=data.get("metrics", {}),
+            raw_output=data.get("raw_output"),
+            exit_code=data.get("exit_code", 0),
+            error=data.get("error"),
+            metadata=data.get("metadata", {}),
+        )
 
     def print_summary(self):
         """Print a human-readable summary."""
@@ -42,28 +197,30 @@ class ResultSet:
                 print(f"  {key}: {value}")
 
     @staticmethod
-    def print_comparison(results: list):
-        """Print a comparison table across multiple results."""
-        if not results:
-            return
+    def print_comparison(results):
+        """Print a comparison table across multiple results.
 
-        # Collect all metric keys
-        all_keys = set()
-        for r in results:
-            all_keys.update(r.metrics.keys())
-        all_keys = sorted(all_keys)
+        ``results`` is a list of ResultSets or a ``prototype.store.ResultStore``.
+        """
+        from prototype.store import ResultStore
+
+        store = results if isinstance(results, ResultStore) else ResultStore.from_results(results)
+        if not len(store):
+            return
 
         # Header
-        tool_names = [r.tool for r in results]
+        tool_names = store.column("tool").tolist()
         header = f"{'Metric':<30}" + "".join(f"{t:<20}" for t in tool_names)
         print(header)
         print("-" * len(header))
 
         # Rows
-        for key in all_keys:
+        for key in sorted(store.metric_names()):
             row = f"{key:<30}"
-            for r in results:
-                val = r.metrics.get(key, "N/A")
+            for i in range(len(store)):
+                val = store.value(i, key)
+                if val is None:
+                    val = "N/A"
                 if isinstance(val, float):
                     row += f"{val:<20.4f}"
                 else:
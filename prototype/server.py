@@ -0,0 +1,268 @@
+"""Long-lived prediction daemon for ``mlperf-model serve``.
+
+The daemon keeps adapter instances and their parsed data sources (see
+``prototype.sources``) warm in memory and answers queries over HTTP, either on
+a localhost TCP port or on a Unix domain socket. Requests are handled by a
+bounded thread pool.
+
+Endpoints:
+    GET  /health     liveness probe
+    GET  /tools      adapter metadata
+    POST /predict    {"tool": "analytical", "workload": {...WorkloadSpec...}}
+                     -> ResultSet JSON
+                     {"requests": [{"tool": ..., "workload": ...}, ...]}
+                     -> {"results": [...]}; each tool gets its specs in one
+                     run_many() call
+    POST /reload     drop warm data sources and re-create adapters
+
+A watcher thread polls the adapters' source fingerprints and reloads an
+adapter automatically when its data files change on disk.
+"""
+import json
+import os
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from prototype import sources
+from prototype.adapters import list_adapters
+from prototype.cache import source_fingerprint
+from prototype.result import ResultSet
+from prototype.workload import WorkloadSpec
+
+
+class PredictionService:
+    """Warm adapters plus the request logic shared by every transport."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.adapters = {}
+        self._fingerprints = {}
+        for name, adapter_cls in list_adapters().items():
+            self.adapters[name] = adapter_cls()
+            self._fingerprints[name] = source_fingerprint(self.adapters[name])
+
+    def tools(self) -> list:
+        """Static metadata for every adapter."""
+        return [
+            {
+                "name": name,
+                "category": a.category,
+                "metrics": a.supported_metrics,
+                "workloads": a.supported_workloads,
+            }
+            for name, a in self.adapters.items()
+        ]
+
+    def predict(self, requests: list) -> list:
+        """Resolve a batch of {"tool", "workload"} requests, preserving order."""
+        results = [None] * len(requests)
+        by_tool = {}
+        for i, req in enumerate(requests):
+            if not isinstance(req, dict):
+                results[i] = self._error("", "", "Request must be a JSON object")
+                continue
+            tool = str(req.get("tool", "")).lower()
+            try:
+                spec = WorkloadSpec.from_dict(req["workload"])
+            except (KeyError, TypeError) as e:
+                results[i] = self._error(tool, "", f"Invalid workload: {e}")
+                continue
+            adapter = self.adapters.get(tool)
+            if adapter is None:
+                results[i] = self._error(tool, spec.name, f"Unknown tool '{tool}'")
+                continue
+            try:
+                supported = adapter.supports(spec)
+            except Exception as e:
+                results[i] = self._error(tool, spec.name, f"Invalid workload: {e!r}")
+                continue
+            if supported:
+                by_tool.setdefault(tool, []).append((i, spec))
+            else:
+                results[i] = self._error(tool, spec.name, "Tool does not support this workload")
+
+        for tool, items in by_tool.items():
+            for (i, _), result in zip(items, self._run_many(tool, [spec for _, spec in items])):
+                results[i] = result
+        return results
+
+    def _run_many(self, tool, specs: list) -> list:
+        """Result dicts for ``specs``; if the batch raises, each spec runs alone."""
+        adapter = self.adapters[tool]
+        try:
+            return [result.to_dict() for result in adapter.run_many(specs)]
+        except Exception:
+            pass
+        results = []
+        for spec in specs:
+            try:
+                results.append(adapter.run(spec).to_dict())
+            except Exception as e:
+                results.append(self._error(tool, spec.name, f"Tool failed: {e!r}"))
+        return results
+
+    def reload(self, tool=None) -> list:
+        """Drop warm state for one adapter (or all). Returns the reloaded tool names."""
+        names = [tool] if tool else list(self.adapters)
+        with self._lock:
+            for name in names:
+                adapter = self.adapters[name]
+                for path in adapter.source_paths():
+                    sources.invalidate(path)
+                self.adapters[name] = type(adapter)()
+                self._fingerprints[name] = source_fingerprint(self.adapters[name])
+        return names
+
+    def check_sources(self) -> list:
+        """Reload every adapter whose source fingerprint changed. Returns their names."""
+        changed = [
+            name for name, adapter in self.adapters.items()
+            if source_fingerprint(adapter) != self._fingerprints[name]
+        ]
+        for name in changed:
+            self.reload(name)
+        return changed
+
+    @staticmethod
+    def _error(tool, workload, message) -> dict:
+        return ResultSet(tool=tool, workload=workload, error=message, exit_code=1).to_dict()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "mlperf-model"
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == "/health":
+            self._reply(200, {"status": "ok"})
+        elif self.path == "/tools":
+            self._reply(200, service.tools())
+        else:
+            self._reply(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._reply(400, {"error": f"Invalid JSON: {e}"})
+            return
+        if not isinstance(body, dict):
+            self._reply(400, {"error": "Request body must be a JSON object"})
+            return
+        try:
+            self._post(body)
+        except Exception as e:
+            self.log_error("%s failed: %r", self.path, e)
+            self._reply(500, {"error": f"Internal error: {e!r}"})
+
+    def _post(self, body: dict):
+        service = self.server.service
+        if self.path == "/predict":
+            if "requests" in body:
+                if not isinstance(body["requests"], list):
+                    self._reply(400, {"error": "'requests' must be a JSON array"})
+                    return
+                self._reply(200, {"results": service.predict(body["requests"])})
+            else:
+                self._reply(200, service.predict([body])[0])
+        elif self.path == "/reload":
+            tool = body.get("tool")
+            if tool is not None and not isinstance(tool, str):
+                self._reply(400, {"error": "'tool' must be a string"})
+                return
+            if tool and tool not in service.adapters:
+                self._reply(404, {"error": f"Unknown tool '{tool}'"})
+                return
+            self._reply(200, {"reloaded": service.reload(tool)})
+        else:
+            self._reply(404, {"error": f"Unknown path {self.path}"})
+
+
+class _PooledMixin:
+    """Dispatch each connection to a bounded worker pool instead of a new thread."""
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process_pooled, request, client_address)
+
+    def _process_pooled(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+class _TCPServer(_PooledMixin, HTTPServer):
+    pass
+
+
+class _UnixServer(_PooledMixin, socketserver.UnixStreamServer):
+    pass
+
+
+def make_server(service, host="127.0.0.1", port=8765, socket_path=None,
+                workers=4, quiet=False):
+    """Bind a pooled HTTP server for ``service`` on a TCP port or Unix socket."""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _UnixServer(socket_path, _Handler)
+    else:
+        server = _TCPServer((host, port), _Handler)
+    server.service = service
+    server.quiet = quiet
+    server.pool = ThreadPoolExecutor(max_workers=workers)
+    return server
+
+
+def watch_sources(service, interval: float, stop: threading.Event, log=print):
+    """Poll adapter source fingerprints every ``interval`` seconds until ``stop`` is set."""
+    while not stop.wait(interval):
+        for name in service.check_sources():
+            log(f"Source data changed, reloaded {name}")
+
+
+def serve(host="127.0.0.1", port=8765, socket_path=None, workers=4,
+          watch_interval=2.0, quiet=False):
+    """Run the daemon until interrupted."""
+    service = PredictionService()
+    server = make_server(service, host, port, socket_path, workers, quiet)
+    stop = threading.Event()
+    if watch_interval > 0:
+        threading.Thread(
+            target=watch_sources, args=(service, watch_interval, stop), daemon=True
+        ).start()
+
+    where = socket_path if socket_path else f"http://{host}:{port}"
+    print(f"mlperf-model serving {len(service.adapters)} tool(s) on {where} "
+          f"({workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+        server.pool.shutdown(wait=False)
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
@@ -0,0 +1,105 @@
+"""Streaming JSONL result files.
+
+``validate --output results.jsonl`` writes one compact JSON line per
+ResultSet as soon as it is produced instead of a single JSON document at the
+end, so a crash keeps everything written so far and memory does not grow with
+the size of the matrix. Every line is an object with a ``record`` field:
+
+    {"record": "header", "format": "mlperf-model-results", "version": 1}
+    {"record": "result", "tool": ..., "workload": ..., "metrics": {...}, ...}
+    ...
+    {"record": "summary", "total_runs": 13, "passed": 12, "failed": 1, ...}
+
+The summary trailer is only present if the run finished. The reader helpers
+iterate the file lazily and locate the trailer by reading the tail of the file,
+so both stay at constant memory regardless of file size.
+"""
+import json
+import os
+import time
+from typing import Optional
+
+from prototype.result import ResultSet
+
+FORMAT = "mlperf-model-results"
+VERSION = 1
+
+
+class JsonlResultSink:
+    """Append-only writer of ResultSets, one JSON line each."""
+
+    def __init__(self, path, flush_interval: float = 1.0, **header):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.count = 0
+        self._f = open(path, "w")
+        self._last_flush = time.monotonic()
+        self._write({"record": "header", "format": FORMAT, "version": VERSION, **header})
+
+    def _write(self, record: dict):
+        self._f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self._f.flush()
+            self._last_flush = now
+
+    def write(self, result: ResultSet):
+        """Append one result."""
+        self._write({"record": "result", **result.to_dict()})
+        self.count += 1
+
+    def close(self, summary: Optional[dict] = None):
+        """Write the summary trailer (if given) and close the file."""
+        if self._f.closed:
+            return
+        if summary is not None:
+            self._write({"record": "summary", **summary})
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def iter_records(path):
+    """Yield every record in a JSONL result file, skipping a truncated last line."""
+    with open(path) as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # A crash can leave the final line half-written
+                return
+
+
+def iter_results(path):
+    """Lazily yield the ResultSets stored in a JSONL result file."""
+    for record in iter_records(path):
+        if record.get("record") == "result":
+            yield ResultSet.from_dict(record)
+
+
+def read_header(path) -> dict:
+    """Return the header record of a JSONL result file."""
+    with open(path) as f:
+        return json.loads(f.readline())
+
+
+def read_summary(path, tail_bytes: int = 65536) -> Optional[dict]:
+    """Return the summary trailer, or None if the run did not finish."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - tail_bytes))
+        lines = f.read().splitlines()
+    if not lines:
+        return None
+    try:
+        record = json.loads(lines[-1])
+    except ValueError:
+        return None
+    return record if record.get("record") == "summary" else None
@@ -0,0 +1,71 @@
+"""In-memory cache of parsed adapter data sources.
+
+Adapters that read pre-computed results (VIDUR run directories, the NeuSight
+and ASTRA-sim result JSONs) and the hardware catalog load them through this
+module. Each file is parsed
+once per process and then served from memory, which keeps a long-lived
+``mlperf-model serve`` daemon warm. Call ``invalidate()`` when the files change
+on disk; the daemon's watcher does this automatically.
+"""
+import csv
+import json
+import threading
+from pathlib import Path
+
+from prototype import profiling
+
+_lock = threading.Lock()
+_loaded = {}  # (kind, path) -> parsed contents
+
+
+def _load(kind, path, parse):
+    key = (kind, str(path))
+    data = _loaded.get(key)
+    if data is None:
+        with profiling.span(f"sources.{kind}_parse", path=path):
+            data = parse(path)
+        with _lock:
+            _loaded[key] = data
+    return data
+
+
+def _parse_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _parse_csv(path):
+    with open(path) as f:
+        return list(csv.DictReader(f))
+
+
+def load(kind: str, path, parse):
+    """Return ``parse(path)``, parsed once per process until invalidated.
+
+    ``kind`` namespaces the entry so one file can be cached in several forms.
+    """
+    return _load(kind, path, parse)
+
+
+def load_json(path):
+    """Return the parsed JSON document at ``path``."""
+    return _load("json", path, _parse_json)
+
+
+def load_csv(path):
+    """Return the rows of the CSV file at ``path`` as a list of dicts."""
+    return _load("csv", path, _parse_csv)
+
+
+def invalidate(prefix=None) -> int:
+    """Forget cached files under ``prefix`` (or all files). Returns the number dropped."""
+    with _lock:
+        if prefix is None:
+            dropped = len(_loaded)
+            _loaded.clear()
+            return dropped
+        prefix = Path(prefix)
+        stale = [k for k in _loaded if Path(k[1]) == prefix or prefix in Path(k[1]).parents]
+        for k in stale:
+            del _loaded[k]
+        return len(stale)
@@ -0,0 +1,411 @@
+"""Columnar store of prediction results.
+
+``ResultStore`` keeps results as one row per (workload fingerprint, tool)
+instead of a list of ResultSets with per-result metric dicts:
+
+- key columns ``fingerprint``, ``workload`` and ``tool``, plus ``exit_code``
+  and ``error``,
+- one typed array per metric (int64, float64, or object for strings and
+  lists) with a boolean validity mask for rows that lack the metric.
+
+Appends are buffered and folded into the arrays on the next read, so building
+a store is amortized O(1) per row. Appending an existing key replaces its
+row. ``filter()``, ``take()`` and ``group_by()`` work on whole columns. A
+store round-trips through ``save()``/``load()`` as ``.npz``, as Parquet when
+the path ends in ``.parquet`` and pyarrow is installed, or as a memory-mapped
+``.mlpa`` archive (see prototype.archive). Raw output and
+run metadata are not stored.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+
+from prototype.result import ResultSet
+
+KEY_COLUMNS = ("fingerprint", "workload", "tool")
+FORMAT_VERSION = 1
+
+
+def _dtype_of(values) -> np.dtype:
+    """Narrowest column dtype holding every value in ``values``."""
+    kind = np.int64
+    for v in values:
+        if isinstance(v, bool) or not isinstance(v, (int, float)):
+            return np.dtype(object)
+        if isinstance(v, float):
+            kind = np.float64
+    return np.dtype(kind)
+
+
+def _merge_dtype(a: np.dtype, b: np.dtype) -> np.dtype:
+    if a == b:
+        return a
+    if a.kind in "if" and b.kind in "if":
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+def _empty(dtype: np.dtype, n: int) -> np.ndarray:
+    if dtype.kind == "f":
+        return np.full(n, np.nan)
+    if dtype.kind == "O":
+        return np.full(n, None, dtype=object)
+    return np.zeros(n, dtype=dtype)
+
+
+def _object_array(values) -> np.ndarray:
+    # Assign element-wise so list values stay scalars of the array
+    out = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        out[i] = v
+    return out
+
+
+def check_format(path):
+    """Raise RuntimeError if ``path`` needs a writer that is not installed."""
+    if Path(path).suffix == ".parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)") from None
+
+
+class ResultStore:
+    """Columnar (fingerprint, tool)-keyed result table."""
+
+    def __init__(self):
+        self._size = 0
+        self._keys = {k: np.empty(0, dtype=object) for k in KEY_COLUMNS}
+        self._exit_code = np.empty(0, dtype=np.int64)
+        self._error = np.empty(0, dtype=object)
+        self._metrics = {}  # name -> (values, valid)
+        self._index = {}    # (fingerprint, tool) -> row
+        self._pending = []  # rows appended since the last consolidation
+
+    @classmethod
+    def from_results(cls, results, fingerprints=None) -> "ResultStore":
+        """Build a store from ResultSets, keyed by ``fingerprints`` (default: workload names)."""
+        store = cls()
+        if fingerprints is None:
+            for r in results:
+                store.append(r, r.workload)
+        else:
+            for r, fp in zip(results, fingerprints):
+                store.append(r, fp)
+        return store
+
+    # -- building ------------------------------------------------------
+
+    def append(self, result: ResultSet, fingerprint: str) -> int:
+        """Add ``result`` under (fingerprint, result.tool); returns its row."""
+        key = (fingerprint, result.tool)
+        row = self._index.get(key)
+        if row is not None:
+            self._consolidate()
+            self._replace(row, result)
+            return row
+        row = self._size + len(self._pending)
+        self._index[key] = row
+        self._pending.append((fingerprint, result))
+        return row
+
+    def extend(self, results, fingerprints):
+        """Append many results with their fingerprints."""
+        for result, fp in zip(results, fingerprints):
+            self.append(result, fp)
+
+    def _consolidate(self):
+        """Fold buffered rows into the column arrays."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        n_old, n_new = self._size, len(pending)
+        results = [r for _, r in pending]
+
+        keys = {
+            "fingerprint": [fp for fp, _ in pending],
+            "workload": [r.workload for r in results],
+            "tool": [r.tool for r in results],
+        }
+        for k in KEY_COLUMNS:
+            self._keys[k] = np.concatenate([self._keys[k], _object_array(keys[k])])
+        self._exit_code = np.concatenate(
+            [self._exit_code, np.array([r.exit_code for r in results], dtype=np.int64)])
+        self._error = np.concatenate([self._error, _object_array([r.error for r in results])])
+
+        names = list(self._metrics)
+        seen = set(names)
+        for r in results:
+            for name in r.metrics:
+                if name not in seen:
+                    seen.add(name)
+                    names.append(name)
+
+        for name in names:
+            raw = [r.metrics.get(name) for r in results]
+            new_valid = np.array([name in r.metrics for r in results], dtype=bool)
+            dtype = _dtype_of(v for v, ok in zip(raw, new_valid) if ok)
+            if name in self._metrics:
+                values, valid = self._metrics[name]
+            else:
+                values, valid = _empty(dtype, n_old), np.zeros(n_old, dtype=bool)
+            dtype = _merge_dtype(values.dtype, dtype)
+            if dtype.kind == "O":
+                new_values = _object_array(raw)
+            else:
+                fill = np.nan if dtype.kind == "f" else 0
+                new_values = np.array([v if ok else fill for v, ok in zip(raw, new_valid)],
+                                      dtype=dtype)
+            self._metrics[name] = (
+                np.concatenate([values.astype(dtype, copy=False), new_values]),
+                np.concatenate([valid, new_valid]),
+            )
+        self._size = n_old + n_new
+
+    def _replace(self, row: int, result: ResultSet):
+        self._keys["workload"][row] = result.workload
+        self._exit_code[row] = result.exit_code
+        self._error[row] = result.error
+        for name, (values, valid) in list(self._metrics.items()):
+            if name not in result.metrics:
+                valid[row] = False
+        for name, value in result.metrics.items():
+            if name not in self._metrics:
+                dtype = _dtype_of([value])
+                self._metrics[name] = (_empty(dtype, self._size),
+                                       np.zeros(self._size, dtype=bool))
+            values, valid = self._metrics[name]
+            dtype = _merge_dtype(values.dtype, _dtype_of([value]))
+            if dtype != values.dtype:
+                values = values.astype(dtype)
+                self._metrics[name] = (values, valid)
+            values[row] = value
+            valid[row] = True
+
+    # -- reading -------------------------------------------------------
+
+    def __len__(self):
+        return self._size + len(self._pending)
+
+    def column(self, name: str) -> np.ndarray:
+        """Key column, ``exit_code``, ``error``, or a metric's value array."""
+        self._consolidate()
+        if name in self._keys:
+            return self._keys[name]
+        if name == "exit_code":
+            return self._exit_code
+        if name == "error":
+            return self._error
+        return self._metrics[name][0]
+
+    def metric(self, name: str) -> tuple:
+        """(values, valid) arrays of one metric."""
+        self._consolidate()
+        return self._metrics[name]
+
+    def metric_names(self) -> list:
+        """Metric names in order of first appearance."""
+        self._consolidate()
+        return list(self._metrics)
+
+    def index(self, fingerprint: str, tool: str):
+        """Row of (fingerprint, tool), or None."""
+        return self._index.get((fingerprint, tool))
+
+    def value(self, row: int, name: str):
+        """Python value of metric ``name`` at ``row``, or None if missing."""
+        self._consolidate()
+        values, valid = self._metrics.get(name, (None, None))
+        if values is None or not valid[row]:
+            return None
+        value = values[row]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def row(self, row: int) -> ResultSet:
+        """Rebuild the ResultSet stored at ``row``."""
+        self._consolidate()
+        return ResultSet(
+            tool=self._keys["tool"][row],
+            workload=self._keys["workload"][row],
+            metrics={name: self.value(row, name)
+                     for name, (_, valid) in self._metrics.items() if valid[row]},
+            exit_code=int(self._exit_code[row]),
+            error=self._error[row],
+        )
+
+    def get(self, fingerprint: str, tool: str):
+        """ResultSet for (fingerprint, tool), or None."""
+        row = self.index(fingerprint, tool)
+        return None if row is None else self.row(row)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self.row(row)
+
+    # -- relational ----------------------------------------------------
+
+    def take(self, rows) -> "ResultStore":
+        """New store holding the given rows, in order."""
+        self._consolidate()
+        rows = np.asarray(rows, dtype=np.intp)
+        out = ResultStore()
+        out._size = len(rows)
+        out._keys = {k: v[rows] for k, v in self._keys.items()}
+        out._exit_code = self._exit_code[rows]
+        out._error = self._error[rows]
+        out._metrics = {name: (values[rows], valid[rows])
+                        for name, (values, valid) in self._metrics.items()
+                        if valid[rows].any()}
+        out._index = {(fp, tool): i for i, (fp, tool) in enumerate(
+            zip(out._keys["fingerprint"].tolist(), out._keys["tool"].tolist()))}
+        return out
+
+    def mask(self, ok=None, **equals) -> np.ndarray:
+        """Boolean row mask: ``ok`` on exit status plus column == value tests."""
+        self._consolidate()
+        m = np.ones(self._size, dtype=bool)
+        if ok is not None:
+            m &= (self._exit_code == 0) == ok
+        for name, value in equals.items():
+            m &= self.column(name) == value
+        return m
+
+    def filter(self, mask=None, ok=None, **equals) -> "ResultStore":
+        """Rows matching ``mask`` (a boolean array) and the ``mask()`` tests."""
+        m = self.mask(ok, **equals)
+        if mask is not None:
+            m &= mask
+        return self.take(np.flatnonzero(m))
+
+    def group_by(self, name: str) -> dict:
+        """Map each distinct value of column ``name`` to its row indices."""
+        values = self.column(name)
+        groups = {}
+        for row, value in enumerate(values.tolist()):
+            groups.setdefault(value, []).append(row)
+        return {k: np.array(v, dtype=np.intp) for k, v in groups.items()}
+
+    # -- persistence ---------------------------------------------------
+
+    def _json_metrics(self) -> list:
+        return [name for name, (values, _) in self._metrics.items() if values.dtype.kind == "O"]
+
+    def _encoded(self, name: str) -> np.ndarray:
+        """Metric values with object columns JSON-encoded as strings."""
+        values, valid = self._metrics[name]
+        if values.dtype.kind != "O":
+            return values
+        return np.array([json.dumps(v) if ok else "" for v, ok in zip(values, valid)],
+                        dtype=str)
+
+    def save(self, path):
+        """Write the store to ``path`` (.npz, .mlpa, or .parquet if pyarrow is available)."""
+        self._consolidate()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".parquet":
+            return self._save_parquet(path)
+        if path.suffix == ".mlpa":
+            from prototype.archive import write_archive
+
+            return write_archive(path, self)
+
+        arrays = {f"key.{k}": v.astype(str) for k, v in self._keys.items()}
+        arrays["exit_code"] = self._exit_code
+        arrays["error.valid"] = np.array([e is not None for e in self._error], dtype=bool)
+        arrays["error"] = np.array(["" if e is None else e for e in self._error], dtype=str)
+        arrays["metric_names"] = np.array(list(self._metrics), dtype=str)
+        arrays["json_metrics"] = np.array(self._json_metrics(), dtype=str)
+        arrays["version"] = np.array(FORMAT_VERSION)
+        for i, (name, (_, valid)) in enumerate(self._metrics.items()):
+            arrays[f"metric.{i}"] = self._encoded(name)
+            arrays[f"valid.{i}"] = valid
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+
+    def _save_parquet(self, path):
+        check_format(path)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = {f"key.{k}": pa.array(v.tolist(), type=pa.string())
+                   for k, v in self._keys.items()}
+        columns["exit_code"] = pa.array(self._exit_code)
+        columns["error"] = pa.array(self._error.tolist(), type=pa.string())
+        for name, (_, valid) in self._metrics.items():
+            columns[f"metric.{name}"] = pa.array(self._encoded(name), mask=~valid)
+        table = pa.table(columns).replace_schema_metadata({
+            "version": str(FORMAT_VERSION),
+            "json_metrics": json.dumps(self._json_metrics()),
+        })
+        pq.write_table(table, path)
+
+    @classmethod
+    def load(cls, path) -> "ResultStore":
+        """Read a store written by ``save()``."""
+        path = Path(path)
+        if path.suffix == ".parquet":
+            return cls._load_parquet(path)
+        if path.suffix == ".mlpa":
+            from prototype.archive import ResultArchive
+
+            with ResultArchive(path) as archive:
+                return archive.to_store()
+
+        with np.load(path, allow_pickle=False) as data:
+            keys = {k: data[f"key.{k}"].astype(object) for k in KEY_COLUMNS}
+            error = data["error"].astype(object)
+            error[~data["error.valid"]] = None
+            json_metrics = set(data["json_metrics"].tolist())
+            metrics = {}
+            for i, name in enumerate(data["metric_names"].tolist()):
+                values, valid = data[f"metric.{i}"], data[f"valid.{i}"]
+                if name in json_metrics:
+                    values = _object_array([json.loads(v) if ok else None
+                                            for v, ok in zip(values.tolist(), valid)])
+                metrics[name] = (values, valid)
+            return cls._from_columns(keys, data["exit_code"], error, metrics)
+
+    @classmethod
+    def _load_parquet(cls, path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        meta = table.schema.metadata or {}
+        json_metrics = set(json.loads(meta.get(b"json_metrics", b"[]")))
+        keys = {k: np.array(table.column(f"key.{k}").to_pylist(), dtype=object)
+                for k in KEY_COLUMNS}
+        error = _object_array(table.column("error").to_pylist())
+        metrics = {}
+        for col in table.column_names:
+            if not col.startswith("metric."):
+                continue
+            name = col[len("metric."):]
+            column = table.column(col)
+            valid = ~column.is_null().to_numpy(zero_copy_only=False)
+            if name in json_metrics:
+                values = _object_array([None if v is None else json.loads(v)
+                                        for v in column.to_pylist()])
+            elif pa.types.is_string(column.type):
+                values = _object_array(column.to_pylist())
+            else:
+                values = column.fill_null(0).to_numpy(zero_copy_only=False)
+                if values.dtype.kind == "f":
+                    values = np.where(valid, values, np.nan)
+            metrics[name] = (values, valid)
+        exit_code = table.column("exit_code").to_numpy(zero_copy_only=False).astype(np.int64)
+        return cls._from_columns(keys, exit_code, error, metrics)
+
+    @classmethod
+    def _from_columns(cls, keys, exit_code, error, metrics):
+        store = cls()
+        store._size = len(exit_code)
+        store._keys = keys
+        store._exit_code = np.asarray(exit_code, dtype=np.int64)
+        store._error = error
+        store._metrics = metrics
+        store._index = {(fp, tool): i for i, (fp, tool) in enumerate(
+            zip(keys["fingerprint"].tolist(), keys["tool"].tolist()))}
+        return store
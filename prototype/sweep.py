@@ -0,0 +1,69 @@
+"""Parameter sweeps over a base WorkloadSpec.
+
+A sweep takes a base spec plus one or more axes, each a dotted field path and
+a list of values:
+
+    batch_size=1,2,4,8          explicit values
+    hardware.count=1..8         inclusive integer range
+    batch_size=1..256:*2        geometric range (1, 2, 4, ..., 256)
+    hardware.device=A100,H100   strings are kept as-is
+
+Axes given on the command line are merged over any ``axes`` the base spec
+already declares as a template (see ``WorkloadSpec.expand``). The cartesian
+product is expanded lazily and handed to each adapter in
+chunks. Adapters with a vectorized batch path (``ToolAdapter.batched``) get the
+whole chunk through ``run_many``; the rest fall back to the parallel executor.
+"""
+import dataclasses
+import itertools
+
+from prototype.workload import WorkloadSpec, axis_values
+
+
+def _scalar(text: str):
+    """Parse an axis value as int, then float, else keep the string."""
+    for conv in (int, float):
+        try:
+            return conv(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_axis(text: str) -> tuple:
+    """Parse ``path=values`` into (path, [values])."""
+    path, sep, values = text.partition("=")
+    if not sep or not path or not values:
+        raise ValueError(f"Invalid axis '{text}' (expected path=values)")
+
+    if ".." in values and "," not in values:
+        start, _, rest = values.partition("..")
+        stop, _, step = rest.partition(":")
+        start, stop = int(start), int(stop)
+        if step.startswith("*"):
+            try:
+                return path.strip(), axis_values(
+                    {"start": start, "stop": stop, "factor": int(step[1:])})
+            except ValueError:
+                raise ValueError(f"Invalid geometric range in axis '{text}'") from None
+        return path.strip(), axis_values(
+            {"start": start, "stop": stop, "step": int(step) if step else 1})
+
+    return path.strip(), [_scalar(v.strip()) for v in values.split(",") if v.strip()]
+
+
+def template(base: WorkloadSpec, axes: list) -> WorkloadSpec:
+    """Return ``base`` with the (path, values) ``axes`` merged over its own axes."""
+    merged = dict(base.axes)
+    merged.update(axes)
+    return dataclasses.replace(base, axes=merged)
+
+
+def chunked(iterable, size: int):
+    """Yield lists of at most ``size`` items without materializing the iterable."""
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
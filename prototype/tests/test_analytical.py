@@ -0,0 +1,91 @@
+"""Tests for the analytical adapter's roofline and cost models."""
+import pytest
+
+from prototype.adapters.analytical_adapter import AnalyticalAdapter, roofline
+from prototype.costmodel import ADAM_FLOPS, ADAM_TRAFFIC_BYTES, training_step
+from prototype.workload import WorkloadSpec
+
+
+def _spec(**hardware):
+    return WorkloadSpec.from_dict({
+        "name": "resnet50",
+        "model_type": "cnn",
+        "model": {"name": "ResNet-50"},
+        "hardware": dict({"device": "A100"}, **hardware),
+    })
+
+
+def test_roofline_bytes_follow_precision():
+    fp16 = roofline(["GPT-2"], ["H100"], [1], "fp16")
+    fp32 = roofline(["GPT-2"], ["H100"], [1], "fp32")
+    int8 = roofline(["GPT-2"], ["H100"], [1], "int8")
+    assert fp32["memory_gb"][0] == pytest.approx(2 * fp16["memory_gb"][0])
+    assert int8["memory_gb"][0] == pytest.approx(fp16["memory_gb"][0] / 2)
+    # Memory bound at batch 1, so latency scales with the bytes moved
+    assert int8["latency_ms"][0] == pytest.approx(fp16["latency_ms"][0] / 2)
+
+
+def test_unaccelerated_precision_is_invalid():
+    assert not roofline(["ResNet-50"], ["A100"], [1], "fp8")["valid"][0]
+
+
+def test_spec_precision_in_run_and_run_many():
+    adapter = AnalyticalAdapter()
+    specs = [_spec(), _spec(precision="fp32"), _spec(precision="int8"), _spec(precision="fp8")]
+    batch = adapter.run_many(specs)
+    assert batch == [adapter.run(spec) for spec in specs]
+    fp16, fp32, int8, fp8 = batch
+    assert fp32.metrics["memory_gb"] == pytest.approx(2 * fp16.metrics["memory_gb"], rel=0.02)
+    assert int8.metrics["latency_ms"] < fp16.metrics["latency_ms"]
+    assert fp8.exit_code == 1 and "precision" in fp8.error
+
+
+def test_malformed_batch_size_is_an_error_result():
+    adapter = AnalyticalAdapter()
+    good = _spec()
+    bad = WorkloadSpec.from_dict(dict(good.to_dict(), name="bad", batch_size="abc"))
+    results = adapter.run_many([good, bad])
+    assert results[0] == adapter.run(good)
+    assert results[1].exit_code == 1
+    assert results[1].error == "batch_size is not a number: 'abc'"
+    assert adapter.run(bad).error == results[1].error
+
+
+def test_training_step_costmodel():
+    cols = training_step([2.0, 2.0], 1e12, 1e9, 312.0, 2039.0, [False, True])
+    assert cols["backward_ms"].tolist() == [4.0, 4.0]
+    assert cols["recompute_ms"].tolist() == [0.0, 2.0]
+    optimizer = max(1e9 * ADAM_FLOPS / 312e12, 1e9 * ADAM_TRAFFIC_BYTES / 2039e9) * 1000
+    assert cols["optimizer_ms"][0] == pytest.approx(optimizer)
+    assert cols["step_ms"].tolist() == pytest.approx([6.0 + optimizer, 8.0 + optimizer])
+    assert cols["flops"][1] == pytest.approx(4e12 + 1e9 * ADAM_FLOPS)
+
+
+def _training(**extra):
+    return WorkloadSpec.from_dict(dict(_spec().to_dict(), task="training", batch_size=32,
+                                       extra=extra))
+
+
+def test_training_step_metrics():
+    adapter = AnalyticalAdapter()
+    inference = adapter.run(WorkloadSpec.from_dict(dict(_training().to_dict(), task="inference")))
+    m = adapter.run(_training()).metrics
+    assert m["forward_time_ms"] == pytest.approx(inference.metrics["latency_ms"], abs=1e-3)
+    assert m["backward_time_ms"] == pytest.approx(2 * m["forward_time_ms"], abs=1e-3)
+    assert m["recompute_time_ms"] == 0.0
+    assert m["latency_ms"] == m["step_time_ms"] == pytest.approx(
+        m["forward_time_ms"] + m["backward_time_ms"] + m["optimizer_time_ms"], abs=1e-3)
+    assert m["throughput_samples_s"] == pytest.approx(32 * 1000 / m["latency_ms"], rel=1e-4)
+    assert m["peak_memory_gb"] > m["activation_memory_gb"] > 0
+
+
+def test_recompute_trades_time_for_memory():
+    adapter = AnalyticalAdapter()
+    plain = adapter.run(_training()).metrics
+    redo = adapter.run(_training(recompute=True)).metrics
+    assert redo["recompute"] is True
+    assert redo["recompute_time_ms"] == pytest.approx(redo["forward_time_ms"])
+    assert redo["latency_ms"] > plain["latency_ms"]
+    assert redo["activation_memory_gb"] < plain["activation_memory_gb"]
+    assert adapter.run_many([_training(), _training(recompute=True)]) == [
+        adapter.run(_training()), adapter.run(_training(recompute=True))]
@@ -0,0 +1,67 @@
+"""Tests for memory-mapped result archives."""
+import numpy as np
+import pytest
+
+from prototype.archive import ResultArchive, write_archive
+from prototype.result import ResultSet
+from prototype.store import ResultStore
+
+RESULTS = [
+    ResultSet("analytical", "resnet50", {"latency_ms": 1.25, "gpus": 8, "bound": "compute"}),
+    ResultSet("vidur", "resnet50", {"latency_ms": 2.5, "phases": [1, 2]}),
+    ResultSet("neusight", "llama", exit_code=1, error="No results"),
+    ResultSet("analytical", "llama", {"gpus": 2}),
+]
+
+
+def _as_dicts(results):
+    return [(r.tool, r.workload, r.metrics, r.exit_code, r.error) for r in results]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = tmp_path / "results.mlpa"
+    write_archive(path, ResultStore.from_results(RESULTS, ["fp-a", "fp-a", "fp-b", "fp-b"]))
+    with ResultArchive(path) as archive:
+        yield archive
+
+
+def test_rows_round_trip(archive):
+    assert len(archive) == 4
+    assert _as_dicts(archive) == _as_dicts(RESULTS)
+    assert _as_dicts(archive.to_store()) == _as_dicts(RESULTS)
+    assert archive.keys("fingerprint") == ["fp-a", "fp-a", "fp-b", "fp-b"]
+
+
+def test_find(archive):
+    assert archive.find("vidur", fingerprint="fp-a") == 1
+    assert archive.find("analytical", workload="llama") == 3
+    assert archive.find("vidur", workload="llama") is None
+    with pytest.raises(ValueError):
+        archive.find("vidur")
+
+
+def test_numeric_metrics_are_views(archive):
+    values, valid = archive.metric("latency_ms")
+    assert not values.flags.owndata
+    assert valid.tolist() == [True, True, False, False]
+    np.testing.assert_array_equal(values[valid], [1.25, 2.5])
+    phases, valid = archive.metric("phases")
+    assert phases[1] == [1, 2] and valid.tolist() == [False, True, False, False]
+
+
+def test_store_save_load_round_trip(tmp_path):
+    path = tmp_path / "store.mlpa"
+    ResultStore.from_results(RESULTS).save(path)
+    assert _as_dicts(ResultStore.load(path)) == _as_dicts(RESULTS)
+
+
+def test_rejects_other_files(tmp_path):
+    empty = tmp_path / "empty.mlpa"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError, match="is empty"):
+        ResultArchive(empty)
+    other = tmp_path / "other.mlpa"
+    other.write_bytes(b"x" * 128)
+    with pytest.raises(ValueError, match="not a result archive"):
+        ResultArchive(other)
@@ -0,0 +1,41 @@
+"""Tests for the struct-of-arrays WorkloadBatch."""
+import numpy as np
+import pytest
+
+from prototype.batch import WorkloadBatch
+from prototype.workload import WorkloadSpec
+
+
+def _spec(name, **fields):
+    data = {"name": name, "model_type": "cnn", "model": {"name": "ResNet-50"},
+            "hardware": {"device": "A100"}}
+    data.update(fields)
+    return WorkloadSpec.from_dict(data)
+
+
+def test_columns():
+    specs = [
+        _spec("a", batch_size=8, model={"name": "ResNet-50", "parameters": "7e9"}),
+        _spec("b", hardware={"device": "H100", "count": 4}),
+        _spec("c", batch_size="16"),
+    ]
+    batch = WorkloadBatch.from_specs(specs)
+    assert batch.column("batch_size").tolist() == [8, 1, 16]
+    assert batch.column("gpu_count").tolist() == [1, 4, 1]
+    np.testing.assert_array_equal(batch.column("parameters"), [7e9, np.nan, np.nan])
+    assert batch.column("device").tolist() == ["A100", "H100", "A100"]
+    assert batch.categories["device"] == ["A100", "H100"]
+    assert batch.index("device", ["H100"]).tolist() == [-1, 0, -1]
+    assert batch.isin("device", {"A100"}).tolist() == [True, False, True]
+    assert batch[1] is specs[1]
+    assert [s.name for s in batch.take([2, 0])] == ["c", "a"]
+
+
+def test_non_numeric_value_raises():
+    with pytest.raises(ValueError, match="batch_size is not a number: 'abc'"):
+        WorkloadBatch.from_specs([_spec("a", batch_size="abc")])
+
+
+def test_unknown_column():
+    with pytest.raises(KeyError):
+        WorkloadBatch.from_specs([_spec("a")], columns=("nope",))
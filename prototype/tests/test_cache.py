@@ -0,0 +1,120 @@
+"""Tests for the persistent result cache."""
+import os
+import shutil
+
+from prototype import costmodel
+from prototype.adapters.analytical_adapter import AnalyticalAdapter
+from prototype.adapters.base import ToolAdapter
+from prototype.cache import ResultCache, run_cached
+from prototype.result import ResultSet
+from prototype.workload import WorkloadSpec
+
+RESNET = WorkloadSpec.from_dict({
+    "name": "resnet50",
+    "model_type": "cnn",
+    "model": {"name": "ResNet-50"},
+    "hardware": {"device": "A100"},
+})
+
+
+class CountingAdapter(ToolAdapter):
+    """Returns one metric and counts how often it actually ran."""
+
+    name = "counting"
+    category = "analytical"
+    supported_metrics = ["latency_ms"]
+    supported_workloads = ["cnn"]
+
+    def __init__(self, source=None, fail=False):
+        self.source = source
+        self.fail = fail
+        self.calls = 0
+
+    def source_paths(self):
+        return [self.source] if self.source else []
+
+    def supports(self, spec):
+        return True
+
+    def run(self, spec):
+        self.calls += 1
+        if self.fail:
+            return ResultSet(self.name, spec.name, error="boom", exit_code=1)
+        return ResultSet(self.name, spec.name, metrics={"latency_ms": 1.5})
+
+
+def _touch(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_cost_model_edits_invalidate_analytical_keys(tmp_path, monkeypatch):
+    copy = tmp_path / "costmodel.py"
+    shutil.copy(costmodel.__file__, copy)
+    monkeypatch.setattr(costmodel, "__file__", str(copy))
+    adapter = AnalyticalAdapter()
+    before = ResultCache(tmp_path / "cache").key(adapter, RESNET)
+    _touch(copy)
+    assert ResultCache(tmp_path / "cache").key(adapter, RESNET) != before
+
+
+def test_round_trip_through_disk(tmp_path):
+    adapter = CountingAdapter()
+    first = run_cached(adapter, RESNET, ResultCache(tmp_path))
+    second = run_cached(adapter, RESNET, ResultCache(tmp_path))
+    assert adapter.calls == 1
+    assert second.metrics == first.metrics == {"latency_ms": 1.5}
+    assert second.workload == "resnet50"
+
+
+def test_hits_ignore_spec_names(tmp_path):
+    adapter = CountingAdapter()
+    cache = ResultCache(tmp_path)
+    run_cached(adapter, RESNET, cache)
+    renamed = WorkloadSpec.from_dict(dict(RESNET.to_dict(), name="other"))
+    result = run_cached(adapter, renamed, cache)
+    assert adapter.calls == 1
+    assert result.workload == "other"
+
+
+def test_failures_are_not_cached(tmp_path):
+    adapter = CountingAdapter(fail=True)
+    cache = ResultCache(tmp_path)
+    run_cached(adapter, RESNET, cache)
+    run_cached(adapter, RESNET, cache)
+    assert adapter.calls == 2
+    assert cache.entries() == []
+
+
+def test_hits_are_independent_copies(tmp_path):
+    cache = ResultCache(tmp_path)
+    run_cached(CountingAdapter(), RESNET, cache)
+    key = cache.key(CountingAdapter(), RESNET)
+    cache.get(key).metrics["latency_ms"] = 99
+    assert cache.get(key).metrics == {"latency_ms": 1.5}
+
+
+def test_source_edits_invalidate(tmp_path):
+    source = tmp_path / "results.json"
+    source.write_text("{}")
+    adapter = CountingAdapter(source)
+    run_cached(adapter, RESNET, ResultCache(tmp_path / "cache"))
+    run_cached(adapter, RESNET, ResultCache(tmp_path / "cache"))
+    assert adapter.calls == 1
+    source.write_text('{"changed": true}')
+    run_cached(adapter, RESNET, ResultCache(tmp_path / "cache"))
+    assert adapter.calls == 2
+
+
+def test_eviction_keeps_cache_under_budget(tmp_path):
+    adapter = CountingAdapter()
+    cache = ResultCache(tmp_path, max_bytes=1000)
+    for i in range(20):
+        spec = WorkloadSpec.from_dict(dict(RESNET.to_dict(), batch_size=i + 1))
+        run_cached(adapter, spec, cache)
+    assert adapter.calls == 20
+    kept = len(cache.entries())
+    assert 0 < kept < 20
+    assert cache.size() <= 1000
+    assert cache.clear() == kept
+    assert cache.entries() == []
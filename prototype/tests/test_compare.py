@@ -0,0 +1,49 @@
+"""Tests for the cross-tool comparison engine."""
+import numpy as np
+import pytest
+
+from prototype.compare import Comparison
+from prototype.result import ResultSet
+from prototype.store import ResultStore
+
+
+def _store():
+    rows = [
+        ("w1", "a", {"latency_ms": 10.0}),
+        ("w1", "b", {"avg_e2e_time_s": 0.02}),
+        ("w1", "c", {"cycles": 5e6}),
+        ("w2", "a", {"latency_ms": 4.0}),
+        ("w2", "b", {"avg_e2e_time_s": 0.004}),
+        ("w2", "c", {"cycles": 5e6}),
+    ]
+    results = [ResultSet(tool=t, workload=w, metrics=m) for w, t, m in rows]
+    return ResultStore.from_results(results, [w for w, _, _ in rows])
+
+
+def test_units_are_normalized():
+    comparison = Comparison(_store())
+    assert comparison.tools == ["a", "b", "c"]
+    np.testing.assert_allclose(comparison.grid("latency_ms"), [[10.0, np.nan, 5.0],
+                                                              [4.0, np.nan, 5.0]])
+    np.testing.assert_allclose(comparison.grid("e2e_time_ms")[:, 1], [20.0, 4.0])
+
+
+def test_ape_against_reference():
+    comparison = Comparison(_store(), reference="a")
+    np.testing.assert_allclose(comparison.ape("latency_ms")[:, 2], [50.0, 25.0])
+    [row] = comparison.summary()
+    assert (row["tool"], row["reference"], row["workloads"]) == ("c", "a", 2)
+    assert row["mape_pct"] == pytest.approx(37.5)
+
+
+def test_fixed_tools_are_left_out_of_agreement():
+    comparison = Comparison(_store(), fixed=["c"])
+    assert "c" in comparison.tools
+    assert not comparison.summary()
+    with pytest.raises(ValueError, match="ignores the workload"):
+        Comparison(_store(), reference="c", fixed=["c"])
+
+
+def test_unknown_reference():
+    with pytest.raises(ValueError, match="no results"):
+        Comparison(_store(), reference="zzz")
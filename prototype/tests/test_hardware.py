@@ -0,0 +1,80 @@
+"""Tests for the hardware catalog."""
+import os
+import shutil
+
+import pytest
+
+from prototype import hardware
+from prototype.adapters.analytical_adapter import AnalyticalAdapter
+from prototype.server import PredictionService
+from prototype.workload import WorkloadSpec, fits_in_memory
+
+RESNET = {
+    "name": "resnet50",
+    "model_type": "cnn",
+    "model": {"name": "ResNet-50"},
+    "batch_size": 1,
+    "hardware": {"device": "A100"},
+}
+
+
+def _latency(service):
+    return service.predict([{"tool": "analytical", "workload": RESNET}])[0]["metrics"]["latency_ms"]
+
+
+def _edit(path, old, new):
+    text = path.read_text()
+    assert old in text
+    path.write_text(text.replace(old, new))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_aliases_resolve_to_sku():
+    catalog = hardware.catalog()
+    assert catalog.resolve("a100").name == "A100-SXM4-80GB"
+    assert catalog.resolve("NVIDIA_A100-PCIE-40GB").name == "A100-PCIE-40GB"
+    assert catalog.resolve("no-such-gpu") is None
+
+
+def test_tool_names_do_not_borrow_from_family():
+    catalog = hardware.catalog()
+    assert catalog.tool_name("A100", "neusight") == "NVIDIA_A100-PCIE-40GB"
+    assert catalog.tool_name("A100-SXM4-80GB", "neusight") is None
+    assert catalog.tool_name("H100-PCIe", "neusight") is None
+    assert catalog.tool_name("H100-PCIe", "vidur") == "h100"
+
+
+def test_reload_picks_up_catalog_edits(tmp_path, monkeypatch):
+    path = tmp_path / "hw.yaml"
+    shutil.copy(hardware.CATALOG_PATH, path)
+    monkeypatch.setenv("MLPERF_MODEL_HARDWARE", str(path))
+    service = PredictionService()
+    before = _latency(service)
+
+    _edit(path, "peak_tflops: {fp32: 19.5, tf32: 156, bf16: 312, fp16: 312,",
+          "peak_tflops: {fp32: 19.5, tf32: 156, bf16: 312, fp16: 156,")
+    assert "analytical" in service.check_sources()
+    assert _latency(service) > before
+
+    spec = WorkloadSpec.from_dict(RESNET)
+    assert AnalyticalAdapter().run(spec).metrics["latency_ms"] == _latency(service)
+
+
+def test_bytes_per_value_follows_precision():
+    assert [hardware.bytes_per_value(p) for p in ("fp32", "fp16", "fp8", "int4")] == [4, 2, 1, 0.5]
+    with pytest.raises(ValueError):
+        hardware.bytes_per_value("fp64")
+
+
+@pytest.mark.parametrize("precision, fits", [(None, False), ("fp16", False), ("fp8", True)])
+def test_fits_in_memory_uses_spec_precision(precision, fits):
+    spec = {
+        "name": "gpt3",
+        "model_type": "llm",
+        "model": {"name": "GPT-3", "parameters": 175e9},
+        "hardware": {"device": "H100", "count": 3},  # 240 GB
+    }
+    if precision:
+        spec["hardware"]["precision"] = precision
+    assert fits_in_memory(WorkloadSpec.from_dict(spec)) is fits
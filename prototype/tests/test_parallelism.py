@@ -0,0 +1,125 @@
+"""Tests for the multi-GPU parallelism model."""
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from prototype.adapters.analytical_adapter import AnalyticalAdapter
+from prototype.parallelism import INTERCONNECTS, parallelism, ring_allreduce_ms, step_time
+from prototype.workload import WorkloadSpec
+
+CONFIGS = Path(__file__).resolve().parents[1] / "configs"
+
+
+def _spec(count=8, task="inference", **extra):
+    return WorkloadSpec.from_dict({
+        "name": "resnet50",
+        "model_type": "cnn",
+        "model": {"name": "ResNet-50"},
+        "task": task,
+        "batch_size": 32,
+        "hardware": {"device": "A100", "count": count},
+        "extra": extra,
+    })
+
+
+def test_ring_allreduce():
+    # 2 (n - 1) / n * msg / bw + 2 (n - 1) * latency
+    expected = (2 * 3 / 4 * 1e9 / 300e9 + 2 * 3 * 1e-6) * 1e3
+    assert ring_allreduce_ms(1e9, 4, 300.0, 1.0) == pytest.approx(expected)
+    assert ring_allreduce_ms(1e9, 1, 300.0, 1.0) == 0.0
+
+
+def test_layout_from_spec():
+    layout = parallelism(_spec(16, tensor_parallel=2, pipeline_parallel=2))
+    assert (layout.gpus, layout.tensor, layout.pipeline, layout.data) == (16, 2, 2, 4)
+    assert layout.microbatches == 8
+    assert layout.link == INTERCONNECTS["NVLink"]
+    with pytest.raises(ValueError, match="not a multiple"):
+        parallelism(_spec(6, tensor_parallel=4)).check()
+    with pytest.raises(ValueError, match="Unknown interconnect"):
+        parallelism(WorkloadSpec.from_dict(dict(
+            _spec().to_dict(), hardware={"device": "A100", "interconnect": "Carrier pigeon"})))
+    with pytest.raises(ValueError, match="overlap"):
+        parallelism(_spec(overlap=2))
+
+
+def test_step_time_on_one_gpu_is_compute():
+    layout = parallelism(_spec(1))
+    cols = step_time(5.0, layout, param_bytes=1e9, activation_bytes=1e6, layers=50,
+                     training=True)
+    assert cols["step_time_ms"] == pytest.approx(5.0)
+    assert cols["communication_time_ms"] == 0.0
+    assert cols["scaling_efficiency"] == pytest.approx(1.0)
+
+
+def test_data_parallel_training_all_reduces_gradients():
+    layout = parallelism(_spec(8))
+    cols = step_time(5.0, layout, param_bytes=1e9, activation_bytes=1e6, layers=50,
+                     training=True)
+    link = INTERCONNECTS["NVLink"]
+    assert cols["communication_time_ms"] == pytest.approx(
+        ring_allreduce_ms(1e9, 8, link.bw_gb_s, link.latency_us))
+    assert cols["step_time_ms"] == pytest.approx(5.0 + cols["communication_time_ms"])
+    inference = step_time(5.0, layout, 1e9, 1e6, 50, training=False)
+    assert inference["step_time_ms"] == pytest.approx(5.0)
+
+
+def test_indivisible_counts_are_nan():
+    layout = parallelism(_spec(8, tensor_parallel=4))
+    cols = step_time(5.0, layout, 1e9, 1e6, 50, training=False, gpus=np.arange(1, 9))
+    assert np.isnan(cols["step_time_ms"]).tolist() == [True, True, True, False,
+                                                      True, True, True, False]
+    assert cols["data_parallel"][[3, 7]].tolist() == [1, 2]
+
+
+def test_data_parallel_inference_scales_throughput():
+    adapter = AnalyticalAdapter()
+    one = adapter.run(_spec(1)).metrics
+    eight = adapter.run(_spec(8)).metrics
+    assert eight["latency_ms"] == one["latency_ms"]
+    assert eight["throughput_samples_s"] == pytest.approx(8 * one["throughput_samples_s"],
+                                                          rel=1e-3)
+    assert (eight["data_parallel"], eight["scaling_efficiency"]) == (8, 1.0)
+
+
+def test_tensor_parallel_splits_compute():
+    adapter = AnalyticalAdapter()
+    one = adapter.run(_spec(1)).metrics
+    tp = adapter.run(_spec(2, tensor_parallel=2)).metrics
+    assert tp["data_parallel"] == 1
+    assert tp["communication_time_ms"] > 0
+    assert tp["latency_ms"] == pytest.approx(
+        one["latency_ms"] / 2 + tp["communication_time_ms"], abs=1e-3)
+
+
+@pytest.mark.parametrize("task", ["inference", "training"])
+def test_scaling_matches_run(task):
+    adapter = AnalyticalAdapter()
+    cols = adapter.scaling(_spec(1, task), [1, 2, 4, 8])
+    for i, count in enumerate([1, 2, 4, 8]):
+        metrics = adapter.run(_spec(count, task)).metrics
+        assert cols["step_time_ms"][i] == pytest.approx(metrics["latency_ms"], abs=1e-4)
+        assert cols["throughput_samples_s"][i] == pytest.approx(
+            metrics["throughput_samples_s"], abs=0.01)
+
+
+def test_invalid_layout_is_an_error_result():
+    result = AnalyticalAdapter().run(_spec(6, tensor_parallel=4))
+    assert result.exit_code == 1
+    assert "not a multiple" in result.error
+    assert math.isnan(AnalyticalAdapter().scaling(_spec(6, tensor_parallel=4), [6])
+                      ["step_time_ms"][0])
+
+
+def test_tensor_parallel_llm_generation():
+    base = WorkloadSpec.from_yaml(str(CONFIGS / "llama2_7b_serving_a100.yaml"))
+    adapter = AnalyticalAdapter()
+    tp = WorkloadSpec.from_dict(dict(base.to_dict(), hardware=dict(base.hardware, count=2),
+                                     extra=dict(base.extra, tensor_parallel=2)))
+    one, two = adapter.run(base).metrics, adapter.run(tp).metrics
+    assert two["avg_ttft_s"] < one["avg_ttft_s"]
+    assert two["avg_tpot_s"] < one["avg_tpot_s"]
+    assert two["avg_e2e_time_s"] == pytest.approx(
+        two["avg_ttft_s"] + two["avg_tpot_s"] * two["output_tokens"], rel=1e-3)
@@ -0,0 +1,48 @@
+"""Tests for span tracing and per-adapter cProfile output."""
+import asyncio
+import json
+
+from prototype import profiling
+from prototype.adapters.analytical_adapter import AnalyticalAdapter
+from prototype.cache import run_cached, run_cached_async
+from prototype.workload import WorkloadSpec
+
+RESNET = WorkloadSpec.from_dict({
+    "name": "resnet50",
+    "model_type": "cnn",
+    "model": {"name": "ResNet-50"},
+    "hardware": {"device": "A100"},
+})
+
+
+def _profiled(tmp_path, run):
+    profiling.enable(tmp_path)
+    try:
+        run()
+    finally:
+        tracer = profiling.disable()
+    tracer.save(tmp_path / "trace.json")
+    return tracer
+
+
+def test_span_is_a_no_op_when_disabled():
+    assert not profiling.active()
+    with profiling.span("x.y"):
+        pass
+
+
+def test_run_cached_writes_spans_and_pstats(tmp_path):
+    tracer = _profiled(tmp_path, lambda: run_cached(AnalyticalAdapter(), RESNET))
+    names = {e["name"] for e in json.loads((tmp_path / "trace.json").read_text())["traceEvents"]}
+    assert "analytical.run" in names
+    assert (tmp_path / "analytical.pstats").exists()
+    assert tracer.profiles["analytical"].getstats()
+
+
+def test_run_cached_async_profiles_offloaded_adapters(tmp_path):
+    tracer = _profiled(tmp_path,
+                       lambda: asyncio.run(run_cached_async(AnalyticalAdapter(), RESNET)))
+    assert (tmp_path / "analytical.pstats").exists()
+    functions = {entry.code.co_name for entry in tracer.profiles["analytical"].getstats()
+                 if hasattr(entry.code, "co_name")}
+    assert "run" in functions
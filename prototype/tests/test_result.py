@@ -0,0 +1,31 @@
+"""Tests for ResultSet raw-output spilling."""
+from pathlib import Path
+
+from prototype.result import SPILL_CHARS, RawOutput, ResultSet, blob_dir, remove_blobs
+
+
+def test_blobs_default_under_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("MLPERF_MODEL_BLOB_DIR", raising=False)
+    monkeypatch.setenv("MLPERF_MODEL_CACHE_DIR", str(tmp_path))
+    assert blob_dir() == tmp_path / "blobs"
+    monkeypatch.setenv("MLPERF_MODEL_BLOB_DIR", str(tmp_path / "elsewhere"))
+    assert blob_dir() == tmp_path / "elsewhere"
+
+
+def test_spill_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLPERF_MODEL_BLOB_DIR", str(tmp_path))
+    text = "x" * (SPILL_CHARS + 1)
+    result = ResultSet("tool", "w", raw_output=text)
+    assert result.raw_output == text
+    assert list(tmp_path.glob("*/*")) == [Path(RawOutput(text).path)]
+    assert remove_blobs() == 1
+    assert result.raw_output is None
+
+
+def test_truncated_blob_is_rewritten(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLPERF_MODEL_BLOB_DIR", str(tmp_path))
+    text = "y" * (SPILL_CHARS + 1)
+    path = Path(RawOutput(text).path)
+    path.write_text(text[:10])
+    assert RawOutput(text).read() == text
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
@@ -0,0 +1,131 @@
+"""Tests for the prediction daemon's HTTP endpoints."""
+import http.client
+import json
+import threading
+
+import pytest
+
+from prototype.server import PredictionService, make_server
+
+RESNET = {
+    "name": "resnet50",
+    "model_type": "cnn",
+    "model": {"name": "ResNet-50"},
+    "batch_size": 1,
+    "hardware": {"device": "A100"},
+}
+
+
+@pytest.fixture(scope="module")
+def service():
+    return PredictionService()
+
+
+@pytest.fixture(scope="module")
+def server(service):
+    server = make_server(service, port=0, workers=2, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    server.pool.shutdown(wait=True)
+
+
+def _request(server, method, path, body=None):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    payload = body if isinstance(body, (str, bytes)) or body is None else json.dumps(body)
+    conn.request(method, path, body=payload)
+    response = conn.getresponse()
+    data = json.loads(response.read())
+    conn.close()
+    return response.status, data
+
+
+def test_health_and_tools(server):
+    assert _request(server, "GET", "/health") == (200, {"status": "ok"})
+    status, tools = _request(server, "GET", "/tools")
+    assert status == 200
+    assert "analytical" in {t["name"] for t in tools}
+
+
+def test_predict_single(server):
+    status, result = _request(server, "POST", "/predict",
+                              {"tool": "analytical", "workload": RESNET})
+    assert status == 200
+    assert result["exit_code"] == 0
+    assert result["metrics"]["latency_ms"] > 0
+
+
+def test_batch_isolates_bad_items(server):
+    bad = dict(RESNET, name="bad", model="foo")
+    status, data = _request(server, "POST", "/predict", {"requests": [
+        {"tool": "analytical", "workload": RESNET},
+        {"tool": "analytical", "workload": bad},
+        {"tool": "nope", "workload": RESNET},
+        {"tool": "analytical"},
+        7,
+    ]})
+    assert status == 200
+    ok, malformed, unknown, missing, scalar = data["results"]
+    assert ok["exit_code"] == 0
+    assert malformed["exit_code"] == 1 and "Invalid workload" in malformed["error"]
+    assert unknown["error"] == "Unknown tool 'nope'"
+    assert "Invalid workload" in missing["error"]
+    assert scalar["error"] == "Request must be a JSON object"
+
+
+def test_malformed_workload_gets_an_error_reply(server):
+    status, result = _request(server, "POST", "/predict",
+                              {"tool": "analytical", "workload": dict(RESNET, model="foo")})
+    assert status == 200
+    assert result["exit_code"] == 1
+
+
+def test_run_many_failure_falls_back_per_spec(service, monkeypatch):
+    adapter = service.adapters["analytical"]
+
+    def broken(specs):
+        raise RuntimeError("batch failed")
+
+    monkeypatch.setattr(adapter, "run_many", broken)
+    [result] = service.predict([{"tool": "analytical", "workload": RESNET}])
+    assert result["exit_code"] == 0
+
+
+@pytest.mark.parametrize("body, message", [
+    ("[1, 2]", "Request body must be a JSON object"),
+    ("3", "Request body must be a JSON object"),
+    ({"requests": 5}, "'requests' must be a JSON array"),
+])
+def test_predict_rejects_bad_shapes(server, body, message):
+    assert _request(server, "POST", "/predict", body) == (400, {"error": message})
+
+
+def test_invalid_json(server):
+    status, data = _request(server, "POST", "/predict", "{not json")
+    assert status == 400
+    assert data["error"].startswith("Invalid JSON")
+
+
+def test_reload(server):
+    status, data = _request(server, "POST", "/reload", {"tool": "analytical"})
+    assert (status, data) == (200, {"reloaded": ["analytical"]})
+    assert _request(server, "POST", "/reload", {"tool": "nope"})[0] == 404
+    assert _request(server, "POST", "/reload", {"tool": ["analytical"]}) == (
+        400, {"error": "'tool' must be a string"})
+
+
+def test_unknown_paths(server):
+    assert _request(server, "GET", "/nope")[0] == 404
+    assert _request(server, "POST", "/nope", {})[0] == 404
+
+
+def test_handler_failure_is_a_json_500(server, service, monkeypatch):
+    def crash(requests):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(service, "predict", crash)
+    status, data = _request(server, "POST", "/predict", {"tool": "analytical", "workload": RESNET})
+    assert status == 500
+    assert "boom" in data["error"]
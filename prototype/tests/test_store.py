@@ -0,0 +1,55 @@
+"""Tests for the columnar ResultStore."""
+import pytest
+
+from prototype.result import ResultSet
+from prototype.store import ResultStore
+
+
+def _results():
+    return [
+        ResultSet("analytical", "resnet50", {"latency_ms": 1.25, "gpus": 8, "bound": "compute"}),
+        ResultSet("vidur", "resnet50", {"latency_ms": 2.5, "phases": [1, 2]}),
+        ResultSet("neusight", "llama", exit_code=1, error="No results"),
+        ResultSet("analytical", "llama", {"gpus": 2}),
+    ]
+
+
+def _as_dicts(results):
+    return [(r.tool, r.workload, r.metrics, r.exit_code, r.error) for r in results]
+
+
+def test_rows_round_trip_in_memory():
+    results = _results()
+    store = ResultStore.from_results(results, ["fp-a", "fp-a", "fp-b", "fp-b"])
+    assert len(store) == 4
+    assert _as_dicts(store) == _as_dicts(results)
+    assert store.get("fp-b", "analytical").metrics == {"gpus": 2}
+    assert store.get("fp-b", "vidur") is None
+    assert store.metric_names() == ["latency_ms", "gpus", "bound", "phases"]
+    assert store.column("gpus").dtype.kind == "i"
+
+
+def test_append_replaces_existing_key():
+    store = ResultStore.from_results(_results())
+    store.append(ResultSet("vidur", "resnet50", {"latency_ms": 3.0}), "resnet50")
+    assert len(store) == 4
+    assert store.get("resnet50", "vidur").metrics == {"latency_ms": 3.0}
+
+
+def test_filter_and_group_by():
+    store = ResultStore.from_results(_results())
+    ok = store.filter(ok=True, tool="analytical")
+    assert [r.workload for r in ok] == ["resnet50", "llama"]
+    assert store.group_by("workload")["llama"].tolist() == [2, 3]
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".parquet"])
+def test_save_load_round_trip(tmp_path, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    results = _results()
+    path = tmp_path / f"results{suffix}"
+    ResultStore.from_results(results).save(path)
+    loaded = ResultStore.load(path)
+    assert _as_dicts(loaded) == _as_dicts(results)
+    assert loaded.get("llama", "neusight").error == "No results"
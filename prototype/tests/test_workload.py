@@ -0,0 +1,111 @@
+"""Tests for WorkloadSpec templates and fingerprints."""
+import pickle
+
+import pytest
+
+from prototype.workload import WorkloadSpec, axis_values
+
+TEMPLATE = {
+    "name": "llama-{hardware.device}-x{hardware.count}-b{batch_size}",
+    "model_type": "llm",
+    "model": {"name": "Llama-2-70B", "parameters": 70e9},
+    "hardware": {"device": "A100"},
+    "axes": {
+        "batch_size": {"start": 1, "stop": 8, "factor": 2},
+        "hardware.device": ["A100", "H100"],
+        "hardware.count": {"start": 1, "stop": 2},
+    },
+}
+
+
+def test_axis_values():
+    assert axis_values([3, 1]) == [3, 1]
+    assert axis_values(7) == [7]
+    assert axis_values({"start": 1, "stop": 5}) == [1, 2, 3, 4, 5]
+    assert axis_values({"start": 0, "stop": 10, "step": 5}) == [0, 5, 10]
+    assert axis_values({"start": 1, "stop": 100, "factor": 4}) == [1, 4, 16, 64]
+    with pytest.raises(ValueError):
+        axis_values({"start": 0, "stop": 8, "factor": 2})
+
+
+def test_expand_cartesian_product():
+    spec = WorkloadSpec.from_dict(TEMPLATE)
+    assert spec.is_template()
+    specs = list(spec.expand())
+    assert len(specs) == 4 * 2 * 2
+    assert specs[0].name == "llama-A100-x1-b1"
+    assert specs[-1].name == "llama-H100-x2-b8"
+    assert (specs[-1].batch_size, specs[-1].hardware) == (8, {"device": "H100", "count": 2})
+    assert not any(s.is_template() for s in specs)
+    assert spec.hardware == {"device": "A100"}  # the template is left untouched
+
+
+def test_expand_labels_untemplated_names():
+    spec = WorkloadSpec.from_dict(dict(TEMPLATE, name="sweep", axes={"batch_size": [1, 2]}))
+    pairs = list(spec.expand(with_points=True))
+    assert [(s.name, p) for s, p in pairs] == [("sweep[batch_size=1]", (1,)),
+                                              ("sweep[batch_size=2]", (2,))]
+
+
+def test_concrete_spec_expands_to_itself():
+    spec = WorkloadSpec.from_dict(dict(TEMPLATE, name="one", axes={}))
+    assert list(spec.expand()) == [spec]
+    assert list(spec.expand([lambda s: False])) == []
+
+
+def test_named_and_callable_filters():
+    # 70B fp16 weights need 140 GB: one 80 GB device is too small, two fit
+    spec = WorkloadSpec.from_dict(dict(TEMPLATE, filters=["fits_in_memory"]))
+    counts = {s.hardware["count"] for s in spec.expand()}
+    assert counts == {2}
+    small = list(spec.expand([lambda s: s.batch_size <= 2]))
+    assert [s.batch_size for s in small] == [1, 1, 2, 2]
+
+
+def test_unknown_filter_raises_on_expand():
+    spec = WorkloadSpec.from_dict(dict(TEMPLATE, filters=["fits_in_memory", "nope"]))
+    with pytest.raises(ValueError, match="Unknown filter 'nope'. Available: fits_in_memory"):
+        spec.expand()
+
+
+def _resnet(name="resnet50", **fields):
+    data = {"name": name, "model_type": "cnn",
+            "model": {"name": "ResNet-50", "parameters": 25.6e6},
+            "hardware": {"device": "A100", "count": 1}}
+    data.update(fields)
+    return WorkloadSpec.from_dict(data)
+
+
+def test_fingerprint_ignores_name_and_key_order():
+    a = _resnet()
+    b = _resnet("renamed", hardware={"count": 1, "device": "A100"})
+    assert a.fingerprint() == b.fingerprint()
+    assert '"name":"ResNet-50"' in a.canonical() and "resnet50" not in a.canonical()
+
+
+@pytest.mark.parametrize("params", [25.6e6, "25.6e6", 25600000, 25600000.0, " 2.56E7"])
+def test_fingerprint_normalizes_numbers(params):
+    spec = _resnet(model={"name": "ResNet-50", "parameters": params})
+    assert spec.fingerprint() == _resnet().fingerprint()
+
+
+def test_fingerprint_distinguishes_content():
+    assert _resnet(batch_size=2).fingerprint() != _resnet().fingerprint()
+    assert _resnet(batch_size=True).fingerprint() != _resnet().fingerprint()
+    assert _resnet(model={"name": "ResNet-50", "parameters": "25.6M"}).fingerprint() \
+        != _resnet().fingerprint()
+
+
+def test_frozen_specs_are_interned_and_immutable():
+    frozen = _resnet().freeze()
+    assert _resnet("other", batch_size=1.0).freeze() is frozen
+    assert frozen.model["parameters"] == 25600000
+    assert frozen.dataset == {}
+    with pytest.raises(AttributeError):
+        frozen.batch_size = 4
+    with pytest.raises(TypeError):
+        frozen.model["name"] = "x"
+    assert pickle.loads(pickle.dumps(frozen)) is frozen
+    thawed = frozen.thaw("back")
+    assert thawed.name == "back"
+    assert thawed.fingerprint() == frozen.fingerprint
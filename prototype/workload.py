@@ -19,12 +19,177 @@ Example YAML:
     dataset:
       name: ImageNet
       input_shape: [3, 224, 224]
+
+Template specs declare ``axes`` (dotted field path -> values) and optional
+named ``filters``; ``expand()`` lazily yields one concrete spec per point of
+the cartesian product. ``{path}`` placeholders in the name are filled in:
+
+    name: llama2-7b-{hardware.device}-x{hardware.count}-b{batch_size}
+    model_type: llm
+    ...
+    axes:
+      batch_size: {start: 1, stop: 256, factor: 2}   # 1, 2, 4, ..., 256
+      hardware.device: [A100, H100]
+      hardware.count: {start: 1, stop: 8}            # 1..8 inclusive
+    filters: [fits_in_memory]
 """
-import yaml
+import itertools
+import json
+import re
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from prototype import profiling
+
+# Numeric literals that YAML leaves as strings, e.g. "25.6e6"
+_NUMERIC_RE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+
+
+def _normalize(value):
+    """Canonical form of a spec value for hashing.
+
+    Integral floats become ints and numeric strings become numbers, so that
+    ``25.6e6``, ``"25.6e6"``, ``25600000.0`` and ``25600000`` all normalize to
+    the same value. Tuples become lists and mapping keys become strings.
+    """
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, str):
+        if _NUMERIC_RE.match(value.strip()):
+            return _normalize(float(value))
+        return value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 2 ** 53:
+            return int(value)
+        return value
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return str(value)
+
+
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
+
+def axis_values(decl) -> list:
+    """Expand an axis declaration into its list of values.
+
+    A declaration is a list of values, or a mapping with ``start`` and
+    inclusive ``stop`` plus either ``step`` (default 1) or ``factor`` for a
+    geometric range.
+    """
+    if isinstance(decl, dict):
+        start, stop = decl["start"], decl["stop"]
+        if "factor" in decl:
+            factor = decl["factor"]
+            if start <= 0 or factor <= 1:
+                raise ValueError(f"Invalid geometric axis {decl}")
+            values = []
+            v = start
+            while v <= stop:
+                values.append(v)
+                v *= factor
+            return values
+        return list(range(start, stop + 1, decl.get("step", 1)))
+    if isinstance(decl, (list, tuple)):
+        return list(decl)
+    return [decl]
+
+
+def get_field(data: dict, path: str, default=None):
+    """Read a dotted field path (e.g. ``hardware.device``) from a spec dict."""
+    for key in path.split("."):
+        if not isinstance(data, dict) or key not in data:
+            return default
+        data = data[key]
+    return data
+
+
+def set_field(data: dict, path: str, value):
+    """Set a dotted field path in a spec dict, creating intermediate mappings."""
+    keys = path.split(".")
+    for key in keys[:-1]:
+        data = data.setdefault(key, {})
+    data[keys[-1]] = value
+
+
+def _copy_tree(value):
+    """Deep copy of plain dict/list data (much cheaper than copy.deepcopy)."""
+    if isinstance(value, dict):
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(v) for v in value]
+    return value
+
+
+def fits_in_memory(spec) -> bool:
+    """Filter: weights at the spec's precision fit in the aggregate memory of its devices.
+
+    Specs whose device, parameter count or precision is unknown are kept.
+    """
+    from prototype import hardware
+
+    gpu = hardware.lookup(spec.hardware.get("device", ""))
+    params = _normalize(spec.model.get("parameters"))
+    if gpu is None or not isinstance(params, (int, float)):
+        return True
+    try:
+        width = hardware.bytes_per_value(hardware.spec_precision(spec))
+    except ValueError:
+        return True
+    return params * width <= gpu.mem_gb * 1e9 * spec.hardware.get("count", 1)
+
+
+# Named filters usable in a template's ``filters`` list
+FILTERS = {
+    "fits_in_memory": fits_in_memory,
+}
+
+
+def named_filter(name: str):
+    """The FILTERS entry called ``name``; raises ValueError listing the valid names."""
+    try:
+        return FILTERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown filter '{name}'. Available: {', '.join(FILTERS)}") from None
+
+
+def yaml_loader():
+    """PyYAML's libyaml-backed CSafeLoader when available, else the pure-Python SafeLoader."""
+    import yaml  # deferred: keeps CLI start-up cheap for commands that never parse YAML
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _digest(canonical: str) -> str:
+    import hashlib
+
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _freeze(value):
+    """Deep read-only view of a normalized value."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
 
 @dataclass
 class WorkloadSpec:
@@ -38,22 +203,29 @@ class WorkloadSpec:
     hardware: dict = field(default_factory=dict)
     dataset: dict = field(default_factory=dict)
     extra: dict = field(default_factory=dict)
+    axes: dict = field(default_factory=dict)  # template axes: field path -> values
+    filters: list = field(default_factory=list)  # template filter names (see FILTERS)
 
     @classmethod
     def from_yaml(cls, path: str) -> "WorkloadSpec":
-        """Load a workload spec from a YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        return cls(
-            name=data["name"],
-            model_type=data["model_type"],
-            model=data.get("model", {}),
-            task=data.get("task", "inference"),
-            batch_size=data.get("batch_size", 1),
-            hardware=data.get("hardware", {}),
-            dataset=data.get("dataset", {}),
-            extra=data.get("extra", {}),
-        )
+        """Load a workload spec from a single-document YAML file."""
+        import yaml
+
+        with profiling.span("workload.yaml_parse", path=path), open(path) as f:
+            data = yaml.load(f, Loader=yaml_loader())
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_yaml_all(cls, path: str) -> list:
+        """Load every spec from a (possibly multi-document) YAML catalog file.
+
+        Documents are separated by ``---``; empty documents are skipped.
+        """
+        import yaml
+
+        with profiling.span("workload.yaml_parse", path=path), open(path) as f:
+            return [cls.from_dict(data) for data in yaml.load_all(f, Loader=yaml_loader())
+                    if data]
 
     @classmethod
     def from_dict(cls, data: dict) -> "WorkloadSpec":
@@ -67,11 +239,70 @@ class WorkloadSpec:
             hardware=data.get("hardware", {}),
             dataset=data.get("dataset", {}),
             extra=data.get("extra", {}),
+            axes=data.get("axes", {}),
+            filters=data.get("filters", []),
         )
 
+    def is_template(self) -> bool:
+        """True if the spec declares axes and must be expanded before running."""
+        return bool(self.axes)
+
+    def expand(self, filters=None, with_points: bool = False):
+        """Lazily yield the concrete specs of a template.
+
+        Yields one spec per point of the cartesian product of ``axes`` that
+        passes every named filter in ``self.filters`` plus any extra callables
+        in ``filters``. A spec without axes yields itself. With
+        ``with_points=True`` yields (spec, point) where point is the tuple of
+        axis values in ``axes`` order. Unknown filter names raise ValueError
+        here rather than on first iteration.
+        """
+        checks = [named_filter(name) for name in self.filters] + list(filters or [])
+        return self._expand(checks, with_points)
+
+    def _expand(self, checks: list, with_points: bool):
+        if not self.axes:
+            if all(check(self) for check in checks):
+                yield (self, ()) if with_points else self
+            return
+
+        base = self.to_dict()
+        del base["axes"]
+        base.pop("filters", None)
+        paths = list(self.axes)
+        templated = bool(_PLACEHOLDER_RE.search(self.name))
+        for point in itertools.product(*(axis_values(self.axes[p]) for p in paths)):
+            data = _copy_tree(base)
+            for path, value in zip(paths, point):
+                set_field(data, path, value)
+            if templated:
+                data["name"] = _PLACEHOLDER_RE.sub(
+                    lambda m: str(get_field(data, m.group(1), m.group(0))), self.name
+                )
+            else:
+                label = ",".join(f"{p}={v}" for p, v in zip(paths, point))
+                data["name"] = f"{self.name}[{label}]"
+            spec = WorkloadSpec.from_dict(data)
+            if all(check(spec) for check in checks):
+                yield (spec, point) if with_points else spec
+
+    def canonical(self) -> str:
+        """Canonical JSON of everything except ``name``: sorted keys, normalized numerics."""
+        data = _normalize(self.to_dict())
+        del data["name"]
+        return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+    def fingerprint(self) -> str:
+        """Stable SHA-256 of canonical(). Specs that differ only by name share it."""
+        return _digest(self.canonical())
+
+    def freeze(self) -> "FrozenWorkloadSpec":
+        """Immutable, interned, hashable form of this spec (without its name)."""
+        return FrozenWorkloadSpec.from_spec(self)
+
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
-        return {
+        data = {
             "name": self.name,
             "model_type": self.model_type,
             "model": self.model,
@@ -81,3 +312,70 @@ class WorkloadSpec:
             "dataset": self.dataset,
             "extra": self.extra,
         }
+        if self.axes:
+            data["axes"] = self.axes
+        if self.filters:
+            data["filters"] = self.filters
+        return data
+
+
+class FrozenWorkloadSpec:
+    """Immutable, hashable workload spec keyed by its fingerprint.
+
+    Frozen specs are interned: freezing two specs with the same canonical form
+    (for example, the same workload under different names) returns the same
+    object while either is alive, so they can be used directly as dict keys or
+    set members to deduplicate work. Nested fields are read-only mappings and
+    tuples. ``thaw(name)`` turns it back into a mutable WorkloadSpec.
+    """
+
+    __slots__ = ("fingerprint", "_data", "__weakref__")
+
+    _interned = weakref.WeakValueDictionary()
+
+    def __init__(self, fingerprint: str, data):
+        object.__setattr__(self, "fingerprint", fingerprint)
+        object.__setattr__(self, "_data", data)
+
+    @classmethod
+    def from_spec(cls, spec: WorkloadSpec) -> "FrozenWorkloadSpec":
+        """Return the interned frozen form of ``spec``."""
+        canonical = spec.canonical()
+        fingerprint = _digest(canonical)
+        frozen = cls._interned.get(fingerprint)
+        if frozen is None:
+            frozen = cls(fingerprint, _freeze(json.loads(canonical)))
+            frozen = cls._interned.setdefault(fingerprint, frozen)
+        return frozen
+
+    def __getattr__(self, attr):
+        try:
+            return self._data[attr]
+        except KeyError:
+            raise AttributeError(attr) from None
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("FrozenWorkloadSpec is immutable")
+
+    def __reduce__(self):
+        return (_unfreeze_pickled, (_thaw(self._data),))
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenWorkloadSpec):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __repr__(self):
+        return f"FrozenWorkloadSpec({self.fingerprint[:12]}, {self._data['model_type']})"
+
+    def thaw(self, name: str) -> WorkloadSpec:
+        """Mutable WorkloadSpec with this content and the given name."""
+        return WorkloadSpec.from_dict(dict(_thaw(self._data), name=name))
+
+
+def _unfreeze_pickled(data: dict) -> FrozenWorkloadSpec:
+    """Re-intern a FrozenWorkloadSpec on unpickling."""
+    return WorkloadSpec.from_dict(dict(data, name="")).freeze()